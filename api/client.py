@@ -5,15 +5,27 @@ Per-service client with rate limiting and secret isolation.
 API keys are never exposed to the LLM.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
 import logging
 import os
+import time
 
 import httpx
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+from .rate_limiter import RateLimiter, RateLimitConfig
+
 
 class APIStatus(Enum):
     """Status of an API response."""
@@ -36,9 +48,17 @@ class APIConfig:
     max_retries: int = 3
     rate_limit_requests: int = 100  # Max requests per minute
     headers: Dict[str, str] = field(default_factory=dict)
+    cache_ttl_seconds: float = 0.0  # GET response cache lifetime (0 = revalidate only)
+    cache_max_entries: int = 256
+    # Request coalescing (see APIClient.queue); disabled without an endpoint
+    batch_endpoint: Optional[str] = None
+    batch_interval_ms: float = 10.0
+    max_batch_size: int = 20
+    batch_request_key: str = "requests"  # Body key holding the item list
+    batch_response_key: str = "responses"  # Response key holding the results
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class APIResponse:
     """Response from an API call."""
     status: APIStatus
@@ -46,12 +66,18 @@ class APIResponse:
     error: Optional[str] = None
     status_code: int = 0
     response_time_ms: float = 0.0
+    etag: Optional[str] = None
     
     @property
     def success(self) -> bool:
         return self.status == APIStatus.SUCCESS
 
 
+# Shared immutable responses for argument-free error paths
+_TIMEOUT_RESPONSE = APIResponse(status=APIStatus.TIMEOUT, error="Request timed out")
+_LOCAL_RATE_LIMITED = APIResponse(status=APIStatus.RATE_LIMITED, error="Local rate limit exceeded")
+
+
 class APIClient:
     """
     Base API client with rate limiting and error handling.
@@ -60,17 +86,83 @@ class APIClient:
     - API keys loaded from environment only
     - LLM never sees raw secrets
     - All requests rate-limited
+    - One pooled HTTP connection set per client (keep-alive reuse)
     """
     
+    # Connection pool limits for the shared AsyncClient
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    
     def __init__(self, config: APIConfig):
         self.config = config
         self._logger = logging.getLogger(f"jarvis.api.{config.name}")
-        self._rate_limiter = None  # Will be set up on first use
+        self._rate_limiter = RateLimiter(RateLimitConfig(
+            requests_per_minute=config.rate_limit_requests
+        ))
         
         # Load API key from environment
         self._api_key = os.getenv(config.api_key_env)
         if not self._api_key:
             self._logger.warning(f"API key not found: {config.api_key_env}")
+        
+        # Returned as-is for every request while unconfigured
+        self._not_configured = APIResponse(
+            status=APIStatus.AUTH_ERROR,
+            error=f"API key not configured: {config.api_key_env}"
+        )
+        
+        # Headers never change for the lifetime of the client
+        self._headers = self._get_headers()
+        
+        # Long-lived HTTP client, created lazily on first request
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        
+        # GET cache: key -> (expires_at monotonic, response, etag), LRU ordered
+        self._cache: "OrderedDict[str, Tuple[float, APIResponse, Optional[str]]]" = OrderedDict()
+        
+        # Request coalescer: queued (payload, future) pairs awaiting a flush
+        self._pending: List[Tuple[Dict, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set = set()
+    
+    async def __aenter__(self) -> "APIClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        # Send anything still queued and let in-flight batches finish
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            await self._send_batch(batch)
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.config.base_url.rstrip('/') + '/',
+                        timeout=self.config.timeout_seconds,
+                        headers=self._headers,
+                        limits=httpx.Limits(
+                            max_connections=self.MAX_CONNECTIONS,
+                            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                        ),
+                    )
+        return self._client
     
     @property
     def is_configured(self) -> bool:
@@ -90,92 +182,243 @@ class APIClient:
         
         return headers
     
-    async def get(self, endpoint: str, params: Optional[Dict] = None) -> APIResponse:
-        """Make a GET request."""
-        return await self._request("GET", endpoint, params=params)
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        cache_ttl: Optional[float] = None
+    ) -> APIResponse:
+        """
+        Make a GET request.
+        
+        Successful responses are cached for `cache_ttl` seconds (defaults to
+        config.cache_ttl_seconds). Stale entries carrying an ETag are
+        revalidated with If-None-Match so an unchanged resource costs a 304.
+        """
+        ttl = self.config.cache_ttl_seconds if cache_ttl is None else cache_ttl
+        key = self._cache_key(endpoint, params)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        
+        headers = None
+        if entry is not None:
+            expires_at, cached, etag = entry
+            if now < expires_at:
+                self._cache.move_to_end(key)
+                return cached
+            if etag:
+                headers = {"If-None-Match": etag}
+        
+        response = await self._request("GET", endpoint, params=params, headers=headers)
+        
+        if response.status_code == 304 and entry is not None:
+            cached = entry[1]
+            self._store(key, cached, entry[2], ttl)
+            return cached
+        
+        if response.success and (ttl > 0 or response.etag):
+            self._store(key, response, response.etag, ttl)
+        elif entry is not None:
+            self._cache.pop(key, None)
+        
+        return response
     
     async def post(self, endpoint: str, data: Optional[Dict] = None) -> APIResponse:
         """Make a POST request."""
         return await self._request("POST", endpoint, json=data)
     
+    async def queue(self, data: Dict) -> APIResponse:
+        """
+        POST one item through the request coalescer.
+        
+        Items queued within config.batch_interval_ms (or until
+        config.max_batch_size is reached) are sent as a single POST to
+        config.batch_endpoint as {batch_request_key: [item, ...]}. The
+        response list under batch_response_key is split back so each
+        caller gets the APIResponse for its own item.
+        """
+        if not self.config.batch_endpoint:
+            raise ValueError(f"No batch endpoint configured for API client: {self.config.name}")
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((data, future))
+        
+        if len(self._pending) >= self.config.max_batch_size:
+            self._flush_batch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.config.batch_interval_ms / 1000.0, self._flush_batch
+            )
+        
+        return await future
+    
+    def _flush_batch(self) -> None:
+        """Hand the pending batch to a send task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _send_batch(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """Send one coalesced POST and resolve each item's future."""
+        try:
+            response = await self.post(
+                self.config.batch_endpoint,
+                {self.config.batch_request_key: [item for item, _ in batch]}
+            )
+            results = self._split_batch(response, len(batch))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    def _split_batch(self, response: APIResponse, size: int) -> List[APIResponse]:
+        """Split a batch response into per-item responses."""
+        if not response.success:
+            return [response] * size
+        
+        data = response.data
+        items = data.get(self.config.batch_response_key) if isinstance(data, dict) else None
+        if not isinstance(items, list) or len(items) != size:
+            error = APIResponse(
+                status=APIStatus.SERVER_ERROR,
+                error=f"Batch response did not contain {size} results",
+                status_code=response.status_code,
+                response_time_ms=response.response_time_ms
+            )
+            return [error] * size
+        
+        return [
+            APIResponse(
+                status=APIStatus.SUCCESS,
+                data=item,
+                status_code=response.status_code,
+                response_time_ms=response.response_time_ms
+            )
+            for item in items
+        ]
+    
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        self._cache.clear()
+    
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict]) -> str:
+        """Stable cache key for an endpoint + query parameters."""
+        items = sorted(params.items()) if params else []
+        raw = f"{endpoint.lstrip('/')}|{items}".encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    def _store(
+        self,
+        key: str,
+        response: APIResponse,
+        etag: Optional[str],
+        ttl: float
+    ) -> None:
+        """Insert or refresh a cache entry, evicting least recently used."""
+        self._cache[key] = (time.monotonic() + ttl, response, etag)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.config.cache_max_entries:
+            self._cache.popitem(last=False)
+    
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        json: Optional[Dict] = None
+        json: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
     ) -> APIResponse:
         """Make an HTTP request with error handling."""
         if not self.is_configured:
-            return APIResponse(
-                status=APIStatus.AUTH_ERROR,
-                error=f"API key not configured: {self.config.api_key_env}"
-            )
+            return self._not_configured
+        
+        if not await self._rate_limiter.acquire_async(self.config.timeout_seconds):
+            return _LOCAL_RATE_LIMITED
         
-        url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
-            async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    headers=self._get_headers()
+            client = await self._get_client()
+            response = await client.request(
+                method=method,
+                url=endpoint.lstrip('/'),
+                params=params,
+                json=json,
+                headers=headers,
+            )
+            
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
+            
+            # Handle different status codes
+            if response.status_code == 200:
+                # Decode the already-read body once (orjson when available)
+                body = response.content
+                return APIResponse(
+                    status=APIStatus.SUCCESS,
+                    data=_json_loads(body) if body else None,
+                    status_code=response.status_code,
+                    response_time_ms=response_time,
+                    etag=response.headers.get("ETag")
+                )
+            elif response.status_code == 304:
+                return APIResponse(
+                    status=APIStatus.SUCCESS,
+                    status_code=response.status_code,
+                    response_time_ms=response_time
+                )
+            elif response.status_code == 429:
+                return APIResponse(
+                    status=APIStatus.RATE_LIMITED,
+                    error="Rate limit exceeded",
+                    status_code=response.status_code,
+                    response_time_ms=response_time
+                )
+            elif response.status_code in (401, 403):
+                return APIResponse(
+                    status=APIStatus.AUTH_ERROR,
+                    error="Authentication failed",
+                    status_code=response.status_code,
+                    response_time_ms=response_time
+                )
+            elif response.status_code == 404:
+                return APIResponse(
+                    status=APIStatus.NOT_FOUND,
+                    error="Resource not found",
+                    status_code=response.status_code,
+                    response_time_ms=response_time
+                )
+            elif response.status_code >= 500:
+                return APIResponse(
+                    status=APIStatus.SERVER_ERROR,
+                    error=f"Server error: {response.status_code}",
+                    status_code=response.status_code,
+                    response_time_ms=response_time
+                )
+            else:
+                return APIResponse(
+                    status=APIStatus.SERVER_ERROR,
+                    error=f"Unexpected status: {response.status_code}",
+                    status_code=response.status_code,
+                    response_time_ms=response_time
                 )
                 
-                response_time = (datetime.now() - start_time).total_seconds() * 1000
-                
-                # Handle different status codes
-                if response.status_code == 200:
-                    return APIResponse(
-                        status=APIStatus.SUCCESS,
-                        data=response.json() if response.content else None,
-                        status_code=response.status_code,
-                        response_time_ms=response_time
-                    )
-                elif response.status_code == 429:
-                    return APIResponse(
-                        status=APIStatus.RATE_LIMITED,
-                        error="Rate limit exceeded",
-                        status_code=response.status_code,
-                        response_time_ms=response_time
-                    )
-                elif response.status_code in (401, 403):
-                    return APIResponse(
-                        status=APIStatus.AUTH_ERROR,
-                        error="Authentication failed",
-                        status_code=response.status_code,
-                        response_time_ms=response_time
-                    )
-                elif response.status_code == 404:
-                    return APIResponse(
-                        status=APIStatus.NOT_FOUND,
-                        error="Resource not found",
-                        status_code=response.status_code,
-                        response_time_ms=response_time
-                    )
-                elif response.status_code >= 500:
-                    return APIResponse(
-                        status=APIStatus.SERVER_ERROR,
-                        error=f"Server error: {response.status_code}",
-                        status_code=response.status_code,
-                        response_time_ms=response_time
-                    )
-                else:
-                    return APIResponse(
-                        status=APIStatus.SERVER_ERROR,
-                        error=f"Unexpected status: {response.status_code}",
-                        status_code=response.status_code,
-                        response_time_ms=response_time
-                    )
-                    
         except httpx.TimeoutException:
-            return APIResponse(
-                status=APIStatus.TIMEOUT,
-                error="Request timed out"
-            )
+            return _TIMEOUT_RESPONSE
         except httpx.NetworkError as e:
             return APIResponse(
                 status=APIStatus.NETWORK_ERROR,
@@ -207,5 +450,6 @@ def create_weather_client() -> APIClient:
         name="weather",
         base_url="https://api.openweathermap.org/data/2.5",
         api_key_env="OPENWEATHER_API_KEY",
-        rate_limit_requests=60
+        rate_limit_requests=60,
+        cache_ttl_seconds=60.0
     ))
@@ -5,9 +5,9 @@ Token bucket rate limiter for API calls.
 """
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from threading import Lock
-from typing import Optional
+from typing import Optional, Tuple
+import asyncio
 import time
 
 
@@ -23,16 +23,33 @@ class RateLimiter:
     Token bucket rate limiter.
     
     Thread-safe rate limiting for API calls.
+    
+    Bucket state is one immutable (tokens, last_refill_ns) pair in integer
+    fixed point, swapped as a single reference. Readers and the "no token
+    available" path work from a snapshot without taking the lock; only a
+    successful take is serialized.
     """
     
+    # Fixed-point scale: one token == 1 << 48 units
+    _FRAC_BITS = 48
+    _ONE = 1 << _FRAC_BITS
+    
+    # Bounds on a single backoff sleep in acquire()
+    MIN_WAIT_SECONDS = 0.001
+    MAX_WAIT_SECONDS = 1.0
+    
     def __init__(self, config: Optional[RateLimitConfig] = None):
         self.config = config or RateLimitConfig()
-        self._tokens = float(self.config.burst_size)
-        self._last_update = datetime.now()
         self._lock = Lock()
         
-        # Tokens per second
-        self._rate = self.config.requests_per_minute / 60.0
+        # Capacity and refill rate (units per nanosecond), precomputed so a
+        # refill is one multiply and one min()
+        self._capacity = self.config.burst_size * self._ONE
+        self._rate_per_ns = round(
+            self.config.requests_per_minute * self._ONE / 60e9
+        )
+        
+        self._state: Tuple[int, int] = (self._capacity, time.monotonic_ns())
     
     def acquire(self, timeout: float = 30.0) -> bool:
         """
@@ -41,56 +58,84 @@ class RateLimiter:
         
         Returns True if token acquired, False if timeout.
         """
-        deadline = datetime.now() + timedelta(seconds=timeout)
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
         
-        while datetime.now() < deadline:
-            with self._lock:
-                self._refill()
-                
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return True
+        while True:
+            if self.try_acquire():
+                return True
             
-            # Wait a bit before retrying
-            time.sleep(0.1)
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                return False
+            
+            # Sleep exactly until the next token is due
+            time.sleep(min(self._seconds_until_token(), remaining_ns * 1e-9))
+    
+    async def acquire_async(self, timeout: float = 30.0) -> bool:
+        """
+        Acquire a token without blocking the event loop.
+        Same semantics as acquire(), but waits with asyncio.sleep.
         
-        return False
+        Returns True if token acquired, False if timeout.
+        """
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        
+        while True:
+            if self.try_acquire():
+                return True
+            
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                return False
+            
+            await asyncio.sleep(min(self._seconds_until_token(), remaining_ns * 1e-9))
     
     def try_acquire(self) -> bool:
         """
         Try to acquire a token without blocking.
         Returns True if token available, False otherwise.
         """
+        tokens, last_ns = self._state
+        if self._refilled(tokens, last_ns, time.monotonic_ns()) < self._ONE:
+            return False
+        
         with self._lock:
-            self._refill()
+            now_ns = time.monotonic_ns()
+            tokens, last_ns = self._state
+            tokens = self._refilled(tokens, last_ns, now_ns)
             
-            if self._tokens >= 1.0:
-                self._tokens -= 1.0
+            if tokens >= self._ONE:
+                self._state = (tokens - self._ONE, now_ns)
                 return True
             
+            self._state = (tokens, now_ns)
             return False
     
-    def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = datetime.now()
-        elapsed = (now - self._last_update).total_seconds()
-        self._last_update = now
-        
-        # Add tokens based on elapsed time
-        self._tokens = min(
-            self.config.burst_size,
-            self._tokens + (elapsed * self._rate)
-        )
+    def _seconds_until_token(self) -> float:
+        """Time until one whole token will be available (at least 1 ms)."""
+        tokens, last_ns = self._state
+        deficit = self._ONE - self._refilled(tokens, last_ns, time.monotonic_ns())
+        if deficit <= 0:
+            return self.MIN_WAIT_SECONDS
+        if self._rate_per_ns <= 0:
+            return self.MAX_WAIT_SECONDS
+        wait = (-(-deficit // self._rate_per_ns)) * 1e-9
+        return min(max(self.MIN_WAIT_SECONDS, wait), self.MAX_WAIT_SECONDS)
+    
+    def _refilled(self, tokens: int, last_ns: int, now_ns: int) -> int:
+        """Token count after refilling from last_ns to now_ns."""
+        elapsed_ns = now_ns - last_ns
+        if elapsed_ns <= 0:
+            return tokens
+        return min(self._capacity, tokens + elapsed_ns * self._rate_per_ns)
     
     @property
     def available_tokens(self) -> float:
         """Get current available tokens."""
-        with self._lock:
-            self._refill()
-            return self._tokens
+        tokens, last_ns = self._state
+        return self._refilled(tokens, last_ns, time.monotonic_ns()) / self._ONE
     
     def reset(self) -> None:
         """Reset the rate limiter."""
         with self._lock:
-            self._tokens = float(self.config.burst_size)
-            self._last_update = datetime.now()
+            self._state = (self._capacity, time.monotonic_ns())
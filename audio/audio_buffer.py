@@ -5,13 +5,13 @@ Manages audio data storage with timestamping.
 Stateless module - no imports from other JARVIS modules.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
     """Represents a timestamped audio segment."""
     
@@ -47,42 +47,76 @@ class AudioBuffer:
     """
     Circular buffer for audio frames.
     Provides timestamped segment storage and retrieval.
+    
+    Samples are written into one preallocated ring of `dtype` (int16 PCM by
+    default); once full, the oldest samples are overwritten so only the
+    last max_duration_seconds are kept.
     """
     
     sample_rate: int = 16000
     max_duration_seconds: float = 30.0
-    _frames: list = field(default_factory=list)
-    _timestamps: list = field(default_factory=list)
+    dtype: str = "int16"
     _recording_start: Optional[datetime] = None
     
     def __post_init__(self):
         self._max_samples = int(self.sample_rate * self.max_duration_seconds)
+        self._ring = np.empty(self._max_samples, dtype=self.dtype)
+        self._write = 0  # Next write position in the ring
+        self._filled = 0  # Valid samples in the ring (<= max_samples)
+        self._samples_written = 0  # Total samples since start (incl. overwritten)
     
     def start_recording(self) -> None:
         """Mark the start of a new recording session."""
         self._recording_start = datetime.now()
-        self._frames = []
-        self._timestamps = []
+        self._reset_ring()
     
     def add_frame(self, frame: np.ndarray) -> None:
-        """Add an audio frame to the buffer."""
+        """
+        Add an audio frame to the buffer.
+        
+        The frame may be a borrowed view (e.g. sounddevice's indata); it is
+        copied straight into the ring, which is the only copy made. For
+        multi-channel input only the first channel is kept.
+        """
         if self._recording_start is None:
             raise RuntimeError("Recording not started. Call start_recording() first.")
         
-        self._frames.append(frame.copy())
-        self._timestamps.append(datetime.now())
+        if frame.ndim > 1:
+            frame = frame[:, 0]
         
-        # Enforce max duration by removing oldest frames
-        self._enforce_max_duration()
-    
-    def _enforce_max_duration(self) -> None:
-        """Remove oldest frames if buffer exceeds max duration."""
-        total_samples = sum(len(f) for f in self._frames)
+        ring = self._ring
+        size = self._max_samples
+        n = len(frame)
+        
+        if n >= size:
+            # Frame alone fills the ring: keep its tail
+            np.copyto(ring, frame[n - size:])
+            self._write = 0
+        else:
+            end = self._write + n
+            if end <= size:
+                np.copyto(ring[self._write:end], frame)
+            else:
+                split = size - self._write
+                np.copyto(ring[self._write:], frame[:split])
+                np.copyto(ring[:end - size], frame[split:])
+            self._write = end % size
         
-        while total_samples > self._max_samples and len(self._frames) > 1:
-            removed = self._frames.pop(0)
-            self._timestamps.pop(0)
-            total_samples -= len(removed)
+        self._filled = min(size, self._filled + n)
+        self._samples_written += n
+    
+    def _snapshot(self) -> np.ndarray:
+        """Buffered samples in chronological order (a view when not wrapped)."""
+        if self._filled < self._max_samples:
+            return self._ring[:self._filled]
+        if self._write == 0:
+            return self._ring
+        return np.concatenate((self._ring[self._write:], self._ring[:self._write]))
+    
+    def _reset_ring(self) -> None:
+        self._write = 0
+        self._filled = 0
+        self._samples_written = 0
     
     def stop_recording(self) -> AudioSegment:
         """
@@ -92,27 +126,32 @@ class AudioBuffer:
         if self._recording_start is None:
             raise RuntimeError("No active recording to stop.")
         
-        if not self._frames:
+        if self._filled == 0:
             # Return empty segment
             segment = AudioSegment(
-                data=np.array([], dtype=np.float32),
+                data=np.array([], dtype=self.dtype),
                 sample_rate=self.sample_rate,
                 timestamp_start=self._recording_start,
                 timestamp_end=datetime.now()
             )
         else:
-            # Concatenate all frames
-            combined_data = np.concatenate(self._frames)
+            # Hand the ring contents to the segment; a view when not wrapped,
+            # so give the buffer a fresh ring rather than overwrite it later
+            combined_data = self._snapshot()
+            if np.shares_memory(combined_data, self._ring):
+                self._ring = np.empty(self._max_samples, dtype=self.dtype)
+            # End time derived from samples captured: no per-frame clock reads
             segment = AudioSegment(
                 data=combined_data,
                 sample_rate=self.sample_rate,
                 timestamp_start=self._recording_start,
-                timestamp_end=self._timestamps[-1]
+                timestamp_end=self._recording_start + timedelta(
+                    seconds=self._samples_written / self.sample_rate
+                )
             )
         
         # Clear buffer
-        self._frames = []
-        self._timestamps = []
+        self._reset_ring()
         self._recording_start = None
         
         return segment
@@ -123,12 +162,9 @@ class AudioBuffer:
     
     def get_current_duration(self) -> float:
         """Get current recording duration in seconds."""
-        if not self._frames:
-            return 0.0
-        return sum(len(f) for f in self._frames) / self.sample_rate
+        return self._filled / self.sample_rate
     
     def clear(self) -> None:
         """Clear all buffered data."""
-        self._frames = []
-        self._timestamps = []
+        self._reset_ring()
         self._recording_start = None
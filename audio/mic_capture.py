@@ -34,8 +34,9 @@ class CaptureConfig:
     """Configuration for microphone capture."""
     sample_rate: int = 16000
     channels: int = 1
-    dtype: str = "float32"
+    dtype: str = "int16"  # 16-bit PCM: half the bytes of float32
     block_size: int = 1024  # Samples per callback
+    progress_interval_seconds: float = 0.25  # FRAME_CAPTURED event cadence
 
 
 class MicrophoneCapture:
@@ -47,6 +48,10 @@ class MicrophoneCapture:
         capture.start()  # Begin recording
         # ... user speaks ...
         segment = capture.stop()  # Get AudioSegment
+    
+    FRAME_CAPTURED is emitted about every progress_interval_seconds, not per
+    callback. Its data dict is reused between events and must not be kept
+    by the listener; "samples" counts samples since the previous event.
     """
     
     def __init__(
@@ -62,10 +67,25 @@ class MicrophoneCapture:
         
         self._buffer = AudioBuffer(
             sample_rate=self.config.sample_rate,
-            max_duration_seconds=30.0
+            max_duration_seconds=30.0,
+            dtype=self.config.dtype
         )
         self._stream: Optional[sd.InputStream] = None
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # Guards start/stop only, never the callback
+        
+        # Set by start()/stop(); the only state the audio callback checks.
+        # A plain attribute write is atomic in CPython, and the PortAudio
+        # thread is the ring's single producer.
+        self._recording = False
+        
+        # Progress event coalescing
+        self._emit_every = max(1, int(
+            self.config.progress_interval_seconds
+            * self.config.sample_rate / self.config.block_size
+        ))
+        self._frames_since_emit = 0
+        self._samples_since_emit = 0
+        self._progress_event = {"samples": 0, "duration": 0.0}
     
     def _audio_callback(
         self,
@@ -78,16 +98,21 @@ class MicrophoneCapture:
         if status:
             self._emit_event(CaptureEvent.ERROR, {"status": str(status)})
         
-        # Copy data to avoid buffer reuse issues
-        audio_data = indata[:, 0].copy() if indata.ndim > 1 else indata.copy()
+        if not self._recording:
+            return
         
-        with self._lock:
-            if self._buffer.is_recording():
-                self._buffer.add_frame(audio_data)
-                self._emit_event(CaptureEvent.FRAME_CAPTURED, {
-                    "samples": len(audio_data),
-                    "duration": self._buffer.get_current_duration()
-                })
+        # indata is reused by PortAudio; add_frame copies it into the ring
+        self._buffer.add_frame(indata)
+        self._frames_since_emit += 1
+        self._samples_since_emit += frames
+        
+        if self._frames_since_emit >= self._emit_every:
+            progress = self._progress_event
+            progress["samples"] = self._samples_since_emit
+            progress["duration"] = self._buffer.get_current_duration()
+            self._frames_since_emit = 0
+            self._samples_since_emit = 0
+            self._emit_event(CaptureEvent.FRAME_CAPTURED, progress)
     
     def _emit_event(self, event: CaptureEvent, data: Optional[dict] = None) -> None:
         """Emit an event to the callback if registered."""
@@ -104,6 +129,8 @@ class MicrophoneCapture:
                 raise RuntimeError("Capture already in progress")
             
             self._buffer.start_recording()
+            self._frames_since_emit = 0
+            self._samples_since_emit = 0
             
             self._stream = sd.InputStream(
                 samplerate=self.config.sample_rate,
@@ -112,6 +139,7 @@ class MicrophoneCapture:
                 blocksize=self.config.block_size,
                 callback=self._audio_callback
             )
+            self._recording = True
             self._stream.start()
             self._emit_event(CaptureEvent.STARTED)
     
@@ -121,6 +149,8 @@ class MicrophoneCapture:
             if self._stream is None:
                 raise RuntimeError("No capture in progress")
             
+            # Drop further callbacks; stream.stop() waits for any in flight
+            self._recording = False
             self._stream.stop()
             self._stream.close()
             self._stream = None
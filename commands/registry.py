@@ -11,7 +11,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import re
-import yaml
+
+from infra.yaml_loader import load_yaml
 
 
 @dataclass
@@ -23,7 +24,7 @@ class CommandArgument:
     default: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandDefinition:
     """Definition of a command from the registry."""
     id: str
@@ -37,7 +38,7 @@ class CommandDefinition:
         return f"CommandDefinition(id={self.id}, name={self.name})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandIntent:
     """
     Result of matching user text to a command.
@@ -79,7 +80,15 @@ class CommandRegistry:
     
     def __init__(self, registry_path: Optional[str] = None):
         self._commands: Dict[str, CommandDefinition] = {}
-        self._patterns: List[tuple] = []  # (compiled_regex, command_id, pattern_str)
+        self._patterns: List[tuple] = []  # (compiled_regex, command_id, pattern_str, word_count)
+        
+        # Placeholder-free patterns, matched by dict lookup:
+        # lowered pattern -> (command_id, pattern_str, earlier same-length _patterns)
+        self._exact: Dict[str, tuple] = {}
+        
+        # All patterns combined into one alternation; group c{i} is pattern i
+        self._master: Optional[re.Pattern] = None
+        self._master_args: List[List[tuple]] = []  # per pattern: (group_name, arg_name)
         
         if registry_path:
             self.load(registry_path)
@@ -92,7 +101,7 @@ class CommandRegistry:
             raise FileNotFoundError(f"Command registry not found: {registry_path}")
         
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         
         commands = data.get('commands', [])
         
@@ -119,32 +128,74 @@ class CommandRegistry:
             
             self._commands[cmd.id] = cmd
             
-            # Compile patterns to regex
+            # Compile patterns to regex (placeholder-free ones need none)
             for pattern in cmd.patterns:
+                word_count = len(pattern.split())
+                
+                if "{" not in pattern:
+                    key = pattern.lower()
+                    if key not in self._exact:
+                        # Parameterized patterns defined earlier with the same
+                        # word count would tie at 1.0 and win on order
+                        shadowing = tuple(p for p in self._patterns if p[3] == word_count)
+                        self._exact[key] = (cmd.id, pattern, shadowing)
+                    continue
+                
                 regex = self._pattern_to_regex(pattern)
-                self._patterns.append((regex, cmd.id, pattern))
+                self._patterns.append((regex, cmd.id, pattern, word_count))
+        
+        self._build_master()
     
-    def _pattern_to_regex(self, pattern: str) -> re.Pattern:
+    def _pattern_body(self, pattern: str, group_prefix: str = "") -> str:
         """
-        Convert a pattern string to a compiled regex.
-        Patterns like "search for {query}" become "search for (?P<query>.+)"
+        Convert a pattern string to an (unanchored) regex body.
+        Placeholders become named groups, optionally prefixed so several
+        bodies can share one regex.
         """
         # Escape special regex characters except our placeholders
         escaped = re.escape(pattern)
         
         # Convert {arg_name} placeholders to named capture groups
         # The escaped version will be \{arg_name\}
-        regex_pattern = re.sub(
+        return re.sub(
             r'\\{(\w+)\\}',
-            r'(?P<\1>.+?)',
+            lambda m: f'(?P<{group_prefix}{m.group(1)}>.+?)',
             escaped
         )
-        
+    
+    def _pattern_to_regex(self, pattern: str) -> re.Pattern:
+        """
+        Convert a pattern string to a compiled regex.
+        Patterns like "search for {query}" become "search for (?P<query>.+)"
+        """
         # Make it match the full string (with optional surrounding whitespace)
-        regex_pattern = f'^\\s*{regex_pattern}\\s*$'
+        regex_pattern = f'^\\s*{self._pattern_body(pattern)}\\s*$'
         
         return re.compile(regex_pattern, re.IGNORECASE)
     
+    def _build_master(self) -> None:
+        """
+        Combine every parameterized pattern into one alternation so a match
+        is a single scan in the regex engine instead of one Python call per
+        pattern. The first alternative that matches is the earliest pattern.
+        """
+        alternatives = []
+        self._master_args = []
+        
+        for i, (regex, _, pattern, _) in enumerate(self._patterns):
+            prefix = f"c{i}_"
+            alternatives.append(
+                f'(?P<c{i}>\\s*{self._pattern_body(pattern, prefix)}\\s*)'
+            )
+            self._master_args.append([
+                (prefix + name, name) for name in regex.groupindex
+            ])
+        
+        self._master = (
+            re.compile("|".join(alternatives), re.IGNORECASE)
+            if alternatives else None
+        )
+    
     def match(self, text: str) -> CommandIntent:
         """
         Match user text to a command.
@@ -164,37 +215,54 @@ class CommandRegistry:
                 original_text=text
             )
         
+        # Exact phrase: O(1) lookup, full confidence
+        exact = self._exact.get(text)
+        if exact is not None:
+            command_id, pattern, shadowing = exact
+            for regex, shadow_id, shadow_pattern, _ in shadowing:
+                match = regex.match(text)
+                if match:
+                    args = {k: v for k, v in match.groupdict().items() if v is not None}
+                    return self._make_intent(shadow_id, shadow_pattern, args, 1.0, text)
+            return self._make_intent(command_id, pattern, {}, 1.0, text)
+        
         best_match = None
         best_confidence = 0.0
         
-        for regex, command_id, pattern in self._patterns:
-            match = regex.match(text)
+        # One scan finds the earliest matching pattern
+        master_match = self._master.fullmatch(text) if self._master else None
+        
+        if master_match:
+            text_words = len(text.split())
+            first = int(master_match.lastgroup[1:])
+            _, command_id, pattern, pattern_words = self._patterns[first]
+            args = {
+                arg: master_match.group(group)
+                for group, arg in self._master_args[first]
+                if master_match.group(group) is not None
+            }
+            best_confidence = self._confidence(pattern_words, text_words)
+            best_match = self._make_intent(command_id, pattern, args, best_confidence, text)
             
-            if match:
-                # Extract named groups as arguments
-                args = {k: v for k, v in match.groupdict().items() if v is not None}
-                
-                # Calculate confidence based on match quality
-                # Exact matches get 1.0, partial matches get lower scores
-                pattern_words = len(pattern.split())
-                text_words = len(text.split())
-                
-                # Higher confidence for closer word count match
-                word_ratio = min(pattern_words, text_words) / max(pattern_words, text_words)
-                confidence = 0.7 + (0.3 * word_ratio)
-                
-                if confidence > best_confidence:
-                    cmd = self._commands[command_id]
-                    best_match = CommandIntent(
-                        command_id=command_id,
-                        command_name=cmd.name,
-                        args=args,
-                        permission=cmd.permission,
-                        confidence=confidence,
-                        matched_pattern=pattern,
-                        original_text=text
-                    )
-                    best_confidence = confidence
+            # A later pattern can only win with a strictly higher confidence
+            if best_confidence < 1.0:
+                for regex, command_id, pattern, pattern_words in self._patterns[first + 1:]:
+                    confidence = self._confidence(pattern_words, text_words)
+                    if confidence <= best_confidence:
+                        continue
+                    
+                    match = regex.match(text)
+                    
+                    if match:
+                        # Extract named groups as arguments
+                        args = {k: v for k, v in match.groupdict().items() if v is not None}
+                        best_match = self._make_intent(
+                            command_id, pattern, args, confidence, text
+                        )
+                        best_confidence = confidence
+                        
+                        if best_confidence >= 1.0:
+                            break
         
         if best_match:
             return best_match
@@ -210,6 +278,35 @@ class CommandRegistry:
             original_text=text
         )
     
+    @staticmethod
+    def _confidence(pattern_words: int, text_words: int) -> float:
+        """
+        Calculate confidence based on match quality.
+        Exact matches get 1.0, partial matches get lower scores.
+        """
+        # Higher confidence for closer word count match
+        word_ratio = min(pattern_words, text_words) / max(pattern_words, text_words)
+        return 0.7 + (0.3 * word_ratio)
+    
+    def _make_intent(
+        self,
+        command_id: str,
+        pattern: str,
+        args: Dict[str, Any],
+        confidence: float,
+        text: str
+    ) -> CommandIntent:
+        cmd = self._commands[command_id]
+        return CommandIntent(
+            command_id=command_id,
+            command_name=cmd.name,
+            args=args,
+            permission=cmd.permission,
+            confidence=confidence,
+            matched_pattern=pattern,
+            original_text=text
+        )
+    
     def get_command(self, command_id: str) -> Optional[CommandDefinition]:
         """Get a command definition by ID."""
         return self._commands.get(command_id)
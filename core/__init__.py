@@ -4,7 +4,7 @@
 # v0.5.1: Unified orchestrator - legacy v2/v3 files DELETED
 
 from .state_machine import StateMachine, State, StateTransition
-from .orchestrator import Orchestrator, OrchestratorConfig, CommandResult
+from .orchestrator import Orchestrator, OrchestratorConfig, OrchestratorStatus, CommandResult
 from .orchestrator_unified import (
     Phase2Orchestrator, Phase2Config,
     Phase3Orchestrator, Phase3Config,
@@ -14,7 +14,7 @@ from .errors import ErrorHandler, JARVISError, ErrorCategory, RetryPolicy
 
 __all__ = [
     "StateMachine", "State", "StateTransition",
-    "Orchestrator", "OrchestratorConfig", "CommandResult",
+    "Orchestrator", "OrchestratorConfig", "OrchestratorStatus", "CommandResult",
     "Phase2Orchestrator", "Phase2Config",
     "Phase3Orchestrator", "Phase3Config",
     "Phase4Orchestrator", "Phase4Config",
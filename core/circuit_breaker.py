@@ -9,6 +9,7 @@ Design:
 - Scoped per tool name (one breaker per tool)
 - State machine: CLOSED → OPEN → HALF_OPEN → CLOSED
 - Thread-safe state transitions
+- Lock-free reads and CLOSED-state success path
 - Configurable thresholds
 
 State Transitions:
@@ -19,19 +20,26 @@ State Transitions:
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from enum import Enum, auto
-from typing import Any, Callable, Dict, Optional, TypeVar
+from enum import IntEnum
+from typing import Any, Callable, ClassVar, Dict, Optional, TypeVar
 import logging
 import threading
+import time
+
+try:
+    # C-level reentrant lock, about 2x cheaper than threading.Lock uncontended
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    _Lock = threading.Lock
 
 T = TypeVar('T')
 
 
-class CircuitState(Enum):
-    """Circuit breaker states."""
-    CLOSED = auto()      # Normal operation
-    OPEN = auto()        # Failing, reject calls
-    HALF_OPEN = auto()   # Testing recovery
+class CircuitState(IntEnum):
+    """Circuit breaker states (int-valued, so comparisons are plain int compares)."""
+    CLOSED = 0      # Normal operation
+    OPEN = 1        # Failing, reject calls
+    HALF_OPEN = 2   # Testing recovery
 
 
 class CircuitOpenError(Exception):
@@ -40,13 +48,17 @@ class CircuitOpenError(Exception):
     def __init__(self, breaker_name: str, remaining_seconds: float):
         self.breaker_name = breaker_name
         self.remaining_seconds = remaining_seconds
-        super().__init__(
-            f"Circuit '{breaker_name}' is OPEN. "
-            f"Retry in {remaining_seconds:.1f}s"
+        # Raw args only; the message is formatted by __str__ when needed
+        super().__init__(breaker_name, remaining_seconds)
+    
+    def __str__(self) -> str:
+        return (
+            f"Circuit '{self.breaker_name}' is OPEN. "
+            f"Retry in {self.remaining_seconds:.1f}s"
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """
     Circuit breaker for tool execution.
@@ -58,6 +70,11 @@ class CircuitBreaker:
     2. Opening circuit after threshold
     3. Rejecting calls while open
     4. Testing recovery with half-open state
+    
+    Concurrency: `_state` and `_failure_count` are single attribute
+    references, so reads and the CLOSED success reset (a plain store) are
+    atomic under the GIL and take no lock. The lock only guards
+    read-modify-write updates: failure counting and state transitions.
     """
     name: str  # Tool name - one breaker per tool
     failure_threshold: int = 5
@@ -68,21 +85,41 @@ class CircuitBreaker:
     _state: CircuitState = field(default=CircuitState.CLOSED, repr=False)
     _failure_count: int = field(default=0, repr=False)
     _success_count: int = field(default=0, repr=False)
-    _last_failure_time: Optional[datetime] = field(default=None, repr=False)
-    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _last_failure_ns: Optional[int] = field(default=None, repr=False)  # time.monotonic_ns(), stamped on OPEN
+    _lock: threading.Lock = field(default_factory=_Lock, repr=False)
+    # Called as (name, is_open) on every transition into or out of OPEN
+    _on_state_change: Optional[Callable[[str, bool], None]] = field(default=None, repr=False)
     
-    def __post_init__(self):
-        self._logger = logging.getLogger(f"jarvis.circuit.{self.name}")
+    # Shared by all breakers; the breaker name goes in the record's "breaker" extra
+    _logger: ClassVar[logging.Logger] = logging.getLogger("jarvis.circuit")
+    
+    def _notify(self, is_open: bool) -> None:
+        """Report an OPEN transition to the owning registry, if any."""
+        if self._on_state_change is not None:
+            self._on_state_change(self.name, is_open)
+    
+    def _log(self, level: int, msg: str, *args: Any) -> None:
+        """Log a transition; formatting only happens if a handler will emit it."""
+        if self._logger.isEnabledFor(level):
+            self._logger.log(
+                level, "Circuit %s: " + msg, self.name, *args,
+                extra={"breaker": self.name}
+            )
     
     @property
     def state(self) -> CircuitState:
         """Get current state, checking for timeout transitions."""
+        state = self._state
+        if state is not CircuitState.OPEN:
+            return state
+        
         with self._lock:
-            if self._state == CircuitState.OPEN:
+            if self._state is CircuitState.OPEN:
                 if self._should_attempt_recovery():
                     self._state = CircuitState.HALF_OPEN
                     self._success_count = 0
-                    self._logger.info(f"Circuit {self.name}: OPEN → HALF_OPEN")
+                    self._notify(False)
+                    self._log(logging.INFO, "OPEN → HALF_OPEN")
             return self._state
     
     @property
@@ -95,16 +132,16 @@ class CircuitBreaker:
     
     def _should_attempt_recovery(self) -> bool:
         """Check if recovery timeout has elapsed."""
-        if self._last_failure_time is None:
+        if self._last_failure_ns is None:
             return True
-        elapsed = (datetime.now(timezone.utc) - self._last_failure_time).total_seconds()
-        return elapsed >= self.recovery_timeout
+        elapsed_ns = time.monotonic_ns() - self._last_failure_ns
+        return elapsed_ns >= self.recovery_timeout * 1e9
     
     def _get_remaining_timeout(self) -> float:
         """Get seconds remaining before recovery attempt."""
-        if self._last_failure_time is None:
+        if self._last_failure_ns is None:
             return 0.0
-        elapsed = (datetime.now(timezone.utc) - self._last_failure_time).total_seconds()
+        elapsed = (time.monotonic_ns() - self._last_failure_ns) / 1e9
         return max(0.0, self.recovery_timeout - elapsed)
     
     def call(self, func: Callable[..., T], *args, **kwargs) -> T:
@@ -113,23 +150,37 @@ class CircuitBreaker:
         
         Raises CircuitOpenError if circuit is open.
         """
-        # Check state
-        current_state = self.state
+        # Fast path: CLOSED is one lock-free read, and success is one store
+        if self._state is CircuitState.CLOSED:
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                self.record_failure()
+                raise
+            if self._failure_count and self._state is CircuitState.CLOSED:
+                self._failure_count = 0
+            return result
         
-        if current_state == CircuitState.OPEN:
+        # Slow path: OPEN / HALF_OPEN go through the locked transitions
+        if self.state == CircuitState.OPEN:
             raise CircuitOpenError(self.name, self._get_remaining_timeout())
         
-        # Execute
         try:
             result = func(*args, **kwargs)
-            self.record_success()
-            return result
-        except Exception as e:
+        except Exception:
             self.record_failure()
             raise
+        self.record_success()
+        return result
     
     def record_success(self) -> None:
         """Record a successful call."""
+        if self._state is CircuitState.CLOSED:
+            # Fast path: reset failure count with a single store, no lock
+            if self._failure_count:
+                self._failure_count = 0
+            return
+        
         with self._lock:
             if self._state == CircuitState.HALF_OPEN:
                 self._success_count += 1
@@ -137,47 +188,67 @@ class CircuitBreaker:
                     self._state = CircuitState.CLOSED
                     self._failure_count = 0
                     self._success_count = 0
-                    self._logger.info(f"Circuit {self.name}: HALF_OPEN → CLOSED (recovered)")
+                    self._log(logging.INFO, "HALF_OPEN → CLOSED (recovered)")
             elif self._state == CircuitState.CLOSED:
                 # Reset failure count on success
                 self._failure_count = 0
     
     def record_failure(self) -> None:
-        """Record a failed call."""
+        """
+        Record a failed call.
+        
+        The failure time is only read when it matters: when the circuit
+        opens, or a failure arrives while it is open (restarting the
+        recovery timeout). Failures below the threshold skip the clock.
+        """
         with self._lock:
             self._failure_count += 1
-            self._last_failure_time = datetime.now(timezone.utc)
             
             if self._state == CircuitState.HALF_OPEN:
                 # Any failure in half-open returns to open
+                self._last_failure_ns = time.monotonic_ns()
                 self._state = CircuitState.OPEN
-                self._logger.warning(f"Circuit {self.name}: HALF_OPEN → OPEN (failure during test)")
+                self._notify(True)
+                self._log(logging.WARNING, "HALF_OPEN → OPEN (failure during test)")
             elif self._state == CircuitState.CLOSED:
                 if self._failure_count >= self.failure_threshold:
+                    self._last_failure_ns = time.monotonic_ns()
                     self._state = CircuitState.OPEN
-                    self._logger.warning(
-                        f"Circuit {self.name}: CLOSED → OPEN "
-                        f"(failures={self._failure_count})"
+                    self._notify(True)
+                    self._log(
+                        logging.WARNING, "CLOSED → OPEN (failures=%d)", self._failure_count
                     )
+            else:
+                self._last_failure_ns = time.monotonic_ns()
     
     def reset(self) -> None:
         """Force reset to closed state."""
         with self._lock:
+            if self._state is CircuitState.OPEN:
+                self._notify(False)
             self._state = CircuitState.CLOSED
             self._failure_count = 0
             self._success_count = 0
-            self._last_failure_time = None
-            self._logger.info(f"Circuit {self.name}: RESET → CLOSED")
+            self._last_failure_ns = None
+            self._log(logging.INFO, "RESET → CLOSED")
+    
+    def _last_failure_wall_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last failure, derived from the monotonic stamp."""
+        if self._last_failure_ns is None:
+            return None
+        age = timedelta(microseconds=(time.monotonic_ns() - self._last_failure_ns) / 1e3)
+        return datetime.now(timezone.utc) - age
     
     def get_stats(self) -> Dict[str, Any]:
         """Get circuit breaker statistics."""
         with self._lock:
+            last_failure = self._last_failure_wall_time()
             return {
                 "name": self.name,
                 "state": self._state.name,
                 "failure_count": self._failure_count,
                 "success_count": self._success_count,
-                "last_failure": self._last_failure_time.isoformat() if self._last_failure_time else None,
+                "last_failure": last_failure.isoformat() if last_failure else None,
             }
 
 
@@ -186,6 +257,12 @@ class CircuitBreakerRegistry:
     Registry of circuit breakers.
     
     One breaker per tool name, created on demand.
+    
+    Lookups of existing breakers never lock; the registry lock is only
+    taken to create a breaker, so unrelated tools do not contend.
+    
+    Breakers report OPEN transitions back to the registry, so
+    get_open_circuits() only has to look at breakers that are open.
     """
     
     def __init__(
@@ -195,7 +272,10 @@ class CircuitBreakerRegistry:
         default_success_threshold: int = 2
     ):
         self._breakers: Dict[str, CircuitBreaker] = {}
-        self._lock = threading.Lock()
+        # Names of OPEN breakers, used as an ordered set. Single-key
+        # inserts and pops are atomic under the GIL.
+        self._open: Dict[str, None] = {}
+        self._lock = _Lock()
         self._default_failure_threshold = default_failure_threshold
         self._default_recovery_timeout = default_recovery_timeout
         self._default_success_threshold = default_success_threshold
@@ -203,34 +283,53 @@ class CircuitBreakerRegistry:
     
     def get(self, tool_name: str) -> CircuitBreaker:
         """Get or create circuit breaker for tool."""
+        # Fast path: existing breaker, plain dict lookup without locking
+        breaker = self._breakers.get(tool_name)
+        if breaker is not None:
+            return breaker
+        
+        # Slow path: only creation is serialized
         with self._lock:
-            if tool_name not in self._breakers:
-                self._breakers[tool_name] = CircuitBreaker(
+            breaker = self._breakers.get(tool_name)
+            if breaker is None:
+                breaker = CircuitBreaker(
                     name=tool_name,
                     failure_threshold=self._default_failure_threshold,
                     recovery_timeout=self._default_recovery_timeout,
                     success_threshold=self._default_success_threshold,
+                    _on_state_change=self._on_state_change,
                 )
-                self._logger.debug(f"Created circuit breaker for {tool_name}")
-            return self._breakers[tool_name]
+                self._breakers[tool_name] = breaker
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug("Created circuit breaker for %s", tool_name)
+            return breaker
+    
+    def _on_state_change(self, name: str, is_open: bool) -> None:
+        """Track breakers entering or leaving OPEN."""
+        if is_open:
+            self._open[name] = None
+        else:
+            self._open.pop(name, None)
+    
+    def _snapshot(self) -> Dict[str, CircuitBreaker]:
+        """Point-in-time copy of the breakers (atomic under the GIL)."""
+        return self._breakers.copy()
     
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get stats for all breakers."""
-        with self._lock:
-            return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+        return {name: breaker.get_stats() for name, breaker in self._snapshot().items()}
     
     def get_open_circuits(self) -> list[str]:
         """Get list of open circuit breaker names."""
-        with self._lock:
-            return [name for name, breaker in self._breakers.items() if breaker.is_open]
+        # is_open may move a timed-out breaker to HALF_OPEN, dropping it from _open
+        return [name for name in list(self._open) if self._breakers[name].is_open]
     
     def reset_all(self) -> int:
         """Reset all circuit breakers. Returns count."""
-        with self._lock:
-            count = len(self._breakers)
-            for breaker in self._breakers.values():
-                breaker.reset()
-            return count
+        breakers = self._snapshot()
+        for breaker in breakers.values():
+            breaker.reset()
+        return len(breakers)
 
 
 # Global registry instance
@@ -14,8 +14,9 @@ Design:
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
+import threading
 
 from .errors import JARVISError, ErrorCategory
 from tools.registry import PermissionLevel
@@ -30,7 +31,7 @@ class DegradationStrategy(Enum):
     PARTIAL = auto()     # Return partial result
 
 
-@dataclass
+@dataclass(slots=True)
 class DegradationPolicy:
     """
     Policy for handling tool failures.
@@ -52,7 +53,37 @@ class DegradationPolicy:
         }
 
 
-@dataclass
+# Tool name -> bit position, shared by every FailureBudget. Tool names are
+# not numbered by the tool registry, so they are interned here on first use.
+_TOOL_BITS: Dict[str, int] = {}
+_TOOL_NAMES: List[str] = []
+_TOOL_BITS_LOCK = threading.Lock()
+
+
+def _tool_bit(tool_name: str) -> int:
+    """Get the bitmask for a tool name, assigning a new bit if needed."""
+    bit = _TOOL_BITS.get(tool_name)
+    if bit is None:
+        with _TOOL_BITS_LOCK:
+            bit = _TOOL_BITS.get(tool_name)
+            if bit is None:
+                bit = len(_TOOL_NAMES)
+                _TOOL_NAMES.append(tool_name)
+                _TOOL_BITS[tool_name] = bit
+    return 1 << bit
+
+
+def _known_tools_mask(tool_names: List[str]) -> int:
+    """Bitmask for names that already have a bit (unknown ones can't be set)."""
+    mask = 0
+    for name in tool_names:
+        bit = _TOOL_BITS.get(name)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+@dataclass(slots=True)
 class FailureBudget:
     """
     Track failures per turn to prevent runaway execution.
@@ -67,7 +98,7 @@ class FailureBudget:
     
     _total_failures: int = field(default=0, repr=False)
     _consecutive_failures: int = field(default=0, repr=False)
-    _skipped_tools: Set[str] = field(default_factory=set, repr=False)
+    _skipped_mask: int = field(default=0, repr=False)  # Bits from _tool_bit()
     
     def record_failure(self, tool_name: str) -> None:
         """Record a tool failure."""
@@ -80,7 +111,7 @@ class FailureBudget:
     
     def record_skip(self, tool_name: str) -> None:
         """Record a skipped tool for dependency tracking."""
-        self._skipped_tools.add(tool_name)
+        self._skipped_mask |= _tool_bit(tool_name)
     
     def should_abort(self) -> bool:
         """Check if turn should be aborted due to excessive failures."""
@@ -95,14 +126,22 @@ class FailureBudget:
         
         If True, turn must abort to prevent silent correctness degradation.
         """
-        return bool(self._skipped_tools.intersection(dependencies))
+        if not self._skipped_mask:
+            return False
+        return bool(self._skipped_mask & _known_tools_mask(dependencies))
+    
+    @property
+    def skipped_tools(self) -> List[str]:
+        """Names of tools skipped this turn."""
+        mask = self._skipped_mask
+        return [name for bit, name in enumerate(_TOOL_NAMES[:mask.bit_length()]) if mask >> bit & 1]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get failure budget statistics."""
         return {
             "total_failures": self._total_failures,
             "consecutive_failures": self._consecutive_failures,
-            "skipped_tools": list(self._skipped_tools),
+            "skipped_tools": self.skipped_tools,
             "should_abort": self.should_abort(),
         }
     
@@ -110,7 +149,7 @@ class FailureBudget:
         """Reset for new turn."""
         self._total_failures = 0
         self._consecutive_failures = 0
-        self._skipped_tools.clear()
+        self._skipped_mask = 0
 
 
 class DegradationManager:
@@ -138,6 +177,8 @@ class DegradationManager:
     
     def __init__(self):
         self._policies: Dict[str, DegradationPolicy] = {}
+        # Generated defaults, built once per (tool, level) and reused
+        self._default_policies: Dict[Tuple[str, PermissionLevel], DegradationPolicy] = {}
         self._logger = logging.getLogger("jarvis.degradation")
     
     def get_policy(
@@ -147,8 +188,14 @@ class DegradationManager:
     ) -> DegradationPolicy:
         """Get degradation policy for a tool."""
         # Check for explicit policy
-        if tool_name in self._policies:
-            return self._policies[tool_name]
+        policy = self._policies.get(tool_name)
+        if policy is not None:
+            return policy
+        
+        key = (tool_name, permission_level)
+        policy = self._default_policies.get(key)
+        if policy is not None:
+            return policy
         
         # Generate default policy based on permission level
         strategy = self.DEFAULT_STRATEGIES.get(
@@ -158,12 +205,14 @@ class DegradationManager:
         
         is_critical = permission_level in self.CRITICAL_LEVELS
         
-        return DegradationPolicy(
+        policy = DegradationPolicy(
             tool_name=tool_name,
             strategy=strategy,
             is_critical=is_critical,
             max_retries=2 if strategy == DegradationStrategy.RETRY else 0,
         )
+        self._default_policies[key] = policy
+        return policy
     
     def set_policy(self, policy: DegradationPolicy) -> None:
         """Set explicit policy for a tool."""
@@ -202,27 +251,42 @@ class DegradationManager:
         return True, f"Tool {tool_name} skipped per {policy.strategy.name} strategy"
 
 
+# Exception base types in priority order (first match wins)
+_EXC_PRIORITY: Tuple[Tuple[type, ErrorCategory], ...] = (
+    (TimeoutError, ErrorCategory.TIMEOUT_ERROR),
+    (PermissionError, ErrorCategory.PERMISSION_ERROR),
+    (ConnectionError, ErrorCategory.NETWORK_ERROR),
+    (OSError, ErrorCategory.NETWORK_ERROR),
+    (ValueError, ErrorCategory.VALIDATION_ERROR),
+)
+
+# Concrete exception type -> category. Seeded with the known types and
+# filled in for subclasses the first time each one is classified.
+_EXC_TO_CATEGORY: Dict[type, ErrorCategory] = dict(_EXC_PRIORITY)
+
+
+def _category_for(exc_type: type) -> ErrorCategory:
+    """Resolve and cache the category for an exception type."""
+    category = _EXC_TO_CATEGORY.get(exc_type)
+    if category is None:
+        category = ErrorCategory.TOOL_FAILURE
+        for base, base_category in _EXC_PRIORITY:
+            if issubclass(exc_type, base):
+                category = base_category
+                break
+        _EXC_TO_CATEGORY[exc_type] = category
+    return category
+
+
 def classify_exception(exception: Exception, tool_name: str = "") -> JARVISError:
     """
     Convert any exception to classified JARVISError.
     
     Enforcement Rule: All exceptions become JARVISError before returning to planner.
     """
-    # Map known exception types to categories
-    if isinstance(exception, TimeoutError):
-        category = ErrorCategory.TIMEOUT_ERROR
-    elif isinstance(exception, PermissionError):
-        category = ErrorCategory.PERMISSION_ERROR
-    elif isinstance(exception, (ConnectionError, OSError)):
-        category = ErrorCategory.NETWORK_ERROR
-    elif isinstance(exception, ValueError):
-        category = ErrorCategory.VALIDATION_ERROR
-    else:
-        category = ErrorCategory.TOOL_FAILURE
-    
     return JARVISError.from_exception(
         exception=exception,
-        category=category,
+        category=_category_for(type(exception)),
         details={"tool": tool_name}
     )
 
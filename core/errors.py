@@ -5,28 +5,36 @@ Typed errors with classification and retry logic.
 No silent retries on hallucinations.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Type
+from enum import IntEnum
+from typing import Any, ClassVar, Deque, Dict, Optional
 import logging
 import traceback
 
+# Shared with ErrorHandler; stack traces are only ever emitted at DEBUG
+_logger = logging.getLogger("jarvis.errors")
 
-class ErrorCategory(Enum):
-    """Categories of errors for handling decisions."""
-    TOOL_FAILURE = auto()       # Tool execution failed
-    VALIDATION_ERROR = auto()   # Input validation failed
-    LLM_FAILURE = auto()        # LLM API/parsing error
-    LLM_HALLUCINATION = auto()  # LLM produced invalid output
-    PERMISSION_ERROR = auto()   # Permission denied
-    NETWORK_ERROR = auto()      # Network/API error
-    TIMEOUT_ERROR = auto()      # Operation timed out
-    SYSTEM_ERROR = auto()       # Internal system error
-    USER_ERROR = auto()         # User input error
 
+class ErrorCategory(IntEnum):
+    """
+    Categories of errors for handling decisions.
+    
+    Values are dense from 0 so a category can index a per-category tuple.
+    """
+    TOOL_FAILURE = 0        # Tool execution failed
+    VALIDATION_ERROR = 1    # Input validation failed
+    LLM_FAILURE = 2         # LLM API/parsing error
+    LLM_HALLUCINATION = 3   # LLM produced invalid output
+    PERMISSION_ERROR = 4    # Permission denied
+    NETWORK_ERROR = 5       # Network/API error
+    TIMEOUT_ERROR = 6       # Operation timed out
+    SYSTEM_ERROR = 7        # Internal system error
+    USER_ERROR = 8          # User input error
 
-@dataclass
+
+@dataclass(slots=True)
 class JARVISError:
     """
     Structured error with metadata.
@@ -37,8 +45,23 @@ class JARVISError:
     message: str
     details: Optional[Dict[str, Any]] = None
     timestamp: datetime = field(default_factory=datetime.now)
-    stack_trace: Optional[str] = None
     recoverable: bool = True
+    _exc_ref: Optional[BaseException] = field(default=None, repr=False)
+    _stack_trace: Optional[str] = field(default=None, repr=False)
+    
+    @property
+    def stack_trace(self) -> Optional[str]:
+        """Formatted traceback of the source exception, built on first access."""
+        if self._stack_trace is None and self._exc_ref is not None:
+            exc = self._exc_ref
+            self._stack_trace = "".join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            )
+        return self._stack_trace
+    
+    @stack_trace.setter
+    def stack_trace(self, value: Optional[str]) -> None:
+        self._stack_trace = value
     
     @classmethod
     def from_exception(
@@ -47,22 +70,33 @@ class JARVISError:
         category: ErrorCategory,
         details: Optional[Dict] = None
     ) -> "JARVISError":
-        """Create error from an exception."""
+        """
+        Create error from an exception.
+        
+        Only a reference to the exception is kept; the stack trace is
+        formatted when stack_trace is first read (in practice, only when
+        ErrorHandler logs at DEBUG).
+        """
         return cls(
             category=category,
             message=str(exception),
             details=details,
-            stack_trace=traceback.format_exc(),
             recoverable=category not in {
                 ErrorCategory.SYSTEM_ERROR,
                 ErrorCategory.LLM_HALLUCINATION
-            }
+            },
+            _exc_ref=exception,
         )
     
     def __repr__(self) -> str:
         return f"JARVISError({self.category.name}: {self.message})"
 
 
+def _by_category(table: Dict[ErrorCategory, Any], default: Any) -> tuple:
+    """Flatten a per-category table into a tuple indexed by category."""
+    return tuple(table.get(category, default) for category in ErrorCategory)
+
+
 class RetryPolicy:
     """
     Retry policy for different error categories.
@@ -91,16 +125,20 @@ class RetryPolicy:
         ErrorCategory.TIMEOUT_ERROR: 2.0,
     }
     
+    # The tables above flattened for lookup by category (an IntEnum
+    # counting from 0). Rebuild these if the tables are changed at runtime.
+    _MAX_RETRIES_ARR = _by_category(MAX_RETRIES, 0)
+    _RETRY_DELAYS_ARR = _by_category(RETRY_DELAYS, 1.0)
+    
     @classmethod
     def should_retry(cls, error: JARVISError, attempt: int) -> bool:
         """Check if operation should be retried."""
-        max_retries = cls.MAX_RETRIES.get(error.category, 0)
-        return attempt < max_retries and error.recoverable
+        return attempt < cls._MAX_RETRIES_ARR[error.category] and error.recoverable
     
     @classmethod
     def get_delay(cls, error: JARVISError) -> float:
         """Get delay before retry in seconds."""
-        return cls.RETRY_DELAYS.get(error.category, 1.0)
+        return cls._RETRY_DELAYS_ARR[error.category]
 
 
 class ErrorHandler:
@@ -108,10 +146,35 @@ class ErrorHandler:
     Central error handler with logging and recovery.
     """
     
+    # Log level per error category
+    _LEVEL_MAP: ClassVar[Dict[ErrorCategory, int]] = {
+        ErrorCategory.USER_ERROR: logging.INFO,
+        ErrorCategory.VALIDATION_ERROR: logging.WARNING,
+        ErrorCategory.PERMISSION_ERROR: logging.WARNING,
+        ErrorCategory.LLM_HALLUCINATION: logging.WARNING,
+        ErrorCategory.TOOL_FAILURE: logging.ERROR,
+        ErrorCategory.LLM_FAILURE: logging.ERROR,
+        ErrorCategory.NETWORK_ERROR: logging.ERROR,
+        ErrorCategory.TIMEOUT_ERROR: logging.ERROR,
+        ErrorCategory.SYSTEM_ERROR: logging.CRITICAL,
+    }
+    
+    # User-facing message per category (USER_ERROR echoes error.message)
+    _USER_MESSAGES: ClassVar[Dict[ErrorCategory, str]] = {
+        ErrorCategory.TOOL_FAILURE: "The command couldn't be completed. Please try again.",
+        ErrorCategory.VALIDATION_ERROR: "I couldn't understand that request. Please try rephrasing.",
+        ErrorCategory.LLM_FAILURE: "I'm having trouble processing that. Please try again.",
+        ErrorCategory.LLM_HALLUCINATION: "I got confused. Let me try a different approach.",
+        ErrorCategory.PERMISSION_ERROR: "I don't have permission to do that.",
+        ErrorCategory.NETWORK_ERROR: "I'm having trouble connecting. Please check your internet.",
+        ErrorCategory.TIMEOUT_ERROR: "That took too long. Please try again.",
+        ErrorCategory.SYSTEM_ERROR: "Something went wrong internally. Please try again later.",
+    }
+    
     def __init__(self):
-        self._logger = logging.getLogger("jarvis.errors")
-        self._error_history: List[JARVISError] = []
+        self._logger = _logger
         self._max_history = 100
+        self._error_history: Deque[JARVISError] = deque(maxlen=self._max_history)
     
     def handle(self, error: JARVISError) -> str:
         """
@@ -120,29 +183,15 @@ class ErrorHandler:
         # Log error
         self._log_error(error)
         
-        # Store in history
+        # Store in history (oldest entry evicted automatically)
         self._error_history.append(error)
-        if len(self._error_history) > self._max_history:
-            self._error_history.pop(0)
         
         # Generate user message
         return self._get_user_message(error)
     
     def _log_error(self, error: JARVISError) -> None:
         """Log error with appropriate level."""
-        level_map = {
-            ErrorCategory.USER_ERROR: logging.INFO,
-            ErrorCategory.VALIDATION_ERROR: logging.WARNING,
-            ErrorCategory.PERMISSION_ERROR: logging.WARNING,
-            ErrorCategory.LLM_HALLUCINATION: logging.WARNING,
-            ErrorCategory.TOOL_FAILURE: logging.ERROR,
-            ErrorCategory.LLM_FAILURE: logging.ERROR,
-            ErrorCategory.NETWORK_ERROR: logging.ERROR,
-            ErrorCategory.TIMEOUT_ERROR: logging.ERROR,
-            ErrorCategory.SYSTEM_ERROR: logging.CRITICAL,
-        }
-        
-        level = level_map.get(error.category, logging.ERROR)
+        level = self._LEVEL_MAP.get(error.category, logging.ERROR)
         
         self._logger.log(
             level,
@@ -150,24 +199,16 @@ class ErrorHandler:
             extra={"details": error.details}
         )
         
-        if error.stack_trace and level >= logging.ERROR:
-            self._logger.debug(f"Stack trace:\n{error.stack_trace}")
+        if level >= logging.ERROR and self._logger.isEnabledFor(logging.DEBUG):
+            stack_trace = error.stack_trace
+            if stack_trace:
+                self._logger.debug(f"Stack trace:\n{stack_trace}")
     
     def _get_user_message(self, error: JARVISError) -> str:
         """Generate user-friendly error message."""
-        messages = {
-            ErrorCategory.TOOL_FAILURE: "The command couldn't be completed. Please try again.",
-            ErrorCategory.VALIDATION_ERROR: "I couldn't understand that request. Please try rephrasing.",
-            ErrorCategory.LLM_FAILURE: "I'm having trouble processing that. Please try again.",
-            ErrorCategory.LLM_HALLUCINATION: "I got confused. Let me try a different approach.",
-            ErrorCategory.PERMISSION_ERROR: "I don't have permission to do that.",
-            ErrorCategory.NETWORK_ERROR: "I'm having trouble connecting. Please check your internet.",
-            ErrorCategory.TIMEOUT_ERROR: "That took too long. Please try again.",
-            ErrorCategory.SYSTEM_ERROR: "Something went wrong internally. Please try again later.",
-            ErrorCategory.USER_ERROR: error.message,
-        }
-        
-        return messages.get(error.category, "An error occurred.")
+        if error.category is ErrorCategory.USER_ERROR:
+            return error.message
+        return self._USER_MESSAGES.get(error.category, "An error occurred.")
     
     def get_error_stats(self) -> Dict[str, int]:
         """Get error statistics."""
@@ -10,26 +10,142 @@ All interactions go through this module.
 Exit Criterion: End-to-end voice command works without LLMs.
 """
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import copy
+import json
 import logging
-import yaml
+import os
+import sys
+import tempfile
+import time
+import types
+
+from infra.yaml_loader import load_yaml
 
 from .state_machine import StateMachine, State
 
 
-@dataclass
+# Parsed config files: absolute path -> (mtime_ns, size, parsed data)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# Constant transition reasons, interned so history records share one object
+_REASON_PTT = sys.intern("Push-to-talk activated")
+_REASON_TOO_SHORT = sys.intern("Audio too short")
+_REASON_AUDIO_OK = sys.intern("Audio captured")
+_REASON_LOW_CONFIDENCE = sys.intern("Low confidence transcription")
+_REASON_NO_SPEECH = sys.intern("No speech detected")
+_REASON_MATCHING = sys.intern("Matching command")
+_REASON_NO_MATCH = sys.intern("No command matched")
+_REASON_PERM_DENIED = sys.intern("Permission denied")
+_REASON_EXEC_DONE = sys.intern("Execution complete")
+_REASON_DELIVERED = sys.intern("Result delivered")
+
+# Background STT model loads (threads start lazily, on first submit)
+_THREAD_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis-preload")
+
+
+def _json_cache_path(path: Path) -> Path:
+    """Sidecar location for a YAML file's JSON cache (config.yaml.cache.json)."""
+    return path.with_suffix(path.suffix + '.cache.json')
+
+
+def _read_json_cache(path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """
+    Load the JSON sidecar if it was written from this exact YAML file.
+    
+    The sidecar records the source's mtime_ns and size, which is stricter
+    than comparing file mtimes (an edit within the same second is caught).
+    """
+    try:
+        with open(_json_cache_path(path), 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    source = cached.get("source") if isinstance(cached, dict) else None
+    if source != {"mtime_ns": st.st_mtime_ns, "size": st.st_size}:
+        return None
+    return cached.get("data")
+
+
+def _write_json_cache(path: Path, st: os.stat_result, data: Any) -> None:
+    """Atomically write the JSON sidecar, if the data survives a JSON round trip."""
+    try:
+        payload = json.dumps({
+            "source": {"mtime_ns": st.st_mtime_ns, "size": st.st_size},
+            "data": data,
+        })
+    except (TypeError, ValueError):
+        return  # Not JSON-representable (e.g. YAML dates)
+    
+    # Non-string keys would come back as strings; keep only faithful caches
+    if json.loads(payload)["data"] != data:
+        return
+    
+    cache_path = _json_cache_path(path)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        logging.getLogger("jarvis.orchestrator").debug(f"Could not write {cache_path}: {e}")
+
+
+def _load_yaml_cached(path: Path, json_cache: bool = False) -> Any:
+    """
+    Parse a YAML file, reusing the last parse while mtime and size match.
+    
+    With json_cache, a JSON sidecar next to the file is read in place of
+    parsing (and rewritten after a parse), so fresh processes skip YAML.
+    
+    Returns a deep copy, so callers may mutate the result freely.
+    """
+    key = str(path.resolve())
+    st = path.stat()
+    
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+    
+    data = _read_json_cache(path, st) if json_cache else None
+    if data is None:
+        with open(path, 'r') as f:
+            data = load_yaml(f)
+        if json_cache:
+            _write_json_cache(path, st, data)
+    
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    
+    return copy.deepcopy(data)
+
+
+@dataclass(slots=True)
 class OrchestratorConfig:
     """Configuration for the orchestrator."""
     config_path: str = "config.yaml"
     max_retries: int = 2
     timeout_seconds: float = 30.0
     confidence_threshold: float = 0.6
+    write_yaml_cache: bool = True  # Keep a config.yaml.cache.json sidecar
+    preload_stt: bool = True  # Load the STT model in the background on initialize()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """Result of a command execution."""
     success: bool
@@ -43,6 +159,33 @@ class CommandResult:
         return f"CommandResult({status} {self.command_id}, output={self.output})"
 
 
+@dataclass(slots=True, frozen=True)
+class OrchestratorStatus:
+    """
+    Snapshot returned by get_status().
+    
+    Each phase fills in its own fields; the rest keep their defaults. Use
+    dataclasses.asdict() where a plain dict is needed.
+    """
+    state: str
+    is_busy: bool
+    stt_loaded: bool
+    commands_loaded: int
+    # Phase 2
+    mode: str = ""
+    tools_loaded: int = 0
+    llm_ready: bool = False
+    # Phase 3
+    memory_enabled: bool = False
+    memory_turns: int = 0
+    preferences_enabled: bool = False
+    # Phase 4
+    screenshot_enabled: bool = False
+    camera_enabled: bool = False
+    scheduling_enabled: bool = False
+    scheduled_tasks: int = 0
+
+
 class Orchestrator:
     """
     Central orchestrator for JARVIS.
@@ -67,11 +210,15 @@ class Orchestrator:
         self._command_registry = None
         self._permission_checker = None
         self._executor = None
+        self._n_commands = 0  # len(command registry), kept for get_status()
+        self._initialized = False
+        self._stt_loaded = False  # Set once the STT model has been loaded
+        self._stt_load_future: Optional[Future] = None  # Background preload, if any
         
-        # Event callbacks
-        self._on_transcription: Optional[Callable[[str, float], None]] = None
-        self._on_command: Optional[Callable[[str, Dict], None]] = None
-        self._on_result: Optional[Callable[[CommandResult], None]] = None
+        # Event callbacks (tuples, so dispatch is a plain loop; empty = no-op)
+        self._transcription_cbs: Tuple[Callable[[str, float], None], ...] = ()
+        self._command_cbs: Tuple[Callable[[str, Dict], None], ...] = ()
+        self._result_cbs: Tuple[Callable[[CommandResult], None], ...] = ()
         
         # Load configuration
         self._load_config()
@@ -81,11 +228,27 @@ class Orchestrator:
         config_path = Path(self.config.config_path)
         
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                self._yaml_config = yaml.safe_load(f)
+            self._yaml_config = _load_yaml_cached(
+                config_path, json_cache=self.config.write_yaml_cache
+            )
         else:
             self._yaml_config = {}
-            self._logger.warning(f"Config file not found: {config_path}")
+            self._logger.warning("Config file not found: %s", config_path)
+        
+        # Config sections, resolved once (a missing or empty section is {})
+        config = self._yaml_config or {}
+        self._cfg = types.SimpleNamespace(
+            audio=config.get('audio') or {},
+            stt=config.get('stt') or {},
+            commands=config.get('commands') or {},
+            security=config.get('security') or {},
+        )
+        
+        # Per-utterance settings, resolved once instead of on every transcription
+        self._confidence_threshold = float(
+            self._cfg.stt.get('confidence_threshold', self.config.confidence_threshold)
+        )
+        self._min_audio_seconds = float(self._cfg.audio.get('min_seconds', 0.5))
     
     @property
     def state(self) -> State:
@@ -96,67 +259,127 @@ class Orchestrator:
         """
         Initialize all subsystems.
         Call this before starting the main loop.
+        
+        Subsystems are constructed on first use (see the properties below),
+        so text-only sessions never import the audio or STT stacks. The
+        exceptions: the command registry (a small YAML file every session
+        needs) is loaded now so get_status() reports its size, and with
+        config.preload_stt the STT model is loaded on a background thread,
+        so the first utterance does not wait for it.
         """
-        self._logger.info("Initializing JARVIS subsystems...")
+        self._initialized = True
+        self.command_registry
+        self._logger.info("JARVIS subsystems will load on first use")
         
-        # Import modules here to avoid circular imports
-        from audio import MicrophoneCapture, CaptureConfig
-        from stt import WhisperEngine, STTConfig
-        from commands import CommandRegistry
-        from security import PermissionChecker
+        if self.config.preload_stt and self._stt_load_future is None and not self._stt_loaded:
+            self._stt_load_future = _THREAD_POOL.submit(self._preload_stt)
+    
+    def _preload_stt(self) -> None:
+        """Construct the STT engine and load its model (runs on _THREAD_POOL)."""
+        stt_engine = self.stt_engine
+        if not stt_engine.is_loaded:
+            self._logger.info("Preloading STT model...")
+            stt_engine.load()
+    
+    def _wait_for_stt_preload(self) -> None:
+        """
+        Wait for a pending background preload, if any.
         
-        # Initialize audio capture
-        audio_config = self._yaml_config.get('audio', {})
-        self._mic_capture = MicrophoneCapture(
-            config=CaptureConfig(
-                sample_rate=audio_config.get('sample_rate', 16000),
-                channels=audio_config.get('channels', 1),
-                dtype=audio_config.get('dtype', 'float32')
+        A failed preload re-raises here, on the request path, just as the
+        synchronous load would have; the next utterance loads in the foreground.
+        """
+        future, self._stt_load_future = self._stt_load_future, None
+        if future is not None:
+            future.result()
+    
+    @property
+    def mic_capture(self):
+        """Microphone capture, created on first use."""
+        if self._mic_capture is None:
+            from audio import MicrophoneCapture, CaptureConfig
+            
+            audio_config = self._cfg.audio
+            self._mic_capture = MicrophoneCapture(
+                config=CaptureConfig(
+                    sample_rate=audio_config.get('sample_rate', 16000),
+                    channels=audio_config.get('channels', 1),
+                    dtype=audio_config.get('dtype', 'int16')
+                )
             )
-        )
-        self._logger.info("Audio capture initialized")
-        
-        # Initialize STT engine
-        stt_config = self._yaml_config.get('stt', {})
-        self._stt_engine = WhisperEngine(
-            config=STTConfig(
-                model=stt_config.get('model', 'medium'),
-                language=stt_config.get('language', 'en'),
-                beam_size=stt_config.get('beam_size', 5),
-                confidence_threshold=stt_config.get('confidence_threshold', 0.6),
-                device=stt_config.get('device', 'auto')
+            self._logger.info("Audio capture initialized")
+        return self._mic_capture
+    
+    @property
+    def stt_engine(self):
+        """STT engine, created on first use (the model still loads separately)."""
+        if self._stt_engine is None:
+            from stt import WhisperEngine, STTConfig
+            
+            stt_config = self._cfg.stt
+            self._stt_engine = WhisperEngine(
+                config=STTConfig(
+                    model=stt_config.get('model', 'medium'),
+                    language=stt_config.get('language', 'en'),
+                    beam_size=stt_config.get('beam_size', 5),
+                    confidence_threshold=stt_config.get('confidence_threshold', 0.6),
+                    device=stt_config.get('device', 'auto')
+                )
             )
-        )
-        self._logger.info("STT engine initialized")
-        
-        # Initialize command registry
-        commands_config = self._yaml_config.get('commands', {})
-        registry_path = commands_config.get('registry_path', 'commands/command_map.yaml')
-        self._command_registry = CommandRegistry(registry_path)
-        self._logger.info(f"Command registry loaded: {len(self._command_registry)} commands")
-        
-        # Initialize permission checker
-        security_config = self._yaml_config.get('security', {})
-        self._permission_checker = PermissionChecker(
-            default_policy=security_config.get('default_policy', 'deny')
-        )
-        self._logger.info("Permission checker initialized")
-        
-        self._logger.info("All subsystems initialized successfully")
+            self._logger.info("STT engine initialized")
+        return self._stt_engine
+    
+    @property
+    def command_registry(self):
+        """Command registry, loaded on first use."""
+        if self._command_registry is None:
+            from commands import CommandRegistry
+            
+            commands_config = self._cfg.commands
+            registry_path = commands_config.get('registry_path', 'commands/command_map.yaml')
+            self._command_registry = CommandRegistry(registry_path)
+            self.refresh_command_count()
+            self._logger.info("Command registry loaded: %d commands", self._n_commands)
+        return self._command_registry
+    
+    def refresh_command_count(self) -> None:
+        """Re-read the command count reported by get_status(); call after reloading commands."""
+        self._n_commands = len(self._command_registry) if self._command_registry else 0
+    
+    @property
+    def permission_checker(self):
+        """Permission checker, created on first use."""
+        if self._permission_checker is None:
+            from security import PermissionChecker
+            
+            security_config = self._cfg.security
+            self._permission_checker = PermissionChecker(
+                default_policy=security_config.get('default_policy', 'deny')
+            )
+            self._logger.info("Permission checker initialized")
+        return self._permission_checker
+    
+    @property
+    def executor(self):
+        """Command executor, created on first use."""
+        if self._executor is None:
+            from security import CommandExecutor
+            self._executor = CommandExecutor()
+        return self._executor
     
     def start_listening(self) -> None:
         """Start capturing audio (push-to-talk activated)."""
-        if self._state_machine.state != State.IDLE:
-            self._logger.warning(f"Cannot start listening in state: {self._state_machine.state}")
+        state = self._state_machine.state
+        if state is not State.IDLE:
+            self._logger.warning("Cannot start listening in state: %s", state)
             return
         
-        self._state_machine.transition(State.LISTENING, "Push-to-talk activated")
+        self._state_machine.transition(State.LISTENING, _REASON_PTT)
         
         try:
-            self._mic_capture.start()
+            self.mic_capture.start()
             self._logger.info("Microphone capture started")
         except Exception as e:
-            self._logger.error(f"Failed to start capture: {e}")
+            self._logger.error("Failed to start capture: %s", e)
             self._state_machine.transition(State.ERROR, f"Capture error: {e}")
     
     def stop_listening(self) -> Optional[str]:
@@ -164,78 +387,86 @@ class Orchestrator:
         Stop capturing audio and process the result.
         Returns the recognized text if successful.
         """
-        if self._state_machine.state != State.LISTENING:
-            self._logger.warning(f"Cannot stop listening in state: {self._state_machine.state}")
+        state = self._state_machine.state
+        if state is not State.LISTENING:
+            self._logger.warning("Cannot stop listening in state: %s", state)
             return None
         
         try:
             # Get audio segment
-            audio_segment = self._mic_capture.stop()
-            self._logger.info(f"Captured audio: {audio_segment.duration_seconds:.2f}s")
+            audio_segment = self.mic_capture.stop()
+            self._logger.info("Captured audio: %.2fs", audio_segment.duration_seconds)
             
-            if audio_segment.duration_seconds < 0.5:
+            if audio_segment.duration_seconds < self._min_audio_seconds:
                 self._logger.warning("Audio too short, ignoring")
-                self._state_machine.transition(State.IDLE, "Audio too short")
+                self._state_machine.transition(State.IDLE, _REASON_TOO_SHORT)
                 return None
             
             # Transition to transcribing
-            self._state_machine.transition(State.TRANSCRIBING, "Audio captured")
+            self._state_machine.transition(State.TRANSCRIBING, _REASON_AUDIO_OK)
             
-            # Ensure STT model is loaded
-            if not self._stt_engine.is_loaded:
-                self._logger.info("Loading STT model...")
-                self._stt_engine.load()
+            # Ensure STT model is loaded (usually already done by the preload)
+            if not self._stt_loaded:
+                self._wait_for_stt_preload()
+                stt_engine = self.stt_engine
+                if not stt_engine.is_loaded:
+                    self._logger.info("Loading STT model...")
+                    stt_engine.load()
+                self._stt_loaded = True
             
             # Transcribe
-            result = self._stt_engine.transcribe(
+            result = self.stt_engine.transcribe(
                 audio_segment.data,
                 audio_segment.sample_rate
             )
             
             self._logger.info(
-                f"Transcription: '{result.text}' "
-                f"(confidence: {result.confidence:.2%})"
+                "Transcription: '%s' (confidence: %.2f%%)",
+                result.text, result.confidence * 100
             )
             
             # Check confidence threshold
-            threshold = self._yaml_config.get('stt', {}).get('confidence_threshold', 0.6)
+            threshold = self._confidence_threshold
             
             if not result.meets_threshold(threshold):
                 self._logger.warning(
-                    f"Confidence {result.confidence:.2%} below threshold {threshold:.2%}"
+                    "Confidence %.2f%% below threshold %.2f%%",
+                    result.confidence * 100, threshold * 100
                 )
-                self._state_machine.transition(State.IDLE, "Low confidence transcription")
+                self._state_machine.transition(State.IDLE, _REASON_LOW_CONFIDENCE)
                 return None
             
             if result.is_empty:
                 self._logger.info("Empty transcription")
-                self._state_machine.transition(State.IDLE, "No speech detected")
+                self._state_machine.transition(State.IDLE, _REASON_NO_SPEECH)
                 return None
             
             # Notify callback
-            if self._on_transcription:
-                self._on_transcription(result.text, result.confidence)
+            for callback in self._transcription_cbs:
+                callback(result.text, result.confidence)
             
             # Process the transcription
             return self._process_text(result.text)
             
         except Exception as e:
-            self._logger.error(f"Processing error: {e}")
-            self._state_machine.transition(State.ERROR, f"Processing error: {e}")
-            self._state_machine.transition(State.IDLE, "Recovered from error")
+            self._logger.error("Processing error: %s", e)
+            self._state_machine.recover(f"Processing error: {e}")
             return None
     
     def _process_text(self, text: str) -> Optional[str]:
         """Process transcribed text through command matching and execution."""
         # Transition to planning (command matching in Phase 1)
-        self._state_machine.transition(State.PLANNING, "Matching command")
+        self._state_machine.transition(State.PLANNING, _REASON_MATCHING)
         
         # Match command
-        intent = self._command_registry.match(text)
+        intent = self.command_registry.match(text)
+        
+        # Per-command summary, logged once by _output_result
+        trace = {"text": text, "command_id": intent.command_id, "matched": intent.is_match}
         
         if not intent.is_match:
-            self._logger.info(f"No command matched for: '{text}'")
-            self._state_machine.transition(State.RESPONDING, "No command matched")
+            self._logger.debug("No command matched for: '%s'", text)
+            self._state_machine.transition(State.RESPONDING, _REASON_NO_MATCH)
             
             # Output result
             output = f"I didn't understand: '{text}'"
@@ -244,19 +475,20 @@ class Orchestrator:
                 command_id="",
                 output=output,
                 error="No command matched"
-            ))
+            ), trace)
             return output
         
-        self._logger.info(f"Command matched: {intent.command_id}")
+        self._logger.debug("Command matched: %s", intent.command_id)
         
         # Notify callback
-        if self._on_command:
-            self._on_command(intent.command_id, intent.args)
+        for callback in self._command_cbs:
+            callback(intent.command_id, intent.args)
         
         # Check permission
-        if not self._permission_checker.check(intent.command_id, intent.permission):
-            self._logger.warning(f"Permission denied for: {intent.command_id}")
-            self._state_machine.transition(State.RESPONDING, "Permission denied")
+        trace["permission_ok"] = self.permission_checker.check(intent.command_id, intent.permission)
+        if not trace["permission_ok"]:
+            self._logger.warning("Permission denied for: %s", intent.command_id)
+            self._state_machine.transition(State.RESPONDING, _REASON_PERM_DENIED)
             
             output = f"Permission denied for: {intent.command_name}"
             self._output_result(CommandResult(
@@ -264,24 +496,19 @@ class Orchestrator:
                 command_id=intent.command_id,
                 output=output,
                 error="Permission denied"
-            ))
+            ), trace)
             return output
         
         # Execute command
-        self._state_machine.transition(State.EXECUTING, f"Executing {intent.command_id}")
+        self._state_machine.transition(State.EXECUTING, lambda: f"Executing {intent.command_id}")
         
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
-        try:
-            # Get executor and run command
-            if self._executor is None:
-                from security import CommandExecutor
-                self._executor = CommandExecutor()
-            
-            result = self._executor.execute(intent)
-            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+        with self._error_to_result(intent.command_id, trace) as failure:
+            result = self.executor.execute(intent)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
             
-            self._state_machine.transition(State.RESPONDING, "Execution complete")
+            self._state_machine.transition(State.RESPONDING, _REASON_EXEC_DONE)
             
             cmd_result = CommandResult(
                 success=True,
@@ -290,78 +517,120 @@ class Orchestrator:
                 execution_time_ms=execution_time
             )
             
-            self._output_result(cmd_result)
+            self._output_result(cmd_result, trace)
             return str(result)
-            
+        
+        return failure.output
+    
+    @contextmanager
+    def _error_to_result(
+        self,
+        command_id: str,
+        trace: Optional[Dict] = None
+    ) -> Iterator[types.SimpleNamespace]:
+        """
+        Turn an exception in the block into a failed CommandResult.
+        
+        The exception is logged, the state machine recovers to IDLE and the
+        failure is output; the yielded namespace's `output` then holds the
+        user-facing message (it stays None if the block did not raise).
+        """
+        failure = types.SimpleNamespace(output=None)
+        try:
+            yield failure
         except Exception as e:
-            self._logger.error(f"Execution error: {e}")
-            self._state_machine.transition(State.ERROR, f"Execution error: {e}")
+            self._logger.debug("Execution error: %s", e, exc_info=True)
+            self._state_machine.recover(f"Execution error: {e}")
             
-            cmd_result = CommandResult(
+            self._output_result(CommandResult(
                 success=False,
-                command_id=intent.command_id,
+                command_id=command_id,
                 output=None,
                 error=str(e)
-            )
-            
-            self._state_machine.transition(State.IDLE, "Recovered from error")
-            self._output_result(cmd_result)
-            return f"Error: {e}"
-    
-    def _output_result(self, result: CommandResult) -> None:
-        """Output command result to CLI."""
-        if result.success:
-            self._logger.info(f"Command result: {result.output}")
+            ), trace)
+            failure.output = f"Error: {e}"
+    
+    def _output_result(self, result: CommandResult, trace: Optional[Dict] = None) -> None:
+        """
+        Output command result to CLI.
+        
+        With a trace from _process_text, the whole command is summarised in
+        one record carrying the trace as the "command_trace" extra.
+        """
+        if trace is None:
+            if result.success:
+                self._logger.info("Command result: %s", result.output)
+            else:
+                self._logger.error("Command failed: %s", result.error)
         else:
-            self._logger.error(f"Command failed: {result.error}")
+            trace["success"] = result.success
+            trace["execution_time_ms"] = result.execution_time_ms
+            if result.success:
+                self._logger.info(
+                    "Command %s: %s (%.1f ms)",
+                    result.command_id, result.output, result.execution_time_ms,
+                    extra={"command_trace": trace}
+                )
+            else:
+                trace["error"] = result.error
+                self._logger.error(
+                    "Command failed: %s (input: '%s')", result.error, trace["text"],
+                    extra={"command_trace": trace}
+                )
         
         # Notify callback
-        if self._on_result:
-            self._on_result(result)
+        for callback in self._result_cbs:
+            callback(result)
         
         # Transition back to idle
-        if self._state_machine.state != State.IDLE:
-            self._state_machine.transition(State.IDLE, "Result delivered")
+        if self._state_machine.state is not State.IDLE:
+            self._state_machine.transition(State.IDLE, _REASON_DELIVERED)
     
     def process_text_directly(self, text: str) -> Optional[str]:
         """
         Process text input directly (bypass audio capture).
         Useful for testing and CLI input.
         """
-        if self._state_machine.state != State.IDLE:
-            self._logger.warning(f"Cannot process in state: {self._state_machine.state}")
+        state = self._state_machine.state
+        if state is not State.IDLE:
+            self._logger.warning("Cannot process in state: %s", state)
             return None
         
-        self._logger.info(f"Processing text: '{text}'")
+        self._logger.debug("Processing text: '%s'", text)
         return self._process_text(text)
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> OrchestratorStatus:
         """Get current system status."""
-        return {
-            "state": self._state_machine.state.name,
-            "is_busy": self._state_machine.is_busy(),
-            "stt_loaded": self._stt_engine.is_loaded if self._stt_engine else False,
-            "commands_loaded": len(self._command_registry) if self._command_registry else 0,
-        }
+        return OrchestratorStatus(
+            state=self._state_machine.state.name,
+            is_busy=self._state_machine.is_busy(),
+            stt_loaded=self._stt_engine.is_loaded if self._stt_engine else False,
+            commands_loaded=self._n_commands,
+        )
     
     def shutdown(self) -> None:
         """Shutdown all subsystems."""
         self._logger.info("Shutting down JARVIS...")
         
+        future, self._stt_load_future = self._stt_load_future, None
+        if future is not None and not future.cancel():
+            future.exception()  # Let an in-flight load finish before unloading
+        
         if self._stt_engine and self._stt_engine.is_loaded:
             self._stt_engine.unload()
+        self._stt_loaded = False
         
         self._logger.info("Shutdown complete")
     
     # Event registration
     def on_transcription(self, callback: Callable[[str, float], None]) -> None:
         """Register callback for transcription events."""
-        self._on_transcription = callback
+        self._transcription_cbs = self._transcription_cbs + (callback,)
     
     def on_command(self, callback: Callable[[str, Dict], None]) -> None:
         """Register callback for command match events."""
-        self._on_command = callback
+        self._command_cbs = self._command_cbs + (callback,)
     
     def on_result(self, callback: Callable[[CommandResult], None]) -> None:
         """Register callback for command result events."""
-        self._on_result = callback
+        self._result_cbs = self._result_cbs + (callback,)
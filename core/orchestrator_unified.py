@@ -11,25 +11,156 @@ Usage:
     from core.orchestrator_unified import Phase2Config, Phase3Config, Phase4Config
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
+import os
+import sys
+import types
 
 # Import base orchestrator (Phase 1 - always required)
-from .orchestrator import Orchestrator, OrchestratorConfig, CommandResult
+from .orchestrator import (
+    Orchestrator, OrchestratorConfig, OrchestratorStatus, CommandResult, _REASON_EXEC_DONE
+)
 from .state_machine import State
 from .errors import (
     ErrorHandler, JARVISError, ErrorCategory, RetryPolicy,
     create_llm_error, create_tool_error
 )
+from tools.registry import PermissionLevel
+
+# Phase 3 memory (stdlib, yaml and numpy), imported once here rather than per init
+try:
+    from memory import ConversationMemory, PreferenceStore, ContextManager
+except ImportError:
+    ConversationMemory = PreferenceStore = ContextManager = None
+
+# multimodal.screenshot.ScreenRegion, bound by the first Phase 4 initialize()
+# (importing multimodal also loads the camera stack, so core does not do it)
+_ScreenRegion = None
+
+# Transition reasons used by the LLM paths (see orchestrator.py)
+_REASON_LLM_PLANNING = sys.intern("LLM planning")
+_REASON_DIRECT = sys.intern("Direct response")
+_REASON_TOOLS = sys.intern("Executing tools")
+
+# list_scheduled_tasks output
+_TASKS_HEADER = "Scheduled tasks:"
+_TASK_LINE = "  - %s (%s): %s, next: %s"
+
+# Static parts of the multimodal tools (see _multimodal_tool_definitions)
+_MULTIMODAL_TOOL_DEFINITIONS: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _multimodal_tool_definitions() -> Dict[str, Dict[str, Any]]:
+    """
+    Tool() keyword arguments for the multimodal tools, minus the executor.
+    
+    Built on first use and then shared: the schemas never change, so
+    each orchestrator only binds its own executors. tools.registry is
+    imported lazily, as elsewhere in this module.
+    """
+    global _MULTIMODAL_TOOL_DEFINITIONS
+    if _MULTIMODAL_TOOL_DEFINITIONS is not None:
+        return _MULTIMODAL_TOOL_DEFINITIONS
+    
+    from tools.registry import ToolSchema, ToolParameter, ParameterType
+    
+    _MULTIMODAL_TOOL_DEFINITIONS = {
+        "take_screenshot": dict(
+            name="take_screenshot",
+            description="Capture a screenshot of the screen",
+            schema=ToolSchema(parameters=[
+                ToolParameter(
+                    name="region",
+                    type=ParameterType.STRING,
+                    description="Screen region: 'full' or 'x,y,width,height'",
+                    required=False,
+                    default="full"
+                ),
+                ToolParameter(
+                    name="analyze",
+                    type=ParameterType.BOOLEAN,
+                    description="Whether to analyze the screenshot with vision",
+                    required=False,
+                    default=False
+                )
+            ]),
+            permission=PermissionLevel.READ,
+            category="multimodal"
+        ),
+        "capture_camera": dict(
+            name="capture_camera",
+            description="Capture a photo from the camera",
+            schema=ToolSchema(parameters=[
+                ToolParameter(
+                    name="analyze",
+                    type=ParameterType.BOOLEAN,
+                    description="Whether to analyze the image with vision",
+                    required=False,
+                    default=False
+                )
+            ]),
+            permission=PermissionLevel.READ,
+            category="multimodal"
+        ),
+        "schedule_task": dict(
+            name="schedule_task",
+            description="Schedule a task to run at a specific time or interval",
+            schema=ToolSchema(parameters=[
+                ToolParameter(
+                    name="name",
+                    type=ParameterType.STRING,
+                    description="Name of the scheduled task",
+                    required=True
+                ),
+                ToolParameter(
+                    name="action",
+                    type=ParameterType.STRING,
+                    description="Command to execute when triggered",
+                    required=True
+                ),
+                ToolParameter(
+                    name="hour",
+                    type=ParameterType.INTEGER,
+                    description="Hour to execute (0-23)",
+                    required=False
+                ),
+                ToolParameter(
+                    name="minute",
+                    type=ParameterType.INTEGER,
+                    description="Minute to execute (0-59)",
+                    required=False,
+                    default=0
+                ),
+                ToolParameter(
+                    name="interval_seconds",
+                    type=ParameterType.INTEGER,
+                    description="Interval in seconds (for repeating tasks)",
+                    required=False
+                )
+            ]),
+            permission=PermissionLevel.EXECUTE,
+            category="automation"
+        ),
+        "list_scheduled_tasks": dict(
+            name="list_scheduled_tasks",
+            description="List all scheduled tasks",
+            schema=ToolSchema(parameters=[]),
+            permission=PermissionLevel.READ,
+            category="automation"
+        ),
+    }
+    return _MULTIMODAL_TOOL_DEFINITIONS
 
 # ==============================================================================
 # Phase 2 Config (LLM Planning)
 # ==============================================================================
 
-@dataclass 
+@dataclass(slots=True)
 class Phase2Config(OrchestratorConfig):
     """Configuration for Phase 2 orchestrator (LLM planning)."""
     mode: str = "deterministic"  # deterministic | llm
@@ -42,13 +173,14 @@ class Phase2Config(OrchestratorConfig):
 # Phase 3 Config (Memory)
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Phase3Config(Phase2Config):
     """Configuration for Phase 3 orchestrator (memory + preferences)."""
     # Memory settings
     max_conversation_turns: int = 20
     max_memory_tokens: int = 4000
     context_window_tokens: int = 8000
+    context_top_k: int = 8  # Older turns retrieved by relevance when history is over budget
     
     # Preference settings
     preferences_path: str = "preferences.yaml"
@@ -56,13 +188,17 @@ class Phase3Config(Phase2Config):
     # Feature flags
     enable_memory: bool = True
     enable_preferences: bool = True
+    
+    # Conversation persistence (appends each turn's memory to SQLite)
+    persist_memory: bool = False
+    database_path: str = "jarvis.db"
 
 
 # ==============================================================================
 # Phase 4 Config (Multimodal)
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Phase4Config(Phase3Config):
     """Configuration for Phase 4 orchestrator (multimodal capabilities)."""
     # Multimodal settings
@@ -95,37 +231,57 @@ class Phase2Orchestrator(Orchestrator):
         self._llm_planner = None
         self._error_handler = ErrorHandler()
         
+        # Tool names, cached per tool registry version
+        self._tool_names_cache: List[str] = []
+        self._tool_names_version = -1
+        
+        # Tool names last given to the planner (see _push_tool_schemas)
+        self._planner_tools_key: Optional[frozenset] = None
+        
+        # Runs of independent read-only tool calls (threads start on first submit)
+        self._tool_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jarvis-tool")
+        
         self._logger = logging.getLogger("jarvis.orchestrator.phase2")
     
     def initialize(self) -> None:
         """Initialize all subsystems including Phase 2 components."""
         super().initialize()
         
-        self._logger.info("Initializing Phase 2 components...")
-        
-        from tools.registry import create_default_tools
-        from tools.executor import ToolExecutor
-        
-        self._tool_registry = create_default_tools()
-        self._logger.info(f"Tool registry loaded: {len(self._tool_registry)} tools")
-        
-        self._tool_executor = ToolExecutor(
-            self._tool_registry,
-            config_path="config/permissions.yaml"
-        )
-        self._logger.info("Tool executor initialized")
-        
         if self.phase2_config.mode == "llm":
             self._init_llm_planner()
         
-        self._logger.info(f"Phase 2 initialized (mode: {self.phase2_config.mode})")
+        self._logger.info("Phase 2 initialized (mode: %s)", self.phase2_config.mode)
+    
+    @property
+    def tool_registry(self):
+        """Tool registry, created on first use."""
+        if self._tool_registry is None:
+            from tools.registry import create_default_tools
+            
+            self._tool_registry = create_default_tools()
+            self._logger.info("Tool registry loaded: %d tools", len(self._tool_registry))
+        return self._tool_registry
+    
+    @property
+    def tool_executor(self):
+        """Tool executor, created on first use."""
+        if self._tool_executor is None:
+            from tools.executor import ToolExecutor
+            
+            self._tool_executor = ToolExecutor(
+                self.tool_registry,
+                config_path="config/permissions.yaml"
+            )
+            self._logger.info("Tool executor initialized")
+        return self._tool_executor
     
     def _init_llm_planner(self) -> None:
         """Initialize the LLM planner."""
         from planner import LLMPlanner, PlannerConfig
         from planner.llm_planner import MockLLMPlanner
         
-        schemas = self._tool_registry.get_schemas_for_llm()
+        schemas = self.tool_registry.get_schemas_for_llm()
+        self._planner_tools_key = self._tools_key()
         
         if self.phase2_config.use_mock_llm:
             self._llm_planner = MockLLMPlanner(tool_schemas=schemas)
@@ -136,7 +292,32 @@ class Phase2Orchestrator(Orchestrator):
                 model=self.phase2_config.llm_model
             )
             self._llm_planner = LLMPlanner(config=config, tool_schemas=schemas)
-            self._logger.info(f"LLM planner initialized ({config.model})")
+            self._logger.info("LLM planner initialized (%s)", config.model)
+    
+    def _tools_key(self) -> frozenset:
+        """Names of the registered tools, identifying the planner's tool set."""
+        return frozenset(tool.name for tool in self.tool_registry.list_tools())
+    
+    def _push_tool_schemas(self) -> bool:
+        """
+        Give the planner the current tool schemas, if the tool set changed.
+        
+        Re-registering tools under the same names (as every Phase 4
+        initialize() does) is not a change, so the schemas are not rebuilt.
+        Returns True if the planner was updated.
+        """
+        if self._llm_planner is None:
+            return False
+        
+        key = self._tools_key()
+        if key == self._planner_tools_key:
+            return False
+        
+        schemas = self.tool_registry.get_schemas_for_llm()
+        self._llm_planner.set_tool_schemas(schemas)
+        self._planner_tools_key = key
+        self._logger.info("Updated planner with %d tools", len(schemas))
+        return True
     
     def set_mode(self, mode: str) -> None:
         """Switch between deterministic and LLM mode."""
@@ -148,7 +329,7 @@ class Phase2Orchestrator(Orchestrator):
         if mode == "llm" and self._llm_planner is None:
             self._init_llm_planner()
         
-        self._logger.info(f"Switched to {mode} mode")
+        self._logger.info("Switched to %s mode", mode)
     
     def _process_text(self, text: str) -> Optional[str]:
         """Process text using appropriate mode."""
@@ -159,13 +340,13 @@ class Phase2Orchestrator(Orchestrator):
     
     def _process_with_llm(self, text: str) -> Optional[str]:
         """Process text using LLM-based planning."""
-        self._state_machine.transition(State.PLANNING, "LLM planning")
+        self._state_machine.transition(State.PLANNING, _REASON_LLM_PLANNING)
         
-        try:
+        with self._llm_error_to_result() as failure:
             plan = self._llm_planner.plan(text)
             
             if not plan.is_valid:
-                self._logger.warning(f"Invalid plan: {plan.error}")
+                self._logger.warning("Invalid plan: %s", plan.error)
                 error = create_llm_error(
                     plan.error or "Invalid plan",
                     is_hallucination=plan.status.name == "UNKNOWN_TOOL"
@@ -173,7 +354,7 @@ class Phase2Orchestrator(Orchestrator):
                 return self._handle_error(error)
             
             if not plan.requires_tools:
-                self._state_machine.transition(State.RESPONDING, "Direct response")
+                self._state_machine.transition(State.RESPONDING, _REASON_DIRECT)
                 self._output_result(CommandResult(
                     success=True,
                     command_id="llm.response",
@@ -181,28 +362,30 @@ class Phase2Orchestrator(Orchestrator):
                 ))
                 return plan.response_text
             
-            self._state_machine.transition(State.EXECUTING, "Executing tools")
+            self._state_machine.transition(State.EXECUTING, _REASON_TOOLS)
             
-            results = []
-            for tool_call in plan.tool_calls:
-                result = self._execute_tool_call(tool_call)
-                results.append(result)
-                
+            # Single pass: stop at the first failure, collect outputs otherwise
+            outputs = []
+            tool_names = []
+            failed = None
+            for tool_call, result in self._run_tool_calls(plan.tool_calls):
                 if not result.success:
+                    failed = result
                     break
+                outputs.append(str(result.output))
+                tool_names.append(tool_call.tool_name)
             
-            self._state_machine.transition(State.RESPONDING, "Execution complete")
+            self._state_machine.transition(State.RESPONDING, _REASON_EXEC_DONE)
             
-            if all(r.success for r in results):
-                output = "\n".join(str(r.output) for r in results)
+            if failed is None:
+                output = "\n".join(outputs)
                 self._output_result(CommandResult(
                     success=True,
-                    command_id=",".join(tc.tool_name for tc in plan.tool_calls),
+                    command_id=",".join(tool_names),
                     output=output
                 ))
                 return output
             else:
-                failed = next(r for r in results if not r.success)
                 self._output_result(CommandResult(
                     success=False,
                     command_id=failed.tool_name,
@@ -210,35 +393,74 @@ class Phase2Orchestrator(Orchestrator):
                     error=failed.error
                 ))
                 return f"Error: {failed.error}"
-                
+        
+        return failure.output
+    
+    @contextmanager
+    def _llm_error_to_result(self) -> Iterator[types.SimpleNamespace]:
+        """
+        Route an exception in the block through _handle_error.
+        
+        The yielded namespace's `output` then holds the user-facing message
+        (it stays None if the block did not raise).
+        """
+        failure = types.SimpleNamespace(output=None)
+        try:
+            yield failure
         except Exception as e:
-            self._logger.error(f"LLM processing error: {e}")
+            self._logger.error("LLM processing error: %s", e)
             error = JARVISError.from_exception(e, ErrorCategory.LLM_FAILURE)
-            return self._handle_error(error)
+            failure.output = self._handle_error(error)
+    
+    def _run_tool_calls(self, tool_calls) -> Iterator[Tuple[Any, Any]]:
+        """
+        Execute a plan's tool calls, yielding (tool_call, result) in plan order.
+        
+        Consecutive calls that are independent and read-only run together on
+        the tool pool; anything else runs alone, after the calls before it.
+        Stops after the first failed result, so no later side-effecting tool
+        runs (read-only calls in the same run may already have executed).
+        """
+        i = 0
+        while i < len(tool_calls):
+            j = i + 1
+            if self._is_parallel_safe(tool_calls[i]):
+                while j < len(tool_calls) and self._is_parallel_safe(tool_calls[j]):
+                    j += 1
+            
+            run = tool_calls[i:j]
+            if len(run) == 1:
+                results = [self._execute_tool_call(run[0])]
+            else:
+                results = self._tool_pool.map(self._execute_tool_call, run)
+            
+            for tool_call, result in zip(run, results):
+                yield tool_call, result
+                if not result.success:
+                    self._logger.warning("Tool failed: %s", result.error)
+                    return
+            i = j
+    
+    def _is_parallel_safe(self, tool_call) -> bool:
+        """Whether a call may overlap its neighbours: independent and READ-only."""
+        if not tool_call.independent:
+            return False
+        tool = self.tool_registry.get(tool_call.tool_name)
+        return tool is not None and tool.permission is PermissionLevel.READ
     
     def _execute_tool_call(self, tool_call) -> Any:
-        """Execute a single tool call with error handling."""
-        self._logger.info(f"Executing tool: {tool_call.tool_name}")
-        
-        result = self._tool_executor.execute(
+        """Execute a single tool call (the executor logs and audits it)."""
+        return self.tool_executor.execute(
             tool_call.tool_name,
             tool_call.arguments
         )
-        
-        if result.success:
-            self._logger.info(f"Tool result: {result.output}")
-        else:
-            self._logger.warning(f"Tool failed: {result.error}")
-        
-        return result
     
     def _handle_error(self, error: JARVISError) -> str:
         """Handle an error and return user message."""
         message = self._error_handler.handle(error)
         
-        if self._state_machine.state != State.IDLE:
-            self._state_machine.transition(State.ERROR, error.message)
-            self._state_machine.transition(State.IDLE, "Recovered from error")
+        if self._state_machine.state is not State.IDLE:
+            self._state_machine.recover(error.message)
         
         self._output_result(CommandResult(
             success=False,
@@ -249,21 +471,27 @@ class Phase2Orchestrator(Orchestrator):
         
         return message
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> OrchestratorStatus:
         """Get enhanced status including Phase 2 info."""
-        status = super().get_status()
-        status.update({
-            "mode": self.phase2_config.mode,
-            "tools_loaded": len(self._tool_registry) if self._tool_registry else 0,
-            "llm_ready": self._llm_planner is not None,
-        })
-        return status
+        return replace(
+            super().get_status(),
+            mode=self.phase2_config.mode,
+            tools_loaded=len(self._tool_registry) if self._tool_registry else 0,
+            llm_ready=self._llm_planner is not None,
+        )
+    
+    def shutdown(self) -> None:
+        """Shutdown all subsystems, including the tool pool."""
+        self._tool_pool.shutdown(wait=False, cancel_futures=True)
+        super().shutdown()
     
     def get_available_tools(self) -> List[str]:
         """Get list of available tool names."""
-        if self._tool_registry:
-            return [t.name for t in self._tool_registry.list_tools()]
-        return []
+        registry = self.tool_registry
+        if self._tool_names_version != registry.version:
+            self._tool_names_cache = [t.name for t in registry.list_tools()]
+            self._tool_names_version = registry.version
+        return list(self._tool_names_cache)
 
 
 # ==============================================================================
@@ -297,16 +525,25 @@ class Phase3Orchestrator(Phase2Orchestrator):
         
         self._logger.info("Initializing Phase 3 components...")
         
-        from memory import ConversationMemory, PreferenceStore, ContextManager
+        if ConversationMemory is None:
+            raise ImportError("Phase 3 requires the memory package")
         
         if self.phase3_config.enable_memory:
+            store = None
+            if self.phase3_config.persist_memory:
+                from infra.database import DatabaseManager
+                
+                store = DatabaseManager(self.phase3_config.database_path)
+                store.initialize()
+            
             self._memory = ConversationMemory(
                 max_turns=self.phase3_config.max_conversation_turns,
-                max_tokens=self.phase3_config.max_memory_tokens
+                max_tokens=self.phase3_config.max_memory_tokens,
+                store=store
             )
             self._logger.info(
-                f"Conversation memory initialized "
-                f"(max {self.phase3_config.max_conversation_turns} turns)"
+                "Conversation memory initialized (max %d turns)",
+                self.phase3_config.max_conversation_turns
             )
         
         if self.phase3_config.enable_preferences:
@@ -325,10 +562,26 @@ class Phase3Orchestrator(Phase2Orchestrator):
         self._logger.info("Phase 3 initialized")
     
     def _process_with_llm(self, text: str) -> Optional[str]:
-        """Process text using LLM with memory context."""
-        self._state_machine.transition(State.PLANNING, "LLM planning")
-        
+        """Process text using LLM with memory context, then persist the turn's memory."""
         try:
+            return self._process_with_memory(text)
+        finally:
+            self._flush_memory()
+    
+    def _flush_memory(self) -> None:
+        """Write this orchestration's turns to the store, if persisting."""
+        if self._memory is None:
+            return
+        try:
+            self._memory.flush()
+        except Exception as e:
+            self._logger.warning("Could not persist conversation turns: %s", e)
+    
+    def _process_with_memory(self, text: str) -> Optional[str]:
+        """Plan and execute with memory context (see _process_with_llm)."""
+        self._state_machine.transition(State.PLANNING, _REASON_LLM_PLANNING)
+        
+        with self._llm_error_to_result() as failure:
             if self._memory is not None:
                 self._memory.add_user_turn(text)
             
@@ -336,7 +589,7 @@ class Phase3Orchestrator(Phase2Orchestrator):
             plan = self._llm_planner.plan(text, context=context)
             
             if not plan.is_valid:
-                self._logger.warning(f"Invalid plan: {plan.error}")
+                self._logger.warning("Invalid plan: %s", plan.error)
                 error = create_llm_error(
                     plan.error or "Invalid plan",
                     is_hallucination=plan.status.name == "UNKNOWN_TOOL"
@@ -349,7 +602,7 @@ class Phase3Orchestrator(Phase2Orchestrator):
                 if self._memory is not None:
                     self._memory.add_assistant_turn(response)
                 
-                self._state_machine.transition(State.RESPONDING, "Direct response")
+                self._state_machine.transition(State.RESPONDING, _REASON_DIRECT)
                 self._output_result(CommandResult(
                     success=True,
                     command_id="llm.response",
@@ -357,39 +610,39 @@ class Phase3Orchestrator(Phase2Orchestrator):
                 ))
                 return response
             
-            self._state_machine.transition(State.EXECUTING, "Executing tools")
+            self._state_machine.transition(State.EXECUTING, _REASON_TOOLS)
             
-            results = []
-            for tool_call in plan.tool_calls:
-                result = self._execute_tool_call(tool_call)
-                results.append(result)
-                
-                if self._memory is not None and result.success:
-                    self._memory.add_tool_turn(
-                        tool_call.tool_name,
-                        tool_call.arguments,
-                        result.output
-                    )
-                
+            # Single pass: stop at the first failure, collect outputs otherwise
+            outputs = []
+            tool_names = []
+            tool_results = []
+            failed = None
+            for tool_call, result in self._run_tool_calls(plan.tool_calls):
                 if not result.success:
+                    failed = result
                     break
+                
+                tool_results.append((tool_call.tool_name, tool_call.arguments, result.output))
+                outputs.append(str(result.output))
+                tool_names.append(tool_call.tool_name)
             
-            self._state_machine.transition(State.RESPONDING, "Execution complete")
+            self._state_machine.transition(State.RESPONDING, _REASON_EXEC_DONE)
             
-            if all(r.success for r in results):
-                output = "\n".join(str(r.output) for r in results)
-                
-                if self._memory is not None:
-                    self._memory.add_assistant_turn(f"Result: {output}")
-                
+            # One join; memory, the result and the caller share this string
+            output = "\n".join(outputs) if failed is None else None
+            
+            if self._memory is not None:
+                # Tool turns and the response are tokenized in one batch
+                self._memory.add_tool_turns(tool_results, response=output)
+            
+            if failed is None:
                 self._output_result(CommandResult(
                     success=True,
-                    command_id=",".join(tc.tool_name for tc in plan.tool_calls),
+                    command_id=",".join(tool_names),
                     output=output
                 ))
                 return output
             else:
-                failed = next(r for r in results if not r.success)
                 self._output_result(CommandResult(
                     success=False,
                     command_id=failed.tool_name,
@@ -397,37 +650,39 @@ class Phase3Orchestrator(Phase2Orchestrator):
                     error=failed.error
                 ))
                 return f"Error: {failed.error}"
-                
-        except Exception as e:
-            self._logger.error(f"LLM processing error: {e}")
-            error = JARVISError.from_exception(e, ErrorCategory.LLM_FAILURE)
-            return self._handle_error(error)
+        
+        return failure.output
     
     def _build_llm_context(self, current_input: str) -> Optional[str]:
-        """Build context string for LLM from memory."""
+        """Build context string for LLM from the memory turns most relevant to the input."""
         if not self._context_manager:
             return None
         
         if self._memory and len(self._memory) > 0:
-            return self._memory.get_context_string()
+            return self._memory.get_relevant_context(
+                current_input,
+                max_tokens=min(self._context_manager.HISTORY_BUDGET,
+                               self.phase3_config.context_window_tokens),
+                top_k=self.phase3_config.context_top_k
+            ) or None
         
         return None
     
     def get_preference(self, key: str, default: Any = None) -> Any:
         """Get a user preference."""
-        if self._preferences:
+        if self._preferences is not None:
             return self._preferences.get(key, default)
         return default
     
     def set_preference(self, key: str, value: Any) -> None:
         """Set a user preference (explicit update only)."""
-        if self._preferences:
+        if self._preferences is not None:
             self._preferences.set(key, value)
-            self._logger.info(f"Preference set: {key} = {value}")
+            self._logger.info("Preference set: %s = %s", key, value)
     
     def list_preferences(self) -> Dict[str, Any]:
         """List all preferences."""
-        if self._preferences:
+        if self._preferences is not None:
             return self._preferences.list_all()
         return {}
     
@@ -448,8 +703,8 @@ class Phase3Orchestrator(Phase2Orchestrator):
                 "estimated_tokens": self._memory.total_tokens,
             })
         
-        if self._preferences:
-            stats["preferences_count"] = len(self._preferences.list_all())
+        if self._preferences is not None:
+            stats["preferences_count"] = len(self._preferences)
         
         return stats
     
@@ -457,7 +712,7 @@ class Phase3Orchestrator(Phase2Orchestrator):
         """Clear conversation memory."""
         if self._memory:
             count = self._memory.clear()
-            self._logger.info(f"Cleared {count} turns from memory")
+            self._logger.info("Cleared %d turns from memory", count)
             return count
         return 0
     
@@ -467,15 +722,21 @@ class Phase3Orchestrator(Phase2Orchestrator):
             return self._memory.summarize()
         return "No conversation history."
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> OrchestratorStatus:
         """Get enhanced status including Phase 3 info."""
-        status = super().get_status()
-        status.update({
-            "memory_enabled": self._memory is not None,
-            "memory_turns": len(self._memory) if self._memory else 0,
-            "preferences_enabled": self._preferences is not None,
-        })
-        return status
+        return replace(
+            super().get_status(),
+            memory_enabled=self._memory is not None,
+            memory_turns=len(self._memory) if self._memory else 0,
+            preferences_enabled=self._preferences is not None,
+        )
+    
+    def shutdown(self) -> None:
+        """Shutdown all subsystems, persisting any unsaved memory first."""
+        self._flush_memory()
+        if self._memory is not None and self._memory.store is not None:
+            self._memory.store.close()
+        super().shutdown()
 
 
 # ==============================================================================
@@ -511,12 +772,16 @@ class Phase4Orchestrator(Phase3Orchestrator):
     
     def _initialize_phase4(self) -> None:
         """Initialize Phase 4 multimodal components."""
+        global _ScreenRegion
+        
         self._logger.info("Initializing Phase 4 components...")
         
         from multimodal.screenshot import ScreenCapture, ScreenAnalyzer, ScreenRegion
         from multimodal.camera import CameraCapture, CameraAnalyzer, OPENCV_AVAILABLE
         from multimodal.events import EventManager
         
+        _ScreenRegion = ScreenRegion
+        
         if self.phase4_config.enable_screenshot:
             self._screen_capture = ScreenCapture(
                 output_dir=self.phase4_config.screenshot_dir
@@ -525,16 +790,14 @@ class Phase4Orchestrator(Phase3Orchestrator):
             self._logger.info("Screenshot capture initialized")
         
         if self.phase4_config.enable_camera:
-            try:
-                from multimodal.camera import OPENCV_AVAILABLE
-                if OPENCV_AVAILABLE:
-                    self._camera_capture = CameraCapture(
-                        camera_id=self.phase4_config.camera_id,
-                        output_dir=self.phase4_config.camera_dir
-                    )
-                    self._camera_analyzer = CameraAnalyzer()
-                    self._logger.info("Camera support enabled")
-            except ImportError:
+            if OPENCV_AVAILABLE:
+                self._camera_capture = CameraCapture(
+                    camera_id=self.phase4_config.camera_id,
+                    output_dir=self.phase4_config.camera_dir
+                )
+                self._camera_analyzer = CameraAnalyzer()
+                self._logger.info("Camera support enabled")
+            else:
                 self._logger.warning("Camera support unavailable (opencv not installed)")
         
         if self.phase4_config.enable_scheduling:
@@ -544,113 +807,37 @@ class Phase4Orchestrator(Phase3Orchestrator):
         
         self._register_multimodal_tools()
         
-        if hasattr(self, '_llm_planner') and self._llm_planner and hasattr(self, '_tool_registry'):
-            schemas = self._tool_registry.get_schemas_for_llm()
-            self._llm_planner.set_tool_schemas(schemas)
-            self._logger.info(f"Updated planner with {len(schemas)} tools")
+        self._push_tool_schemas()
         
         self._logger.info("Phase 4 initialized")
     
     def _register_multimodal_tools(self) -> None:
         """Register actual executors for multimodal tools."""
-        if not hasattr(self, '_tool_registry') or self._tool_registry is None:
+        if not hasattr(self, '_tool_registry'):
             return
         
-        from tools.registry import Tool, ToolSchema, ToolParameter, ParameterType, PermissionLevel
-        from multimodal.screenshot import ScreenRegion
+        registry = self.tool_registry
+        
+        from tools.registry import Tool
+        
+        definitions = _multimodal_tool_definitions()
         
         if self._screen_capture:
-            self._tool_registry.register(Tool(
-                name="take_screenshot",
-                description="Capture a screenshot of the screen",
-                schema=ToolSchema(parameters=[
-                    ToolParameter(
-                        name="region",
-                        type=ParameterType.STRING,
-                        description="Screen region: 'full' or 'x,y,width,height'",
-                        required=False,
-                        default="full"
-                    ),
-                    ToolParameter(
-                        name="analyze",
-                        type=ParameterType.BOOLEAN,
-                        description="Whether to analyze the screenshot with vision",
-                        required=False,
-                        default=False
-                    )
-                ]),
-                permission=PermissionLevel.READ,
-                executor=self._execute_screenshot,
-                category="multimodal"
+            registry.register(Tool(
+                executor=self._execute_screenshot, **definitions["take_screenshot"]
             ))
         
         if self._camera_capture:
-            self._tool_registry.register(Tool(
-                name="capture_camera",
-                description="Capture a photo from the camera",
-                schema=ToolSchema(parameters=[
-                    ToolParameter(
-                        name="analyze",
-                        type=ParameterType.BOOLEAN,
-                        description="Whether to analyze the image with vision",
-                        required=False,
-                        default=False
-                    )
-                ]),
-                permission=PermissionLevel.READ,
-                executor=self._execute_camera,
-                category="multimodal"
+            registry.register(Tool(
+                executor=self._execute_camera, **definitions["capture_camera"]
             ))
         
         if self._event_manager:
-            self._tool_registry.register(Tool(
-                name="schedule_task",
-                description="Schedule a task to run at a specific time or interval",
-                schema=ToolSchema(parameters=[
-                    ToolParameter(
-                        name="name",
-                        type=ParameterType.STRING,
-                        description="Name of the scheduled task",
-                        required=True
-                    ),
-                    ToolParameter(
-                        name="action",
-                        type=ParameterType.STRING,
-                        description="Command to execute when triggered",
-                        required=True
-                    ),
-                    ToolParameter(
-                        name="hour",
-                        type=ParameterType.INTEGER,
-                        description="Hour to execute (0-23)",
-                        required=False
-                    ),
-                    ToolParameter(
-                        name="minute",
-                        type=ParameterType.INTEGER,
-                        description="Minute to execute (0-59)",
-                        required=False,
-                        default=0
-                    ),
-                    ToolParameter(
-                        name="interval_seconds",
-                        type=ParameterType.INTEGER,
-                        description="Interval in seconds (for repeating tasks)",
-                        required=False
-                    )
-                ]),
-                permission=PermissionLevel.EXECUTE,
-                executor=self._execute_schedule,
-                category="automation"
+            registry.register(Tool(
+                executor=self._execute_schedule, **definitions["schedule_task"]
             ))
-            
-            self._tool_registry.register(Tool(
-                name="list_scheduled_tasks",
-                description="List all scheduled tasks",
-                schema=ToolSchema(parameters=[]),
-                permission=PermissionLevel.READ,
-                executor=self._execute_list_tasks,
-                category="automation"
+            registry.register(Tool(
+                executor=self._execute_list_tasks, **definitions["list_scheduled_tasks"]
             ))
     
     def _execute_screenshot(self, args: Dict[str, Any]) -> str:
@@ -658,8 +845,6 @@ class Phase4Orchestrator(Phase3Orchestrator):
         if not self._screen_capture:
             return "Screenshot capture not available"
         
-        from multimodal.screenshot import ScreenRegion
-        
         region_str = args.get("region", "full")
         analyze = args.get("analyze", False)
         
@@ -668,7 +853,7 @@ class Phase4Orchestrator(Phase3Orchestrator):
             try:
                 parts = [int(x) for x in region_str.split(",")]
                 if len(parts) == 4:
-                    region = ScreenRegion(x=parts[0], y=parts[1], width=parts[2], height=parts[3])
+                    region = _ScreenRegion(x=parts[0], y=parts[1], width=parts[2], height=parts[3])
             except ValueError:
                 pass
         
@@ -746,10 +931,14 @@ class Phase4Orchestrator(Phase3Orchestrator):
         if not tasks:
             return "No scheduled tasks"
         
-        lines = ["Scheduled tasks:"]
+        # Recurring tasks often share a next run time; format each time once
+        times: Dict[Any, str] = {None: "N/A"}
+        lines = [_TASKS_HEADER]
         for task in tasks:
-            next_run = task.next_run.strftime("%H:%M:%S") if task.next_run else "N/A"
-            lines.append(f"  - {task.name} ({task.id}): {task.state.name}, next: {next_run}")
+            next_run = times.get(task.next_run)
+            if next_run is None:
+                next_run = times[task.next_run] = task.next_run.strftime("%H:%M:%S")
+            lines.append(_TASK_LINE % (task.name, task.id, task.state.name, next_run))
         
         return "\n".join(lines)
     
@@ -757,18 +946,15 @@ class Phase4Orchestrator(Phase3Orchestrator):
         """Process text command directly (for scheduled tasks)."""
         return self._process_with_llm(text)
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> OrchestratorStatus:
         """Get comprehensive status including multimodal."""
-        status = super().get_status()
-        
-        status.update({
-            "screenshot_enabled": self._screen_capture is not None,
-            "camera_enabled": self._camera_capture is not None,
-            "scheduling_enabled": self._event_manager is not None,
-            "scheduled_tasks": len(self._event_manager.list_tasks()) if self._event_manager else 0,
-        })
-        
-        return status
+        return replace(
+            super().get_status(),
+            screenshot_enabled=self._screen_capture is not None,
+            camera_enabled=self._camera_capture is not None,
+            scheduling_enabled=self._event_manager is not None,
+            scheduled_tasks=len(self._event_manager.list_tasks()) if self._event_manager else 0,
+        )
     
     def shutdown(self) -> None:
         """Shutdown all subsystems."""
@@ -787,28 +973,27 @@ class Phase4Orchestrator(Phase3Orchestrator):
 # Startup Enforcement
 # ==============================================================================
 
-def _enforce_no_legacy_orchestrators() -> None:
+_LEGACY_ORCHESTRATORS = frozenset({"orchestrator_v2.py", "orchestrator_v3.py"})
+
+
+def _enforce_no_legacy_orchestrators(core_dir: Optional[Path] = None) -> None:
     """
     v0.5.1 Enforcement: Legacy orchestrator files must not exist.
     
-    Hard fail if orchestrator_v2.py or orchestrator_v3.py exist.
+    Hard fail if orchestrator_v2.py or orchestrator_v3.py exist. One
+    directory listing covers both names, instead of a stat per file.
     """
-    import os
+    core_dir = core_dir or Path(__file__).parent
     
-    core_dir = Path(__file__).parent
+    with os.scandir(core_dir) as entries:
+        found = sorted(e.name for e in entries if e.name in _LEGACY_ORCHESTRATORS)
     
-    legacy_files = [
-        core_dir / "orchestrator_v2.py",
-        core_dir / "orchestrator_v3.py",
-    ]
-    
-    for legacy in legacy_files:
-        if legacy.exists():
-            raise RuntimeError(
-                f"FATAL: Legacy orchestrator file found: {legacy}\n"
-                f"v0.5.1 requires single unified orchestrator.\n"
-                f"Delete legacy files: orchestrator_v2.py, orchestrator_v3.py"
-            )
+    if found:
+        raise RuntimeError(
+            f"FATAL: Legacy orchestrator file found: {core_dir / found[0]}\n"
+            f"v0.5.1 requires single unified orchestrator.\n"
+            f"Delete legacy files: orchestrator_v2.py, orchestrator_v3.py"
+        )
 
 
 # Run enforcement on import
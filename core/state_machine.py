@@ -7,11 +7,16 @@ All state transitions are logged and auditable.
 Exit Criterion: You can log every state transition.
 """
 
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Callable, Dict, List, Optional, Set
+from itertools import islice
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Tuple, Union
 import logging
+import sys
+import time
 
 
 class State(Enum):
@@ -25,14 +30,78 @@ class State(Enum):
     ERROR = auto()         # Error state
 
 
-@dataclass
+# A transition reason: a string, or a zero-argument callable producing one
+Reason = Union[str, Callable[[], str]]
+
+# Default recover() reason, interned so history records share one object
+REASON_RECOVERED = sys.intern("Recovered from error")
+
+# Wall-clock/monotonic baseline for turning StateTransition.ts_ns into a time
+_EPOCH_WALL_NS = time.time_ns()
+_EPOCH_MONO_NS = time.monotonic_ns()
+
+
+@dataclass(slots=True, init=False)
 class StateTransition:
-    """Record of a state transition."""
+    """
+    Record of a state transition.
+    
+    Constructed as StateTransition(from_state, to_state, timestamp, reason,
+    metadata). The reason may be a zero-argument callable, formatted when
+    `reason` is first read. StateMachine passes ts_ns (a
+    time.monotonic_ns() value) instead of a timestamp, and the wall-clock
+    `timestamp` is then only built when read. Slotted: one is kept per
+    history entry.
+    """
     from_state: State
     to_state: State
-    timestamp: datetime
-    reason: str
+    ts_ns: int
+    _reason: Reason = field(repr=False)
     metadata: Dict = field(default_factory=dict)
+    _timestamp: Optional[datetime] = field(default=None, repr=False, compare=False)
+    
+    def __init__(
+        self,
+        from_state: State,
+        to_state: State,
+        timestamp: Optional[datetime] = None,
+        reason: Reason = "",
+        metadata: Optional[Dict] = None,
+        *,
+        ts_ns: Optional[int] = None,
+    ):
+        self.from_state = from_state
+        self.to_state = to_state
+        self._reason = reason
+        self.metadata = {} if metadata is None else metadata
+        self._timestamp = timestamp
+        if ts_ns is None:
+            if timestamp is None:
+                ts_ns = time.monotonic_ns()
+            else:
+                ts_ns = _EPOCH_MONO_NS + int(timestamp.timestamp() * 1e9) - _EPOCH_WALL_NS
+        self.ts_ns = ts_ns
+    
+    @property
+    def wall_seconds(self) -> float:
+        """Wall-clock time of the transition, in seconds since the epoch."""
+        return (_EPOCH_WALL_NS + self.ts_ns - _EPOCH_MONO_NS) / 1e9
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local wall-clock time of the transition."""
+        timestamp = self._timestamp
+        if timestamp is None:
+            timestamp = self._timestamp = datetime.fromtimestamp(self.wall_seconds)
+        return timestamp
+    
+    @property
+    def reason(self) -> str:
+        """Human-readable reason for the transition."""
+        reason = self._reason
+        if not isinstance(reason, str):
+            reason = self._reason = reason()
+        return reason
     
     def __repr__(self) -> str:
         return (
@@ -42,16 +111,62 @@ class StateTransition:
 
 
 # Define valid state transitions
-VALID_TRANSITIONS: Dict[State, Set[State]] = {
-    State.IDLE: {State.LISTENING, State.PLANNING, State.ERROR},  # PLANNING for text input bypass
-    State.LISTENING: {State.IDLE, State.TRANSCRIBING, State.ERROR},
-    State.TRANSCRIBING: {State.PLANNING, State.IDLE, State.ERROR},
-    State.PLANNING: {State.EXECUTING, State.RESPONDING, State.IDLE, State.ERROR},
-    State.EXECUTING: {State.RESPONDING, State.ERROR},
-    State.RESPONDING: {State.IDLE, State.LISTENING, State.ERROR},
-    State.ERROR: {State.IDLE},  # Can only recover to IDLE
+VALID_TRANSITIONS: Dict[State, FrozenSet[State]] = {
+    State.IDLE: frozenset({State.LISTENING, State.PLANNING, State.ERROR}),  # PLANNING for text input bypass
+    State.LISTENING: frozenset({State.IDLE, State.TRANSCRIBING, State.ERROR}),
+    State.TRANSCRIBING: frozenset({State.PLANNING, State.IDLE, State.ERROR}),
+    State.PLANNING: frozenset({State.EXECUTING, State.RESPONDING, State.IDLE, State.ERROR}),
+    State.EXECUTING: frozenset({State.RESPONDING, State.ERROR}),
+    State.RESPONDING: frozenset({State.IDLE, State.LISTENING, State.ERROR}),
+    State.ERROR: frozenset({State.IDLE}),  # Can only recover to IDLE
 }
 
+# The same table as bitmasks: _VALID_BITS[from.value] has bit to.value set
+_VALID_BITS: List[int] = [0] * (max(s.value for s in State) + 1)
+for _from, _targets in VALID_TRANSITIONS.items():
+    _VALID_BITS[_from.value] = sum(1 << t.value for t in _targets)
+del _from, _targets
+
+
+class HistoryView(Sequence):
+    """
+    Read-only sequence over a state machine's transition history.
+    
+    Indexing and slicing read the underlying deque directly, so the view
+    reflects later transitions; list() it for a stable snapshot.
+    """
+    
+    __slots__ = ("_items",)
+    
+    def __init__(self, items: Deque[StateTransition]):
+        self._items = items
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def __reversed__(self):
+        return reversed(self._items)
+    
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self._items[index]
+        
+        start, stop, step = index.indices(len(self._items))
+        if step == 1 and stop == len(self._items):
+            # Tail slice: walk back from the end only
+            tail = list(islice(reversed(self._items), max(0, stop - start)))
+            tail.reverse()
+            return tail
+        if step > 0:
+            return list(islice(self._items, start, stop, step))
+        return list(self._items)[index]
+    
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self._items)!r})"
+
 
 class StateMachine:
     """
@@ -64,14 +179,19 @@ class StateMachine:
     - Notify listeners of state changes
     """
     
+    # Transitions kept in history; older ones are dropped
+    MAX_HISTORY = 1024
+    
     def __init__(self, initial_state: State = State.IDLE):
         self._state = initial_state
-        self._history: List[StateTransition] = []
-        self._listeners: List[Callable[[StateTransition], None]] = []
+        self._history: Deque[StateTransition] = deque(maxlen=self.MAX_HISTORY)
+        # Rebuilt on add/remove; an empty tuple makes dispatch a no-op, and a
+        # listener may (un)register others without disturbing the loop
+        self._listeners: Tuple[Callable[[StateTransition], None], ...] = ()
         self._logger = logging.getLogger("jarvis.state")
         
         # Log initial state
-        self._logger.info(f"State machine initialized in state: {self._state.name}")
+        self._logger.info("State machine initialized in state: %s", self._state.name)
     
     @property
     def state(self) -> State:
@@ -79,19 +199,24 @@ class StateMachine:
         return self._state
     
     @property
-    def history(self) -> List[StateTransition]:
-        """Get transition history."""
-        return self._history.copy()
+    def history(self) -> "HistoryView":
+        """Read-only view of the last MAX_HISTORY transitions (not a copy)."""
+        return HistoryView(self._history)
+    
+    def recent_history(self, n: int) -> List[StateTransition]:
+        """Get the last n transitions, oldest first, without copying the rest."""
+        recent = list(islice(reversed(self._history), n))
+        recent.reverse()
+        return recent
     
     def can_transition(self, to_state: State) -> bool:
         """Check if transition to given state is valid."""
-        valid = VALID_TRANSITIONS.get(self._state, set())
-        return to_state in valid
+        return bool(_VALID_BITS[self._state.value] & (1 << to_state.value))
     
     def transition(
         self,
         to_state: State,
-        reason: str,
+        reason: Reason,
         metadata: Optional[Dict] = None
     ) -> StateTransition:
         """
@@ -99,7 +224,8 @@ class StateMachine:
         
         Args:
             to_state: Target state
-            reason: Human-readable reason for transition
+            reason: Human-readable reason for transition, or a callable
+                returning it (formatted only if logged or read)
             metadata: Optional additional data
         
         Returns:
@@ -109,7 +235,7 @@ class StateMachine:
             ValueError: If transition is not valid
         """
         if not self.can_transition(to_state):
-            valid = VALID_TRANSITIONS.get(self._state, set())
+            valid = VALID_TRANSITIONS.get(self._state, frozenset())
             valid_names = [s.name for s in valid]
             raise ValueError(
                 f"Invalid transition: {self._state.name} → {to_state.name}. "
@@ -118,11 +244,7 @@ class StateMachine:
         
         # Create transition record
         transition = StateTransition(
-            from_state=self._state,
-            to_state=to_state,
-            timestamp=datetime.now(),
-            reason=reason,
-            metadata=metadata or {}
+            self._state, to_state, None, reason, metadata or {}, ts_ns=time.monotonic_ns()
         )
         
         # Update state
@@ -133,26 +255,83 @@ class StateMachine:
         self._history.append(transition)
         
         # Log transition
-        self._logger.info(
-            f"State transition: {old_state.name} → {to_state.name} "
-            f"(reason: {reason})"
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "State transition: %s → %s (reason: %s)",
+                old_state.name, to_state.name, transition.reason
+            )
         
         # Notify listeners
+        if self._listeners:
+            self._notify(transition)
+        
+        return transition
+    
+    def recover(
+        self,
+        reason: Reason,
+        recovery_reason: Reason = REASON_RECOVERED,
+        metadata: Optional[Dict] = None
+    ) -> StateTransition:
+        """
+        Record an error and return to IDLE in one step.
+        
+        Equivalent to transition(ERROR, reason) followed by
+        transition(IDLE, recovery_reason): both records are kept in history
+        and sent to listeners, but the state moves straight to IDLE (ERROR
+        is never current) and a single log line covers the pair.
+        
+        Returns:
+            The ERROR → IDLE StateTransition record
+        
+        Raises:
+            ValueError: If ERROR is not reachable from the current state
+        """
+        old_state = self._state
+        if old_state is not State.ERROR:
+            if not self.can_transition(State.ERROR):
+                raise ValueError(
+                    f"Invalid transition: {old_state.name} → {State.ERROR.name}"
+                )
+        
+        now = time.monotonic_ns()
+        records = [
+            StateTransition(State.ERROR, State.IDLE, None, recovery_reason, metadata or {}, ts_ns=now)
+        ]
+        if old_state is not State.ERROR:
+            records.insert(0, StateTransition(
+                old_state, State.ERROR, None, reason, metadata or {}, ts_ns=now
+            ))
+        
+        self._state = State.IDLE
+        self._history.extend(records)
+        
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "State transition: %s → ERROR → IDLE (reason: %s; %s)",
+                old_state.name, records[0].reason, records[-1].reason
+            )
+        
+        if self._listeners:
+            for transition in records:
+                self._notify(transition)
+        
+        return records[-1]
+    
+    def _notify(self, transition: StateTransition) -> None:
+        """Call each listener; a failing listener does not stop the others."""
         for listener in self._listeners:
             try:
                 listener(transition)
             except Exception as e:
-                self._logger.warning(f"Listener error: {e}")
-        
-        return transition
+                self._logger.warning("Listener error: %s", e)
     
     def add_listener(
         self,
         callback: Callable[[StateTransition], None]
     ) -> None:
         """Add a state change listener."""
-        self._listeners.append(callback)
+        self._listeners = self._listeners + (callback,)
     
     def remove_listener(
         self,
@@ -160,22 +339,14 @@ class StateMachine:
     ) -> None:
         """Remove a state change listener."""
         if callback in self._listeners:
-            self._listeners.remove(callback)
+            listeners = list(self._listeners)
+            listeners.remove(callback)
+            self._listeners = tuple(listeners)
     
     def reset(self, reason: str = "Manual reset") -> None:
-        """Reset to IDLE state."""
-        if self._state != State.IDLE:
-            # Force transition to ERROR then IDLE if needed
-            if self._state != State.ERROR:
-                self._state = State.ERROR
-                self._history.append(StateTransition(
-                    from_state=self._state,
-                    to_state=State.ERROR,
-                    timestamp=datetime.now(),
-                    reason=f"Reset initiated: {reason}"
-                ))
-            
-            self.transition(State.IDLE, reason)
+        """Reset to IDLE state (via ERROR, recorded as one recover() step)."""
+        if self._state is not State.IDLE:
+            self.recover(f"Reset initiated: {reason}", reason)
     
     def is_busy(self) -> bool:
         """Check if system is in a busy state."""
@@ -188,9 +359,10 @@ class StateMachine:
         
         lines = ["State Transition History:", "-" * 40]
         
-        for t in self._history[-10:]:  # Last 10 transitions
+        for t in self.recent_history(10):
+            clock = time.strftime('%H:%M:%S', time.localtime(t.wall_seconds))
             lines.append(
-                f"  {t.timestamp.strftime('%H:%M:%S')} | "
+                f"  {clock} | "
                 f"{t.from_state.name:12} → {t.to_state.name:12} | "
                 f"{t.reason}"
             )
@@ -1,21 +1,46 @@
 # Infrastructure module - Internal service bus, TTS, Logging, and Database
 # FastAPI for internal communication, TTS for voice output
 
-from .service_bus import ServiceBus, create_app
-from .tts_engine import TTSEngine, TTSConfig, Voice, TTSBackend
-from .security_config import (
-    SecurityManager, SecretManager, ConfigManager,
-    SecurityPolicy, SecurityLevel, SecurityAuditLog
-)
-from .logging import (
-    get_logger, configure_logging, TurnContext,
-    log_turn_end, get_turn_id, generate_turn_id
-)
-from .database import (
-    DatabaseManager, Conversation, Turn, Memory, ScheduledTask,
-    DatabaseError, SchemaMismatchError, MigrationFailedError,
-    SCHEMA_VERSION
-)
+# Submodules are imported on first attribute access (PEP 562), so importing
+# infra for get_logger does not load FastAPI, the TTS backends or sqlite.
+
+import importlib
+
+_LAZY = {
+    name: module
+    for module, names in {
+        ".service_bus": ("ServiceBus", "create_app"),
+        ".tts_engine": ("TTSEngine", "TTSConfig", "Voice", "TTSBackend"),
+        ".security_config": (
+            "SecurityManager", "SecretManager", "ConfigManager",
+            "SecurityPolicy", "SecurityLevel", "SecurityAuditLog"
+        ),
+        ".logging": (
+            "get_logger", "configure_logging", "TurnContext",
+            "log_turn_end", "get_turn_id", "generate_turn_id"
+        ),
+        ".database": (
+            "DatabaseManager", "Conversation", "Turn", "Memory", "ScheduledTask",
+            "DatabaseError", "SchemaMismatchError", "MigrationFailedError",
+            "SCHEMA_VERSION"
+        ),
+    }.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Service Bus
@@ -15,21 +15,80 @@ Design:
 - HMAC chain for ordering integrity
 - Canonical JSON serialization for determinism
 - turn_id for full traceability
+- Merkle checkpoints over sealed blocks of entry hashes
 """
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+import contextlib
+import functools
 import hashlib
 import hmac
 import json
 import logging
 import os
 import sqlite3
+import threading
 import uuid
 
 
+# Canonical JSON for HMAC input: sorted keys, no whitespace, ASCII-escaped.
+# One shared encoder (json.dumps builds a new one per call with these options)
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+# The payload's top-level keys are fixed, so their sorted order is too; the
+# template gives the same bytes as encoding the whole payload dict
+_PAYLOAD_TEMPLATE = (
+    '{"action":%s,"actor":%s,"details":%s,"event_type":%s,'
+    '"prev_hash":%s,"target":%s,"timestamp":%s,"turn_id":%s}'
+)
+
+
+def _format_payload(
+    action: Any, actor: Any, details_json: str, event_type: Any,
+    prev_hash: str, target: Optional[str], timestamp: str, turn_id: str
+) -> bytes:
+    """HMAC input from field values (details_json already canonical)."""
+    encode = _CANONICAL_JSON.encode
+    return (_PAYLOAD_TEMPLATE % (
+        encode(action),
+        encode(actor),
+        details_json,
+        encode(event_type),
+        encode(prev_hash),
+        encode(target),
+        encode(timestamp),
+        encode(turn_id),
+    )).encode('utf-8')
+
+
+_CREATE_AUDIT_LOG = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        turn_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        actor TEXT NOT NULL,
+        action TEXT NOT NULL,
+        target TEXT,
+        details TEXT,
+        prev_hash BLOB,
+        entry_hash BLOB NOT NULL
+    )
+"""
+
+_INSERT_SQL = """
+    INSERT INTO audit_log
+    (turn_id, timestamp, event_type, actor, action, target, details, prev_hash, entry_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class EventType(str, Enum):
     """Audit event types."""
     TURN_START = "TURN_START"
@@ -55,7 +114,103 @@ class Actor(str, Enum):
     SYSTEM = "system"
 
 
-@dataclass
+def _merkle_root(hashes: List[bytes]) -> bytes:
+    """Binary SHA-256 Merkle root; an odd node is paired with itself."""
+    sha256 = hashlib.sha256
+    level = hashes
+    while len(level) > 1:
+        if len(level) % 2:
+            level = level + level[-1:]
+        level = [sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0]
+
+
+def _hex(value: Any) -> str:
+    """Stored hash column -> the hex form used by the API and the payload."""
+    if isinstance(value, bytes):
+        return value.hex()
+    # NULL, or a non-BLOB value written around the API; the latter can
+    # never equal a computed digest, so verification still flags it
+    return value or ""
+
+
+def _unhex(value: Any) -> Any:
+    """Hex TEXT hash -> raw digest, for migrating pre-BLOB databases."""
+    if isinstance(value, str):
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            return value  # Not a hash we wrote; left for verify_chain to flag
+    return value
+
+
+# Row columns that go into the signed payload, in _stored_payload's order
+_PAYLOAD_COLUMNS = (
+    "action", "actor", "details", "event_type", "prev_hash", "target", "timestamp", "turn_id",
+)
+
+
+def _stored_payload(
+    action: str, actor: str, details: Optional[str], event_type: str,
+    prev_hash: Any, target: Optional[str], timestamp: str, turn_id: str
+) -> bytes:
+    """
+    Canonical payload of a stored row.
+    
+    The stored timestamp, event_type and actor are the exact strings that
+    were signed, so they are used as they are; details is parsed and
+    re-encoded canonically, as in AuditEntry.from_row.
+    """
+    if details:
+        try:
+            parsed = json.loads(details)
+        except json.JSONDecodeError:
+            parsed = {"_raw": details}
+    else:
+        parsed = None
+    
+    return _format_payload(
+        action, actor, _CANONICAL_JSON.encode(parsed), event_type,
+        _hex(prev_hash), target, timestamp, turn_id,
+    )
+
+
+def _hash_stored_rows(key: bytes, rows: List[Tuple]) -> List[bytes]:
+    """
+    HMAC digests of stored rows, given as _PAYLOAD_COLUMNS tuples.
+    
+    Runs in verify_chain's worker processes, so it only takes picklable
+    arguments.
+    """
+    template = hmac.new(key, digestmod=hashlib.sha256)
+    digests = []
+    for values in rows:
+        h = template.copy()
+        h.update(_stored_payload(*values))
+        digests.append(h.digest())
+    return digests
+
+
+@functools.lru_cache(maxsize=1)
+def _machine_key() -> bytes:
+    """
+    Key derived from machine ID, computed once per process.
+    
+    platform.node()/machine() can shell out on some systems. The
+    environment key is not cached here, so setting JARVIS_AUDIT_KEY
+    still takes effect for later logs.
+    """
+    import platform
+    machine_id = f"{platform.node()}-{platform.machine()}-jarvis-audit"
+    return hashlib.sha256(machine_id.encode()).digest()
+
+
+# Stored value -> member, for from_row (a dict hit is cheaper than Enum(value))
+_EVENT_TYPES: Dict[str, EventType] = {e.value: e for e in EventType}
+_ACTORS: Dict[str, Actor] = {a.value: a for a in Actor}
+
+
+@dataclass(slots=True)
 class AuditEntry:
     """
     A single audit log entry.
@@ -65,6 +220,9 @@ class AuditEntry:
     - Event details (type, actor, action, target)
     - prev_hash for chain integrity
     - entry_hash (HMAC) for tamper detection
+    
+    Slotted, since reads build one per row; not frozen, because log_many
+    fills in the chain fields after construction.
     """
     id: Optional[int] = None  # Database ID
     turn_id: str = ""
@@ -77,14 +235,24 @@ class AuditEntry:
     prev_hash: str = ""
     entry_hash: str = ""
     
+    # Canonical JSON of details, when already encoded for storage
+    _details_json: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Accept stored strings, but hold members so .value is always safe
+        if type(self.event_type) is not EventType:
+            self.event_type = EventType(self.event_type)
+        if type(self.actor) is not Actor:
+            self.actor = Actor(self.actor)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize for storage."""
         return {
             "id": self.id,
             "turn_id": self.turn_id,
             "timestamp": self.timestamp.isoformat(),
-            "event_type": self.event_type.value if isinstance(self.event_type, EventType) else self.event_type,
-            "actor": self.actor.value if isinstance(self.actor, Actor) else self.actor,
+            "event_type": self.event_type.value,
+            "actor": self.actor.value,
             "action": self.action,
             "target": self.target,
             "details": json.dumps(self.details, sort_keys=True) if self.details else None,
@@ -106,17 +274,18 @@ class AuditEntry:
             id=row["id"],
             turn_id=row["turn_id"],
             timestamp=datetime.fromisoformat(row["timestamp"]),
-            event_type=EventType(row["event_type"]),
-            actor=Actor(row["actor"]),
+            # Unknown values fall through to the Enum call, which raises ValueError
+            event_type=_EVENT_TYPES.get(row["event_type"]) or EventType(row["event_type"]),
+            actor=_ACTORS.get(row["actor"]) or Actor(row["actor"]),
             action=row["action"],
             target=row["target"],
             details=details,
-            prev_hash=row["prev_hash"] or "",
-            entry_hash=row["entry_hash"],
+            prev_hash=_hex(row["prev_hash"]),
+            entry_hash=_hex(row["entry_hash"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifyResult:
     """Result of chain verification."""
     valid: bool
@@ -139,10 +308,23 @@ class AuditLog:
     Trust Boundary:
     - Tamper-evident assuming HMAC key is secret
     - Key stored in environment, never in database
+    
+    Hashes are stored as raw 32-byte BLOBs; everything outside the table
+    (entries, return values, the signed payload) uses their hex form.
     """
     
     # Genesis hash for first entry
     GENESIS_HASH = "0" * 64
+    _GENESIS_DIGEST = bytes(32)
+    
+    # Entries per Merkle checkpoint block
+    CHECKPOINT_BLOCK = 1024
+    
+    # verify_chain hashes in worker processes from this many entries up,
+    # in chunks of VERIFY_CHUNK rows
+    PARALLEL_VERIFY_MIN = 50_000
+    VERIFY_CHUNK = 10_000
+    VERIFY_WORKERS = os.cpu_count() or 1
     
     def __init__(self, db_path: str = "jarvis.db", key: Optional[bytes] = None):
         self._db_path = db_path
@@ -150,10 +332,37 @@ class AuditLog:
         
         # HMAC key management
         self._key = key or self._load_key()
+        # Keyed state set up once; each hash clones it (see _hmac)
+        self._hmac_template = hmac.new(self._key, digestmod=hashlib.sha256)
+        
+        # One write connection for the log's lifetime, shared by all
+        # threads; the lock keeps each append's statements together on it.
+        # Reads use a read-only connection per thread (see _reader)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._verify_pool: Optional[ProcessPoolExecutor] = None  # Started on first use
+        self._pool_lock = threading.Lock()
         
         # Initialize schema
         self._ensure_schema()
     
+    def close(self) -> None:
+        """Close the database connections and any verification workers."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            for reader in self._readers:
+                reader.close()
+            self._readers = []
+            self._local = threading.local()
+            with self._pool_lock:
+                if self._verify_pool is not None:
+                    self._verify_pool.shutdown(cancel_futures=True)
+                    self._verify_pool = None
+    
     def _load_key(self) -> bytes:
         """
         Load HMAC key from environment or derive from machine ID.
@@ -171,28 +380,67 @@ class AuditLog:
         # Fallback: derive from machine ID
         # This is NOT cryptographically strong, but provides
         # machine-specific determinism for testing/development
-        import platform
-        machine_id = f"{platform.node()}-{platform.machine()}-jarvis-audit"
-        return hashlib.sha256(machine_id.encode()).digest()
+        return _machine_key()
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a connection to the audit database, in autocommit mode.
+        
+        Only log() opens a write transaction, explicitly. journal_mode=WAL
+        is persistent in the database file and is set by _ensure_schema;
+        synchronous and the cache settings are per connection.
+        """
+        if read_only:
+            database, uri = Path(self._db_path).absolute().as_uri() + "?mode=ro", True
+        else:
+            database, uri = self._db_path, False
+        conn = sqlite3.connect(
+            database, check_same_thread=False, isolation_level=None, uri=uri
+        )
+        conn.row_factory = sqlite3.Row
+        # With WAL, NORMAL only syncs at checkpoints (still crash-safe)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+        return conn
+    
+    @contextlib.contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        This thread's read-only connection, inside one read transaction.
+        
+        Scans and exports run without self._lock, so under WAL appends are
+        not blocked behind them, and the transaction gives each read a
+        consistent snapshot. An in-memory database is private to its
+        connection, so there reads share the writer under the lock.
+        """
+        if self._db_path == ":memory:":
+            with self._lock:
+                yield self._conn
+            return
+        
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect(read_only=True)
+            with self._lock:
+                self._readers.append(conn)
+        
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
     
     def _ensure_schema(self) -> None:
         """Create audit_log table if not exists."""
-        conn = sqlite3.connect(self._db_path)
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS audit_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    turn_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    actor TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    target TEXT,
-                    details TEXT,
-                    prev_hash TEXT,
-                    entry_hash TEXT NOT NULL
-                )
-            """)
+        with self._lock:
+            conn = self._conn
+            if self._db_path != ":memory:":
+                # Readers (verify_chain, exports) no longer block on appends
+                conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(_CREATE_AUDIT_LOG.format(table="audit_log"))
+            self._migrate_hash_columns(conn)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_audit_turn_id 
                 ON audit_log(turn_id)
@@ -201,12 +449,58 @@ class AuditLog:
                 CREATE INDEX IF NOT EXISTS idx_audit_timestamp 
                 ON audit_log(timestamp)
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS audit_checkpoints (
+                    block_id INTEGER PRIMARY KEY,
+                    last_entry_id INTEGER NOT NULL,
+                    merkle_root TEXT NOT NULL
+                )
+            """)
             conn.commit()
             self._logger.debug("Audit log schema ensured")
-        finally:
-            conn.close()
     
-    def _canonical_payload(self, entry: AuditEntry, prev_hash: str) -> bytes:
+    def _migrate_hash_columns(self, conn: sqlite3.Connection) -> None:
+        """
+        Rewrite a pre-BLOB audit_log (hex TEXT hashes) in place.
+        
+        Ids and all other columns are copied unchanged, so the chain and
+        any checkpoints still verify. Runs once; the indexes are
+        recreated by _ensure_schema afterwards.
+        """
+        def hash_type() -> str:
+            for column in conn.execute("PRAGMA table_info(audit_log)"):
+                if column["name"] == "entry_hash":
+                    return column["type"].upper()
+            return ""
+        
+        if hash_type() != "TEXT":
+            return
+        
+        conn.create_function("audit_unhex", 1, _unhex, deterministic=True)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if hash_type() == "TEXT":  # Another process may have won the race
+                conn.execute(_CREATE_AUDIT_LOG.format(table="audit_log_blob"))
+                conn.execute("""
+                    INSERT INTO audit_log_blob
+                    SELECT id, turn_id, timestamp, event_type, actor, action, target,
+                           details, audit_unhex(prev_hash), audit_unhex(entry_hash)
+                    FROM audit_log ORDER BY id
+                """)
+                conn.execute("DROP TABLE audit_log")
+                conn.execute("ALTER TABLE audit_log_blob RENAME TO audit_log")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        self._logger.info("Audit log hashes migrated to BLOB storage")
+    
+    def _canonical_payload(
+        self,
+        entry: AuditEntry,
+        prev_hash: str,
+        timestamp_iso: Optional[str] = None,
+    ) -> bytes:
         """
         Canonical serialization for HMAC input.
         
@@ -214,31 +508,118 @@ class AuditLog:
         - Fixed field order
         - JSON with sorted keys for details
         - Explicit UTF-8 encoding
+        
+        timestamp_iso may be passed when the caller has already formatted
+        entry.timestamp for storage.
         """
-        payload = {
-            "prev_hash": prev_hash,
-            "turn_id": entry.turn_id,
-            "timestamp": entry.timestamp.isoformat(),
-            "event_type": entry.event_type.value if isinstance(entry.event_type, EventType) else entry.event_type,
-            "actor": entry.actor.value if isinstance(entry.actor, Actor) else entry.actor,
-            "action": entry.action,
-            "target": entry.target,
-            "details": entry.details,
-        }
-        return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        details_json = entry._details_json
+        if details_json is None:
+            details_json = _CANONICAL_JSON.encode(entry.details)
+        
+        return _format_payload(
+            entry.action,
+            entry.actor.value,
+            details_json,
+            entry.event_type.value,
+            prev_hash,
+            entry.target,
+            timestamp_iso or entry.timestamp.isoformat(),
+            entry.turn_id,
+        )
     
-    def _compute_hash(self, entry: AuditEntry, prev_hash: str) -> str:
-        """Compute HMAC-SHA256 for entry."""
-        payload = self._canonical_payload(entry, prev_hash)
-        return hmac.new(self._key, payload, hashlib.sha256).hexdigest()
+    def _hmac(self, payload: bytes) -> bytes:
+        """
+        HMAC-SHA256 digest of payload.
+        
+        Clones the keyed template instead of starting from the key, so the
+        inner/outer key blocks are not rehashed for every entry. The
+        template is only copied, never updated, so threads can share it.
+        """
+        h = self._hmac_template.copy()
+        h.update(payload)
+        return h.digest()
+    
+    def _compute_hash(
+        self,
+        entry: AuditEntry,
+        prev_hash: str,
+        timestamp_iso: Optional[str] = None,
+    ) -> bytes:
+        """Compute the HMAC-SHA256 digest for entry."""
+        return self._hmac(self._canonical_payload(entry, prev_hash, timestamp_iso))
+    
+    def _row_hash(self, row: sqlite3.Row) -> bytes:
+        """
+        Recompute a stored row's HMAC without building an AuditEntry.
+        
+        See _stored_payload for how the row maps to the signed payload.
+        """
+        return self._hmac(_stored_payload(
+            row["action"], row["actor"], row["details"], row["event_type"],
+            row["prev_hash"], row["target"], row["timestamp"], row["turn_id"],
+        ))
+    
+    def _block_root(self, entry_hashes: List[Any]) -> Optional[str]:
+        """
+        Keyed Merkle root of a block's stored entry hashes, as hex.
+        
+        The tree is built over the raw 32-byte digests; the root is then
+        HMAC'd so a checkpoint cannot be forged without the key. Returns
+        None if a stored hash is not a BLOB (it has been tampered with).
+        """
+        for h in entry_hashes:
+            if type(h) is not bytes:
+                return None
+        return self._hmac(_merkle_root(entry_hashes)).hex()
+    
+    def _seal_checkpoints(self, conn: sqlite3.Connection) -> None:
+        """
+        Write a checkpoint for each block completed since the last one.
+        
+        Called inside log_many's transaction. A block is the next
+        CHECKPOINT_BLOCK entries after the previous checkpoint's last entry.
+        """
+        block_size = self.CHECKPOINT_BLOCK
+        row = conn.execute(
+            "SELECT block_id, last_entry_id FROM audit_checkpoints ORDER BY block_id DESC LIMIT 1"
+        ).fetchone()
+        block_id, last_entry_id = (row[0], row[1]) if row else (0, 0)
+        
+        # ids are AUTOINCREMENT, so nothing can be complete before this
+        if conn.execute("SELECT last_insert_rowid()").fetchone()[0] - last_entry_id < block_size:
+            return
+        
+        while True:
+            rows = conn.execute(
+                "SELECT id, entry_hash FROM audit_log WHERE id > ? ORDER BY id LIMIT ?",
+                (last_entry_id, block_size)
+            ).fetchall()
+            if len(rows) < block_size:
+                return
+            block_id += 1
+            last_entry_id = rows[-1][0]
+            merkle_root = self._block_root([r[1] for r in rows])
+            if merkle_root is None:
+                # A tampered hash must not stop appends: seal a root that no
+                # computed one can equal, so verify_checkpoints flags the block
+                self._logger.warning(
+                    "Audit checkpoint %d sealed as broken: non-BLOB entry_hash before entry %d",
+                    block_id, last_entry_id
+                )
+                merkle_root = ""
+            conn.execute(
+                "INSERT INTO audit_checkpoints (block_id, last_entry_id, merkle_root) VALUES (?, ?, ?)",
+                (block_id, last_entry_id, merkle_root)
+            )
+            self._logger.debug("Audit checkpoint %d sealed at entry %d", block_id, last_entry_id)
     
-    def _get_last_hash(self, conn: sqlite3.Connection) -> str:
-        """Get the hash of the last entry, or genesis hash."""
+    def _get_last_hash(self, conn: sqlite3.Connection) -> Any:
+        """Get the stored hash of the last entry, or the genesis digest."""
         cursor = conn.execute(
             "SELECT entry_hash FROM audit_log ORDER BY id DESC LIMIT 1"
         )
         row = cursor.fetchone()
-        return row[0] if row else self.GENESIS_HASH
+        return row[0] if row else self._GENESIS_DIGEST
     
     def log(
         self,
@@ -254,7 +635,19 @@ class AuditLog:
         
         Returns the entry_hash.
         """
-        entry = AuditEntry(
+        return self.log_many([(event_type, actor, action, turn_id, target, details)])[0]
+    
+    @staticmethod
+    def _new_entry(
+        event_type: EventType,
+        actor: Actor,
+        action: str,
+        turn_id: str,
+        target: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> AuditEntry:
+        """Build an unchained entry stamped with the current time."""
+        return AuditEntry(
             turn_id=turn_id,
             timestamp=datetime.now(timezone.utc),
             event_type=event_type,
@@ -263,59 +656,77 @@ class AuditLog:
             target=target,
             details=details,
         )
+    
+    def log_many(self, events: Iterable[Tuple]) -> List[str]:
+        """
+        Append several entries in one transaction.
         
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            # Get previous hash (must be atomic with insert)
-            prev_hash = self._get_last_hash(conn)
-            entry.prev_hash = prev_hash
-            
-            # Compute entry hash
-            entry.entry_hash = self._compute_hash(entry, prev_hash)
-            
-            # Insert
-            cursor = conn.execute("""
-                INSERT INTO audit_log 
-                (turn_id, timestamp, event_type, actor, action, target, details, prev_hash, entry_hash)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry.turn_id,
-                entry.timestamp.isoformat(),
-                entry.event_type.value if isinstance(entry.event_type, EventType) else entry.event_type,
-                entry.actor.value if isinstance(entry.actor, Actor) else entry.actor,
-                entry.action,
-                entry.target,
-                json.dumps(entry.details, sort_keys=True) if entry.details else None,
-                entry.prev_hash,
-                entry.entry_hash,
-            ))
-            conn.commit()
-            
-            entry.id = cursor.lastrowid
-            
-            self._logger.debug(
-                f"Audit: {entry.event_type.value} | {entry.actor.value} | "
-                f"{entry.action} | turn={entry.turn_id[:8]}..."
-            )
-            
-            return entry.entry_hash
+        Each event is a tuple of log() arguments in order: (event_type,
+        actor, action, turn_id[, target[, details]]). The chain is computed
+        in Python from one read of the last hash, and all rows go in one
+        executemany, so a burst pays for a single commit.
+        
+        Returns the entry_hashes, in order.
+        """
+        entries = [self._new_entry(*event) for event in events]
+        if not entries:
+            return []
+        
+        with self._lock:
+            conn = self._conn
             
-        finally:
-            conn.close()
+            # Get previous hash (must be atomic with insert): take the write
+            # lock first, so another process cannot append in between
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                prev_digest = self._get_last_hash(conn)
+                prev_hash = _hex(prev_digest)
+                rows = []
+                for entry in entries:
+                    # Format once; the same strings are signed and stored
+                    timestamp_iso = entry.timestamp.isoformat()
+                    if entry.details:
+                        entry._details_json = _CANONICAL_JSON.encode(entry.details)
+                    entry.prev_hash = prev_hash
+                    digest = self._compute_hash(entry, prev_hash, timestamp_iso)
+                    entry.entry_hash = prev_hash = digest.hex()
+                    rows.append((
+                        entry.turn_id,
+                        timestamp_iso,
+                        entry.event_type.value,
+                        entry.actor.value,
+                        entry.action,
+                        entry.target,
+                        entry._details_json,
+                        prev_digest,
+                        digest,
+                    ))
+                    prev_digest = digest
+                
+                conn.executemany(_INSERT_SQL, rows)
+                self._seal_checkpoints(conn)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+        
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for entry in entries:
+                self._logger.debug(
+                    "Audit: %s | %s | %s | turn=%s...",
+                    entry.event_type.value, entry.actor.value, entry.action, entry.turn_id[:8]
+                )
+        
+        return [entry.entry_hash for entry in entries]
     
     def get_turn_trail(self, turn_id: str) -> List[AuditEntry]:
         """Get all entries for a specific turn."""
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._reader() as conn:
             cursor = conn.execute(
                 "SELECT * FROM audit_log WHERE turn_id = ? ORDER BY id",
                 (turn_id,)
             )
             return [AuditEntry.from_row(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
     
     def get_entries(
         self,
@@ -324,9 +735,7 @@ class AuditLog:
         limit: int = 1000
     ) -> List[AuditEntry]:
         """Get entries in a range."""
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._reader() as conn:
             if to_id:
                 cursor = conn.execute(
                     "SELECT * FROM audit_log WHERE id >= ? AND id <= ? ORDER BY id LIMIT ?",
@@ -338,8 +747,6 @@ class AuditLog:
                     (from_id, limit)
                 )
             return [AuditEntry.from_row(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
     
     def verify_chain(
         self,
@@ -353,10 +760,22 @@ class AuditLog:
         - valid: True if chain is intact
         - broken_at: Entry ID where chain broke (if any)
         """
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            # Get entries
+        with self._reader() as conn:
+            # Get hash before first entry
+            # Compared as stored (raw digests); hex only for the result
+            if from_id == 1:
+                expected_prev_hash = self._GENESIS_DIGEST
+            else:
+                prev_cursor = conn.execute(
+                    "SELECT entry_hash FROM audit_log WHERE id = ?",
+                    (from_id - 1,)
+                )
+                prev_row = prev_cursor.fetchone()
+                expected_prev_hash = prev_row[0] if prev_row else self._GENESIS_DIGEST
+            
+            # Stream the range in rowid order (id is the INTEGER PRIMARY KEY,
+            # so this is a range scan of the table itself); every column is
+            # needed to recompute the hash, so no index would be narrower
             if to_id:
                 cursor = conn.execute(
                     "SELECT * FROM audit_log WHERE id >= ? AND id <= ? ORDER BY id",
@@ -368,57 +787,130 @@ class AuditLog:
                     (from_id,)
                 )
             
-            entries = [AuditEntry.from_row(row) for row in cursor.fetchall()]
-            
-            if not entries:
-                return VerifyResult(valid=True, entries_checked=0)
-            
-            # Get hash before first entry
-            if from_id == 1:
-                expected_prev_hash = self.GENESIS_HASH
+            # Recompute hashes in worker processes for large ranges (ids
+            # are AUTOINCREMENT, so the id span bounds the row count)
+            last_id = to_id or conn.execute("SELECT MAX(id) FROM audit_log").fetchone()[0] or 0
+            if self.VERIFY_WORKERS > 1 and last_id - from_id + 1 >= self.PARALLEL_VERIFY_MIN:
+                hashed = self._hashed_rows_parallel(cursor)
             else:
-                prev_cursor = conn.execute(
-                    "SELECT entry_hash FROM audit_log WHERE id = ?",
-                    (from_id - 1,)
-                )
-                prev_row = prev_cursor.fetchone()
-                expected_prev_hash = prev_row[0] if prev_row else self.GENESIS_HASH
+                hashed = ((row, self._row_hash(row)) for row in cursor)
             
             # Verify each entry
-            for entry in entries:
-                # Check prev_hash matches expected
-                if entry.prev_hash != expected_prev_hash:
-                    return VerifyResult(
-                        valid=False,
-                        entries_checked=entries.index(entry),
-                        broken_at=entry.id,
-                        expected_hash=expected_prev_hash,
-                        actual_hash=entry.prev_hash,
-                        error=f"prev_hash mismatch at entry {entry.id}"
-                    )
-                
-                # Verify entry_hash
-                computed = self._compute_hash(entry, entry.prev_hash)
-                if entry.entry_hash != computed:
-                    return VerifyResult(
-                        valid=False,
-                        entries_checked=entries.index(entry),
-                        broken_at=entry.id,
-                        expected_hash=computed,
-                        actual_hash=entry.entry_hash,
-                        error=f"entry_hash mismatch at entry {entry.id}"
-                    )
-                
-                # Update expected for next iteration
-                expected_prev_hash = entry.entry_hash
+            checked = 0
+            with contextlib.closing(hashed):
+                for row, computed in hashed:
+                    entry_id = row["id"]
+                    prev_hash = row["prev_hash"]
+                    entry_hash = row["entry_hash"]
+                    
+                    # Check prev_hash matches expected
+                    if prev_hash != expected_prev_hash:
+                        return VerifyResult(
+                            valid=False,
+                            entries_checked=checked,
+                            broken_at=entry_id,
+                            expected_hash=_hex(expected_prev_hash),
+                            actual_hash=_hex(prev_hash),
+                            error=f"prev_hash mismatch at entry {entry_id}"
+                        )
+                    
+                    # Verify entry_hash
+                    if entry_hash != computed:
+                        return VerifyResult(
+                            valid=False,
+                            entries_checked=checked,
+                            broken_at=entry_id,
+                            expected_hash=computed.hex(),
+                            actual_hash=_hex(entry_hash),
+                            error=f"entry_hash mismatch at entry {entry_id}"
+                        )
+                    
+                    # Update expected for next iteration
+                    expected_prev_hash = entry_hash
+                    checked += 1
             
             return VerifyResult(
                 valid=True,
-                entries_checked=len(entries)
+                entries_checked=checked
             )
-            
+    
+    def _hashed_rows_parallel(
+        self, cursor: sqlite3.Cursor
+    ) -> Iterator[Tuple[sqlite3.Row, bytes]]:
+        """
+        Yield (row, recomputed digest) in order, hashing chunks in processes.
+        
+        Only the HMACs run in the pool; verify_chain still checks the
+        linkage sequentially. At most VERIFY_WORKERS + 1 chunks are in
+        flight, so memory stays bounded on any range.
+        """
+        # Not self._lock: an in-memory log's reader already holds it
+        with self._pool_lock:
+            pool = self._verify_pool
+            if pool is None:
+                pool = self._verify_pool = ProcessPoolExecutor(max_workers=self.VERIFY_WORKERS)
+        
+        pending: Deque[Tuple[List[sqlite3.Row], Future]] = deque()
+        try:
+            while True:
+                rows = cursor.fetchmany(self.VERIFY_CHUNK)
+                if rows:
+                    values = [tuple(row[c] for c in _PAYLOAD_COLUMNS) for row in rows]
+                    pending.append((rows, pool.submit(_hash_stored_rows, self._key, values)))
+                while pending and (not rows or len(pending) > self.VERIFY_WORKERS):
+                    done, future = pending.popleft()
+                    yield from zip(done, future.result())
+                if not rows:
+                    return
         finally:
-            conn.close()
+            # verify_chain stopped early (or failed): drop the queued chunks
+            for _, future in pending:
+                future.cancel()
+    
+    def verify_checkpoints(self) -> VerifyResult:
+        """
+        Verify sealed blocks against their Merkle checkpoints.
+        
+        Only the entry_hash column is read and only SHA-256 over digest
+        pairs is computed, so this is much cheaper than verify_chain. It
+        detects deleted, inserted, reordered or re-hashed entries inside
+        sealed blocks; an edit that leaves entry_hash alone is only found
+        by recomputing the HMACs, so on a mismatch (or for full assurance)
+        run verify_chain over the reported block.
+        
+        broken_at is the first entry id of the first mismatching block.
+        Entries after the last checkpoint are not covered.
+        """
+        with self._reader() as conn:
+            checkpoints = conn.execute(
+                "SELECT block_id, last_entry_id, merkle_root FROM audit_checkpoints ORDER BY block_id"
+            ).fetchall()
+            
+            checked = 0
+            prev_last_id = 0
+            for block_id, last_entry_id, merkle_root in checkpoints:
+                rows = conn.execute(
+                    "SELECT id, entry_hash FROM audit_log WHERE id > ? AND id <= ? ORDER BY id",
+                    (prev_last_id, last_entry_id)
+                ).fetchall()
+                computed = self._block_root([r[1] for r in rows]) if rows else None
+                if (
+                    len(rows) != self.CHECKPOINT_BLOCK
+                    or rows[-1][0] != last_entry_id
+                    or computed != merkle_root
+                ):
+                    return VerifyResult(
+                        valid=False,
+                        entries_checked=checked,
+                        broken_at=prev_last_id + 1,
+                        expected_hash=merkle_root,
+                        actual_hash=computed,
+                        error=f"checkpoint mismatch in block {block_id}"
+                    )
+                checked += len(rows)
+                prev_last_id = last_entry_id
+            
+            return VerifyResult(valid=True, entries_checked=checked)
     
     def export_for_review(
         self,
@@ -435,9 +927,26 @@ class AuditLog:
         
         Verification requires access to HMAC key.
         """
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        chunks: List[str] = []
+        self.write_export(chunks.append, start, end)
+        return "".join(chunks)
+    
+    def write_export(
+        self,
+        write: Callable[[str], Any],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> int:
+        """
+        Stream the export_for_review() bundle to write (e.g. a file's write).
+        
+        Rows are read and written one at a time. The output is the same as
+        json.dumps(bundle, indent=2, sort_keys=True): every metadata key
+        sorts after "entries", so it is known by the time it is written.
+        
+        Returns the number of entries written.
+        """
+        with self._reader() as conn:
             if start and end:
                 cursor = conn.execute(
                     "SELECT * FROM audit_log WHERE timestamp >= ? AND timestamp <= ? ORDER BY id",
@@ -446,30 +955,39 @@ class AuditLog:
             else:
                 cursor = conn.execute("SELECT * FROM audit_log ORDER BY id")
             
-            entries = [AuditEntry.from_row(row) for row in cursor.fetchall()]
-            
-            # Build export bundle
-            bundle = {
-                "version": "0.7.0",
-                "exported_at": datetime.now(timezone.utc).isoformat(),
-                "entry_count": len(entries),
-                "first_entry_id": entries[0].id if entries else None,
-                "last_entry_id": entries[-1].id if entries else None,
-                "final_hash": entries[-1].entry_hash if entries else None,
-                "key_id": hashlib.sha256(self._key).hexdigest()[:16],  # Key fingerprint only
-                "entries": [e.to_dict() for e in entries],
-            }
-            
-            return json.dumps(bundle, indent=2, sort_keys=True)
-            
-        finally:
-            conn.close()
+            count = 0
+            first = last = None
+            write('{\n  "entries": [')
+            for row in cursor:
+                entry = AuditEntry.from_row(row)
+                entry_json = json.dumps(entry.to_dict(), indent=2, sort_keys=True)
+                write(",\n    " if count else "\n    ")
+                write(entry_json.replace("\n", "\n    "))
+                if first is None:
+                    first = entry
+                last = entry
+                count += 1
+            write("\n  ]," if count else "],")
+        
+        # Remaining keys, in sorted order
+        metadata = {
+            "entry_count": count,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+            "final_hash": last.entry_hash if last else None,
+            "first_entry_id": first.id if first else None,
+            "key_id": hashlib.sha256(self._key).hexdigest()[:16],  # Key fingerprint only
+            "last_entry_id": last.id if last else None,
+            "version": "0.7.0",
+        }
+        write(",".join(
+            f"\n  {json.dumps(key)}: {json.dumps(value)}" for key, value in metadata.items()
+        ))
+        write("\n}")
+        return count
     
     def get_stats(self) -> Dict[str, Any]:
         """Get audit log statistics."""
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._reader() as conn:
             cursor = conn.execute("SELECT COUNT(*) as count FROM audit_log")
             count = cursor.fetchone()["count"]
             
@@ -483,8 +1001,6 @@ class AuditLog:
                 "first_entry": row["first"],
                 "last_entry": row["last"],
             }
-        finally:
-            conn.close()
 
 
 # Convenience function for quick logging
@@ -20,6 +20,7 @@ Usage:
     with db.transaction():
         db.save_conversation(conv)
         db.save_turn(turn)
+        db.save_turns(more_turns)  # One executemany for a batch
     
     # Read operations (no transaction needed)
     turns = db.get_turns(conversation_id)
@@ -32,7 +33,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Generator
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 from infra.logging import get_logger
 
@@ -43,6 +44,13 @@ SCHEMA_VERSION = 1
 MAX_TURNS_PER_CONVERSATION = 1000
 MAX_CONVERSATIONS = 100
 
+# One statement text for every turn insert, so sqlite3's per-connection
+# statement cache prepares it once
+_INSERT_TURN_SQL = """
+    INSERT OR REPLACE INTO turns (id, conversation_id, turn_id, role, content, timestamp, meta)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 @dataclass
 class Conversation:
@@ -140,6 +148,11 @@ class DatabaseManager:
         # Enable foreign keys
         self._conn.execute("PRAGMA foreign_keys = ON")
         
+        # Write-ahead log: appends don't rewrite pages in place, and with it
+        # synchronous=NORMAL only syncs at checkpoints (still crash-safe)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        
         # Check/create schema
         db_version = self._get_schema_version()
         
@@ -434,12 +447,10 @@ class DatabaseManager:
     
     # ===== Turn Operations =====
     
-    def save_turn(self, turn: Turn) -> None:
-        """Save a turn."""
-        self._conn.execute("""
-            INSERT OR REPLACE INTO turns (id, conversation_id, turn_id, role, content, timestamp, meta)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+    @staticmethod
+    def _turn_row(turn: Turn) -> Tuple:
+        """Column values for _INSERT_TURN_SQL."""
+        return (
             turn.id,
             turn.conversation_id,
             turn.turn_id,
@@ -447,7 +458,15 @@ class DatabaseManager:
             turn.content,
             turn.timestamp.isoformat(),
             json.dumps(turn.meta)
-        ))
+        )
+    
+    def save_turn(self, turn: Turn) -> None:
+        """Save a turn."""
+        self._conn.execute(_INSERT_TURN_SQL, self._turn_row(turn))
+    
+    def save_turns(self, turns: Iterable[Turn]) -> None:
+        """Save several turns with one executemany (use inside transaction())."""
+        self._conn.executemany(_INSERT_TURN_SQL, map(self._turn_row, turns))
     
     def get_turns(
         self,
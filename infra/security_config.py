@@ -22,7 +22,7 @@ import logging
 import os
 import secrets
 
-import yaml
+from .yaml_loader import load_yaml
 
 
 class SecurityLevel(Enum):
@@ -201,7 +201,7 @@ class ConfigManager:
         """Load configuration from file."""
         if self._config_path.exists():
             with open(self._config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = load_yaml(f) or {}
             self._logger.info(f"Loaded config from {self._config_path}")
         else:
             self._logger.warning(f"Config file not found: {self._config_path}")
@@ -50,7 +50,8 @@ def main():
         from core import Phase3Orchestrator, Phase3Config
         config = Phase3Config(
             mode="llm",
-            use_mock_llm=args.mock_llm or not args.llm
+            use_mock_llm=args.mock_llm or not args.llm,
+            preload_stt=False  # The bus only takes text
         )
         orchestrator = Phase3Orchestrator(config)
         console.print("[green]Using Phase 3 orchestrator with memory[/green]")
@@ -58,14 +59,15 @@ def main():
         from core import Phase2Orchestrator, Phase2Config
         config = Phase2Config(
             mode="llm",
-            use_mock_llm=args.mock_llm or not args.llm
+            use_mock_llm=args.mock_llm or not args.llm,
+            preload_stt=False
         )
         orchestrator = Phase2Orchestrator(config)
         console.print("[green]Using Phase 2 orchestrator[/green]")
     else:
         from core import Orchestrator
         from core.orchestrator import OrchestratorConfig
-        config = OrchestratorConfig()
+        config = OrchestratorConfig(preload_stt=False)
         orchestrator = Orchestrator(config)
         console.print("[yellow]Using Phase 1 orchestrator[/yellow]")
     
@@ -144,12 +144,12 @@ class ServiceBus:
             uptime = (datetime.now() - self._start_time).total_seconds()
             
             return StatusResponse(
-                state=status.get("state", "UNKNOWN"),
-                mode=status.get("mode", "deterministic"),
-                stt_loaded=status.get("stt_loaded", False),
-                commands_loaded=status.get("commands_loaded", 0),
-                tools_loaded=status.get("tools_loaded", 0),
-                memory_turns=status.get("memory_turns", 0),
+                state=status.state,
+                mode=status.mode or "deterministic",
+                stt_loaded=status.stt_loaded,
+                commands_loaded=status.commands_loaded,
+                tools_loaded=status.tools_loaded,
+                memory_turns=status.memory_turns,
                 uptime_seconds=uptime
             )
         
@@ -223,9 +223,7 @@ class ServiceBus:
             if not hasattr(self._orchestrator, '_tool_registry'):
                 raise HTTPException(status_code=400, detail="Tools not enabled")
             
-            registry = self._orchestrator._tool_registry
-            if not registry:
-                return []
+            registry = self._orchestrator.tool_registry
             
             tools = []
             for tool in registry.list_tools():
@@ -0,0 +1,22 @@
+"""
+YAML Loading
+------------
+One safe YAML loader for every config and registry file.
+
+Uses libyaml's C parser when PyYAML was built against it, and the
+pure-Python SafeLoader otherwise; both build the same plain data.
+"""
+
+from typing import IO, Any, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YAMLLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse one YAML document (like yaml.safe_load, with the fastest loader)."""
+    return yaml.load(stream, Loader=YAMLLoader)
@@ -98,13 +98,12 @@ def print_banner(mode: str = "deterministic", memory: bool = False) -> None:
 def print_status(orchestrator) -> None:
     """Print current system status."""
     status = orchestrator.get_status()
-    mode = status.get('mode', 'deterministic')
-    mode_str = f"Mode: {mode} | " if 'mode' in status else ""
-    tools_str = f"Tools: {status.get('tools_loaded', 0)} | " if 'tools_loaded' in status else ""
+    mode_str = f"Mode: {status.mode} | " if status.mode else ""  # Phase 2+ only
+    tools_str = f"Tools: {status.tools_loaded} | " if status.mode else ""
     
-    console.print(f"[dim]{mode_str}State: {status['state']} | "
-                  f"STT: {'✓' if status['stt_loaded'] else '○'} | "
-                  f"Commands: {status['commands_loaded']} | {tools_str.rstrip(' | ')}[/dim]")
+    console.print(f"[dim]{mode_str}State: {status.state} | "
+                  f"STT: {'✓' if status.stt_loaded else '○'} | "
+                  f"Commands: {status.commands_loaded} | {tools_str.rstrip(' | ')}[/dim]")
 
 
 def on_transcription(text: str, confidence: float) -> None:
@@ -366,6 +365,8 @@ def main() -> int:
         use_mock = args.mock_llm
         
         mode = "deterministic" if use_basic else "llm"
+        # Only push-to-talk needs the STT model; text sessions never load it
+        voice = not args.test and keyboard is not None
         
         # Create appropriate orchestrator
         if use_memory:
@@ -373,7 +374,8 @@ def main() -> int:
             config = Phase4Config(
                 config_path=args.config,
                 mode="llm",
-                use_mock_llm=use_mock
+                use_mock_llm=use_mock,
+                preload_stt=voice
             )
             orchestrator = Phase4Orchestrator(config)
             console.print(f"[green]JARVIS (Multimodal) - {'mock' if use_mock else 'Gemini'}[/green]")
@@ -382,13 +384,14 @@ def main() -> int:
             config = Phase2Config(
                 config_path=args.config,
                 mode="llm",
-                use_mock_llm=use_mock
+                use_mock_llm=use_mock,
+                preload_stt=voice
             )
             orchestrator = Phase2Orchestrator(config)
             console.print(f"[green]JARVIS LLM Mode ({'mock' if use_mock else 'Gemini'})[/green]")
         else:
             # Phase 1: Deterministic orchestrator (--basic flag)
-            config = OrchestratorConfig(config_path=args.config)
+            config = OrchestratorConfig(config_path=args.config, preload_stt=voice)
             orchestrator = Orchestrator(config)
             console.print("[yellow]JARVIS Basic Mode (deterministic only)[/yellow]")
         # Register callbacks
@@ -10,12 +10,88 @@ Rules:
 - No auto-learning
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import logging
+import re
+import zlib
+
+import numpy as np
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Turn embeddings for relevance retrieval: hashed bag of words, L2-normalised
+EMBEDDING_DIM = 256
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def embed_text(text: str) -> np.ndarray:
+    """
+    Embed text as a hashed bag of words (float32, unit length or zero).
+    
+    Local and dependency-free; similar wording gives similar vectors,
+    which is enough to rank a short conversation window.
+    """
+    vec = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for word in _WORD_RE.findall(text.lower()):
+        vec[zlib.crc32(word.encode()) % EMBEDDING_DIM] += 1.0
+    norm = np.linalg.norm(vec)
+    if norm:
+        vec /= norm
+    return vec
+
+
+# Token counting: tiktoken when installed and loadable, else ~4 chars per token
+TOKEN_ENCODING = "cl100k_base"
+_encoder = None
+_encoder_loaded = False
+
+
+def _get_encoder():
+    """
+    The shared tiktoken encoder, loaded on first use.
+    
+    get_encoding() downloads the BPE file the first time; if that fails
+    (e.g. offline) this returns None from then on and counts fall back
+    to the estimate, rather than failing every turn.
+    """
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        _encoder_loaded = True
+        if tiktoken is not None:
+            try:
+                _encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+            except Exception as e:
+                logging.getLogger("jarvis.memory.conversation").warning(
+                    "tiktoken encoding %s unavailable, estimating tokens: %s", TOKEN_ENCODING, e
+                )
+    return _encoder
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text (at least 1)."""
+    encoder = _get_encoder()
+    if encoder is None:
+        return max(1, len(text) // 4)
+    return max(1, len(encoder.encode(text, disallowed_special=())))
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """count_tokens() for several texts, encoded in one tiktoken batch call."""
+    encoder = _get_encoder()
+    if encoder is None:
+        return [max(1, len(text) // 4) for text in texts]
+    encoded = encoder.encode_batch(texts, disallowed_special=())
+    return [max(1, len(tokens)) for tokens in encoded]
 
 
 class TurnRole(Enum):
@@ -39,6 +115,16 @@ class ConversationTurn:
     tool_args: Optional[Dict] = None
     tool_result: Optional[Any] = None
     
+    _embedding: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _tokens: Optional[int] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def embedding(self) -> np.ndarray:
+        """Embedding of the content, computed on first use."""
+        if self._embedding is None:
+            self._embedding = embed_text(self.content)
+        return self._embedding
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         return {
@@ -67,11 +153,13 @@ class ConversationTurn:
     
     @property
     def token_estimate(self) -> int:
-        """Rough estimate of tokens (4 chars ≈ 1 token)."""
-        base = len(self.content) // 4
-        if self.tool_result:
-            base += len(str(self.tool_result)) // 4
-        return max(1, base)
+        """Tokens in content and tool result, counted on first use."""
+        if self._tokens is None:
+            tokens = count_tokens(self.content)
+            if self.tool_result:
+                tokens += count_tokens(str(self.tool_result))
+            self._tokens = tokens
+        return self._tokens
     
     def __repr__(self) -> str:
         preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
@@ -83,16 +171,25 @@ class ConversationMemory:
     """
     Short-term conversation memory.
     
-    - Fixed size (max_turns)
+    - Token budget (max_tokens), with max_turns as a hard cap
     - Explicit eviction (oldest first)
-    - Token budget enforcement
+    - Each turn is tokenized once; total_tokens is a running sum
+    
+    With a store (an infra.database.DatabaseManager), new turns are also
+    queued for persistence and appended to its turns table by flush(), in
+    one transaction per call; the window itself stays in memory.
     """
     
     max_turns: int = 20
     max_tokens: int = 4000  # Rough token budget
+    store: Optional[Any] = None  # DatabaseManager to append turns to
+    conversation_id: str = ""  # Created on first flush() if empty or unknown
     
     def __post_init__(self):
-        self._turns: List[ConversationTurn] = []
+        self._turns: deque[ConversationTurn] = deque()
+        self._total_tokens = 0
+        self._unsaved: List[ConversationTurn] = []  # Awaiting flush() to the store
+        self._conversation_ready = False
         self._logger = logging.getLogger("jarvis.memory.conversation")
     
     def add_user_turn(self, content: str, metadata: Optional[Dict] = None) -> ConversationTurn:
@@ -123,17 +220,55 @@ class ConversationMemory:
         metadata: Optional[Dict] = None
     ) -> ConversationTurn:
         """Add a tool execution result."""
-        content = f"Tool {tool_name} returned: {tool_result}"
-        turn = ConversationTurn(
+        turn = self._tool_turn(tool_name, tool_args, tool_result, metadata)
+        self._add_turn(turn)
+        return turn
+    
+    def add_tool_turns(
+        self,
+        tool_results: List[Tuple[str, Dict, Any]],
+        response: Optional[str] = None
+    ) -> List[ConversationTurn]:
+        """
+        Add (tool_name, tool_args, tool_result) turns, then the response.
+        
+        Same as add_tool_turn() per result followed by add_assistant_turn()
+        (skipped when response is None), but every turn is tokenized in one
+        batch.
+        """
+        turns = [self._tool_turn(*tool_result) for tool_result in tool_results]
+        if response is not None:
+            turns.append(ConversationTurn(role=TurnRole.ASSISTANT, content=response))
+        
+        texts = []
+        for turn in turns:
+            texts.append(turn.content)
+            if turn.tool_result:
+                texts.append(str(turn.tool_result))
+        counts = iter(count_tokens_batch(texts))
+        for turn in turns:
+            turn._tokens = next(counts)
+            if turn.tool_result:
+                turn._tokens += next(counts)
+            self._add_turn(turn)
+        return turns
+    
+    @staticmethod
+    def _tool_turn(
+        tool_name: str,
+        tool_args: Dict,
+        tool_result: Any,
+        metadata: Optional[Dict] = None
+    ) -> ConversationTurn:
+        """Build a tool turn (see add_tool_turn)."""
+        return ConversationTurn(
             role=TurnRole.TOOL,
-            content=content,
+            content=f"Tool {tool_name} returned: {tool_result}",
             tool_name=tool_name,
             tool_args=tool_args,
             tool_result=tool_result,
             metadata=metadata or {}
         )
-        self._add_turn(turn)
-        return turn
     
     def add_system_turn(self, content: str) -> ConversationTurn:
         """Add a system message."""
@@ -147,6 +282,9 @@ class ConversationMemory:
     def _add_turn(self, turn: ConversationTurn) -> None:
         """Add a turn and enforce limits."""
         self._turns.append(turn)
+        self._total_tokens += turn.token_estimate
+        if self.store is not None:
+            self._unsaved.append(turn)
         self._enforce_limits()
         self._logger.debug(f"Added turn: {turn.role.name}, total: {len(self._turns)}")
     
@@ -154,27 +292,35 @@ class ConversationMemory:
         """Enforce turn count and token limits."""
         # Remove oldest turns if exceeding max_turns
         while len(self._turns) > self.max_turns:
-            removed = self._turns.pop(0)
-            self._logger.debug(f"Evicted turn (count limit): {removed}")
+            removed = self._evict_oldest()
+            self._logger.debug("Evicted turn (count limit): %r", removed)
         
         # Remove oldest turns if exceeding token budget
-        while self.total_tokens > self.max_tokens and len(self._turns) > 1:
-            removed = self._turns.pop(0)
-            self._logger.debug(f"Evicted turn (token limit): {removed}")
+        while self._total_tokens > self.max_tokens and len(self._turns) > 1:
+            removed = self._evict_oldest()
+            self._logger.debug("Evicted turn (token limit): %r", removed)
+    
+    def _evict_oldest(self) -> ConversationTurn:
+        """Drop the oldest turn and its tokens from the running total."""
+        removed = self._turns.popleft()
+        self._total_tokens -= removed.token_estimate
+        return removed
     
     @property
     def total_tokens(self) -> int:
-        """Estimate total tokens in memory."""
-        return sum(turn.token_estimate for turn in self._turns)
+        """Total tokens in memory."""
+        return self._total_tokens
     
     @property
     def turns(self) -> List[ConversationTurn]:
         """Get all turns (read-only copy)."""
-        return self._turns.copy()
+        return list(self._turns)
     
     def get_recent_turns(self, n: int = 5) -> List[ConversationTurn]:
         """Get the N most recent turns."""
-        return self._turns[-n:] if n < len(self._turns) else self._turns.copy()
+        if n >= len(self._turns):
+            return list(self._turns)
+        return list(islice(self._turns, len(self._turns) - n, None))
     
     def get_user_turns(self) -> List[ConversationTurn]:
         """Get only user turns."""
@@ -196,6 +342,57 @@ class ConversationMemory:
             lines.append(f"{role}: {turn.content}")
         return "\n".join(lines)
     
+    def get_relevant_context(self, query: str, max_tokens: int, top_k: int = 8) -> str:
+        """
+        Context string from the recent exchange plus the turns most relevant to query.
+        
+        When the whole window fits in max_tokens it is returned as it is.
+        Otherwise the most recent exchange (from the previous user turn on,
+        so a follow-up keeps what it answers) is always kept, and up to
+        top_k older turns are added by cosine similarity to the query, ties
+        going to the newer turn. Turns are taken in that order while they
+        fit in max_tokens, and listed in conversation order in the
+        get_context_string() format.
+        """
+        turns = list(self._turns)
+        if not turns:
+            return ""
+        if self._total_tokens <= max_tokens:
+            return self.get_context_string()
+        
+        # Start of the recent exchange: the second-to-last user turn
+        recent_start = 0
+        user_turns_seen = 0
+        for i in range(len(turns) - 1, -1, -1):
+            if turns[i].role is TurnRole.USER:
+                user_turns_seen += 1
+                if user_turns_seen == 2:
+                    recent_start = i
+                    break
+        
+        older = recent_start
+        if older <= top_k:
+            # Few older turns: rank by recency
+            ranked = list(range(older - 1, -1, -1))
+        else:
+            sims = np.stack([turn.embedding for turn in turns[:older]]) @ embed_text(query)
+            # lexsort orders by the last key first: similarity, then recency
+            ranked = np.lexsort((-np.arange(older), -sims))[:top_k].tolist()
+        
+        chosen = []
+        total = 0
+        for i in [*range(len(turns) - 1, recent_start - 1, -1), *ranked]:
+            tokens = turns[i].token_estimate
+            if total + tokens > max_tokens:
+                continue
+            chosen.append(i)
+            total += tokens
+        
+        chosen.sort()
+        return "\n".join(
+            f"{turns[i].role.name.capitalize()}: {turns[i].content}" for i in chosen
+        )
+    
     def summarize(self) -> str:
         """
         Create a summary of the conversation.
@@ -221,17 +418,58 @@ class ConversationMemory:
         
         return " | ".join(summary_parts)
     
+    def flush(self) -> int:
+        """
+        Append turns added since the last flush to the store.
+        
+        All of them go in one executemany inside one transaction. Tool turns
+        are stored with role "assistant" (as in to_llm_messages) and the
+        tool name in meta; system turns are not persisted. On a database
+        error the turns stay queued for the next flush.
+        
+        Returns the number of turns written.
+        """
+        if self.store is None or not self._unsaved:
+            return 0
+        
+        from infra.database import Turn
+        
+        if not self._conversation_ready:
+            conversation = self.store.get_or_create_conversation(self.conversation_id or None)
+            self.conversation_id = conversation.id
+            self._conversation_ready = True
+        
+        rows = [
+            Turn(
+                conversation_id=self.conversation_id,
+                role="user" if turn.role is TurnRole.USER else "assistant",
+                content=turn.content,
+                timestamp=turn.timestamp,
+                meta={"tool_name": turn.tool_name} if turn.role is TurnRole.TOOL else {}
+            )
+            for turn in self._unsaved
+            if turn.role is not TurnRole.SYSTEM
+        ]
+        
+        with self.store.transaction():
+            self.store.save_turns(rows)
+        
+        self._unsaved = []
+        return len(rows)
+    
     def clear(self) -> int:
         """Clear all memory. Returns number of turns cleared."""
         count = len(self._turns)
-        self._turns = []
+        self._turns.clear()
+        self._total_tokens = 0
         self._logger.info(f"Cleared {count} turns from memory")
         return count
     
     def prune_before(self, timestamp: datetime) -> int:
         """Remove turns before a timestamp. Returns count removed."""
         original_count = len(self._turns)
-        self._turns = [t for t in self._turns if t.timestamp >= timestamp]
+        self._turns = deque(t for t in self._turns if t.timestamp >= timestamp)
+        self._total_tokens = sum(t.token_estimate for t in self._turns)
         removed = original_count - len(self._turns)
         if removed:
             self._logger.info(f"Pruned {removed} turns before {timestamp}")
@@ -18,6 +18,8 @@ import json
 import logging
 import yaml
 
+from infra.yaml_loader import load_yaml
+
 
 @dataclass
 class UserPreferences:
@@ -106,7 +108,7 @@ class PreferenceStore:
         if self._path.exists():
             try:
                 with open(self._path, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = load_yaml(f)
                     if data:
                         self._preferences = UserPreferences.from_dict(data)
                         self._logger.info(f"Loaded {len(self._preferences.preferences)} preferences")
@@ -171,6 +173,10 @@ class PreferenceStore:
         """List all current preferences."""
         return self._preferences.preferences.copy()
     
+    def __len__(self) -> int:
+        """Number of current preferences (without copying them)."""
+        return len(self._preferences.preferences)
+    
     @property
     def preferences(self) -> UserPreferences:
         """Get the preferences object."""
@@ -37,12 +37,14 @@ class ToolCall:
     tool_name: str
     arguments: Dict[str, Any]
     reasoning: str = ""
+    independent: bool = True  # False: must not overlap the calls before it
     
     def to_dict(self) -> Dict:
         return {
             "tool": self.tool_name,
             "arguments": self.arguments,
-            "reasoning": self.reasoning
+            "reasoning": self.reasoning,
+            "independent": self.independent
         }
 
 
@@ -466,7 +468,8 @@ class LLMPlanner:
                 tool_calls.append(ToolCall(
                     tool_name=tool_name,
                     arguments=tc.get("arguments", {}),
-                    reasoning=tc.get("reasoning", "")
+                    reasoning=tc.get("reasoning", ""),
+                    independent=bool(tc.get("independent", True))
                 ))
         
         response_text = data.get("response")
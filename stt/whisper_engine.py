@@ -118,7 +118,7 @@ class WhisperEngine:
         Transcribe audio data to text.
         
         Args:
-            audio_data: NumPy array of audio samples (float32, mono)
+            audio_data: NumPy array of audio samples (int16 PCM or float32, mono)
             sample_rate: Sample rate of audio data (should be 16kHz)
         
         Returns:
@@ -135,14 +135,16 @@ class WhisperEngine:
                 duration_seconds=0.0
             )
         
+        # Ensure float32 (int16 PCM scaled to [-1, 1) once, vectorized)
+        if audio_data.dtype == np.int16:
+            audio_data = audio_data.astype(np.float32) / 32768.0
+        elif audio_data.dtype != np.float32:
+            audio_data = audio_data.astype(np.float32)
+        
         # Resample if necessary (Whisper expects 16kHz)
         if sample_rate != 16000:
             audio_data = self._resample(audio_data, sample_rate, 16000)
         
-        # Ensure float32
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-        
         # Normalize audio
         max_val = np.abs(audio_data).max()
         if max_val > 0:
@@ -0,0 +1,381 @@
+"""
+API Client Tests
+-----------------
+Tests for the pooled API client.
+
+Tests cover:
+- GET response caching (TTL, LRU eviction)
+- ETag revalidation (If-None-Match / 304)
+- Token bucket rate limiting
+"""
+
+import asyncio
+import json
+import pytest
+from pathlib import Path
+import sys
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.client import APIClient, APIConfig, APIStatus
+from api.rate_limiter import RateLimiter, RateLimitConfig
+
+
+def make_client(monkeypatch, handler, **config_kwargs) -> APIClient:
+    """Build an APIClient whose HTTP client is backed by a mock transport."""
+    monkeypatch.setenv("JARVIS_TEST_API_KEY", "secret")
+    client = APIClient(APIConfig(
+        name="test",
+        base_url="https://api.example.com/v1",
+        api_key_env="JARVIS_TEST_API_KEY",
+        **config_kwargs
+    ))
+    client._client = httpx.AsyncClient(
+        base_url="https://api.example.com/v1/",
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestResponseCache:
+    """Tests for GET response caching."""
+
+    def test_fresh_entry_served_from_cache(self, monkeypatch):
+        """Repeated GET within TTL hits the network once."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"temp": 21})
+
+        client = make_client(monkeypatch, handler, cache_ttl_seconds=60.0)
+
+        async def run():
+            first = await client.get("weather", params={"q": "Paris"})
+            second = await client.get("weather", params={"q": "Paris"})
+            await client.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert first.success and second.data == {"temp": 21}
+
+    def test_params_distinguish_entries(self, monkeypatch):
+        """Different query params are cached separately."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"q": request.url.params["q"]})
+
+        client = make_client(monkeypatch, handler, cache_ttl_seconds=60.0)
+
+        async def run():
+            a = await client.get("weather", params={"q": "Paris"})
+            b = await client.get("weather", params={"q": "Oslo"})
+            return a, b
+
+        a, b = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert a.data == {"q": "Paris"}
+        assert b.data == {"q": "Oslo"}
+
+    def test_errors_not_cached(self, monkeypatch):
+        """Failed responses are never cached."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        client = make_client(monkeypatch, handler, cache_ttl_seconds=60.0)
+
+        async def run():
+            await client.get("weather")
+            return await client.get("weather")
+
+        response = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert response.status == APIStatus.SERVER_ERROR
+
+    def test_lru_eviction(self, monkeypatch):
+        """Cache is bounded by cache_max_entries."""
+        client = make_client(
+            monkeypatch,
+            lambda request: httpx.Response(200, json={}),
+            cache_ttl_seconds=60.0,
+            cache_max_entries=2,
+        )
+
+        async def run():
+            for city in ("a", "b", "c"):
+                await client.get("weather", params={"q": city})
+
+        asyncio.run(run())
+
+        assert len(client._cache) == 2
+
+
+class TestETagRevalidation:
+    """Tests for conditional GET revalidation."""
+
+    def test_not_modified_returns_cached_body(self, monkeypatch):
+        """Stale entry with ETag is revalidated and reused on 304."""
+        seen_etags = []
+
+        def handler(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'})
+
+        client = make_client(monkeypatch, handler)  # TTL 0: always revalidate
+
+        async def run():
+            first = await client.get("data")
+            second = await client.get("data")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert seen_etags == [None, '"v1"']
+        assert second.status_code == 200
+        assert second.data == {"v": 1}
+
+
+class TestRateLimiter:
+    """Tests for the token bucket rate limiter."""
+
+    def test_burst_then_reject(self):
+        """Burst tokens are granted, then requests are rejected."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1, burst_size=3))
+
+        assert all(limiter.try_acquire() for _ in range(3))
+        assert not limiter.try_acquire()
+        assert limiter.available_tokens < 1.0
+
+    def test_refills_over_time(self):
+        """Tokens refill at the configured rate."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=6000, burst_size=1))
+
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        time.sleep(0.05)  # 100 tokens/s -> ~5 tokens, capped at burst
+        assert limiter.try_acquire()
+
+    def test_reset_restores_burst(self):
+        """Reset refills the bucket to burst size."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1, burst_size=2))
+        limiter.try_acquire()
+        limiter.try_acquire()
+
+        limiter.reset()
+
+        assert limiter.available_tokens == pytest.approx(2.0, abs=0.01)
+
+    def test_concurrent_acquire_never_overdraws(self):
+        """Concurrent callers never take more than the burst."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1, burst_size=50))
+        granted = []
+
+        def worker():
+            for _ in range(20):
+                if limiter.try_acquire():
+                    granted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(granted) == 50
+
+    def test_acquire_waits_for_next_token(self):
+        """Blocking acquire sleeps only until the next token is due."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1200, burst_size=1))
+        limiter.try_acquire()  # 20 tokens/s -> next token in ~50 ms
+
+        start = time.monotonic()
+        assert limiter.acquire(timeout=1.0)
+        elapsed = time.monotonic() - start
+
+        assert 0.03 < elapsed < 0.5
+
+    def test_acquire_times_out(self):
+        """Blocking acquire gives up at the deadline."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1, burst_size=1))
+        limiter.try_acquire()
+
+        start = time.monotonic()
+        assert not limiter.acquire(timeout=0.05)
+        assert time.monotonic() - start < 0.2
+
+    def test_acquire_async_waits_without_blocking(self):
+        """Async acquire yields to the event loop while waiting."""
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1200, burst_size=1))
+        limiter.try_acquire()
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            tick_task = asyncio.create_task(ticker())
+            acquired = await limiter.acquire_async(timeout=1.0)
+            await tick_task
+            return acquired
+
+        assert asyncio.run(run())
+        assert len(ticks) == 3
+
+
+class TestClientRateLimiting:
+    """Tests for rate limiting inside APIClient."""
+
+    def test_local_rate_limit_short_circuits(self, monkeypatch):
+        """Requests beyond the local budget never hit the network."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = make_client(
+            monkeypatch, handler, rate_limit_requests=1, timeout_seconds=0.05
+        )
+        client._rate_limiter = RateLimiter(RateLimitConfig(requests_per_minute=1, burst_size=1))
+
+        async def run():
+            return await client.post("a"), await client.post("b")
+
+        first, second = asyncio.run(run())
+
+        assert first.success
+        assert second.status == APIStatus.RATE_LIMITED
+        assert len(calls) == 1
+
+class TestSharedErrorResponses:
+    """Tests for preallocated error responses."""
+
+    def test_unconfigured_client_reuses_response(self, monkeypatch):
+        """Requests without an API key return one shared AUTH_ERROR."""
+        monkeypatch.delenv("JARVIS_MISSING_KEY", raising=False)
+        client = APIClient(APIConfig(
+            name="test", base_url="https://api.example.com", api_key_env="JARVIS_MISSING_KEY"
+        ))
+
+        async def run():
+            return await client.get("a"), await client.post("b")
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert first.status == APIStatus.AUTH_ERROR
+        assert "JARVIS_MISSING_KEY" in first.error
+
+    def test_timeout_response_shared(self, monkeypatch):
+        """Timeouts return the shared TIMEOUT response."""
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        client = make_client(monkeypatch, handler)
+
+        async def run():
+            return await client.get("a"), await client.get("b")
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert first.status == APIStatus.TIMEOUT
+
+
+class TestRequestCoalescer:
+    """Tests for batched POSTs via APIClient.queue."""
+
+    @staticmethod
+    def echo_batch(calls):
+        def handler(request):
+            body = json.loads(request.content)
+            calls.append(body)
+            return httpx.Response(200, json={
+                "responses": [{"echo": item["n"]} for item in body["requests"]]
+            })
+        return handler
+
+    def test_concurrent_items_share_one_request(self, monkeypatch):
+        """Items queued together are sent in one POST and split back."""
+        calls = []
+        client = make_client(
+            monkeypatch, self.echo_batch(calls), batch_endpoint="batch"
+        )
+
+        async def run():
+            return await asyncio.gather(*(client.queue({"n": i}) for i in range(5)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert [r.data for r in results] == [{"echo": i} for i in range(5)]
+
+    def test_max_batch_size_flushes_early(self, monkeypatch):
+        """A full batch is sent without waiting for the interval."""
+        calls = []
+        client = make_client(
+            monkeypatch, self.echo_batch(calls),
+            batch_endpoint="batch", max_batch_size=2, batch_interval_ms=10_000
+        )
+
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(*(client.queue({"n": i}) for i in range(4))), timeout=1.0
+            )
+
+        results = asyncio.run(run())
+
+        assert [len(c["requests"]) for c in calls] == [2, 2]
+        assert all(r.success for r in results)
+
+    def test_failed_batch_fails_every_item(self, monkeypatch):
+        """A failed batch POST is reported to every caller."""
+        client = make_client(
+            monkeypatch, lambda request: httpx.Response(503), batch_endpoint="batch"
+        )
+
+        async def run():
+            return await asyncio.gather(client.queue({"n": 1}), client.queue({"n": 2}))
+
+        results = asyncio.run(run())
+
+        assert all(r.status == APIStatus.SERVER_ERROR for r in results)
+
+    def test_non_object_batch_body_fails_every_item(self, monkeypatch):
+        """A successful batch whose body is not an object is a result-count error."""
+        client = make_client(
+            monkeypatch, lambda request: httpx.Response(200, json=[{"echo": 1}]),
+            batch_endpoint="batch"
+        )
+
+        async def run():
+            return await asyncio.gather(client.queue({"n": 1}), client.queue({"n": 2}))
+
+        results = asyncio.run(run())
+
+        assert all(r.status == APIStatus.SERVER_ERROR for r in results)
+        assert all("did not contain 2 results" in r.error for r in results)
+
+    def test_requires_batch_endpoint(self, monkeypatch):
+        """queue() is unavailable without a configured batch endpoint."""
+        client = make_client(monkeypatch, lambda request: httpx.Response(200))
+
+        with pytest.raises(ValueError):
+            asyncio.run(client.queue({"n": 1}))
@@ -0,0 +1,111 @@
+"""
+Audio Buffer Tests
+-------------------
+Tests for the ring-buffered AudioBuffer.
+
+Tests cover:
+- Sample ordering across ring wrap-around
+- Max duration enforcement
+- Segment ownership after stop
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from audio.audio_buffer import AudioBuffer
+
+
+def frames(start: int, count: int) -> np.ndarray:
+    return np.arange(start, start + count, dtype=np.int16)
+
+
+class TestAudioBufferRing:
+    """Tests for ring buffer writes."""
+    
+    def test_frames_concatenated_in_order(self):
+        """Frames below capacity come back in order."""
+        buf = AudioBuffer(sample_rate=10, max_duration_seconds=1.0)
+        buf.start_recording()
+        buf.add_frame(frames(0, 3))
+        buf.add_frame(frames(3, 3))
+        
+        segment = buf.stop_recording()
+        
+        np.testing.assert_array_equal(segment.data, frames(0, 6))
+    
+    def test_keeps_most_recent_samples_on_wrap(self):
+        """Overflowing the ring keeps the newest max_duration of audio."""
+        buf = AudioBuffer(sample_rate=10, max_duration_seconds=1.0)
+        buf.start_recording()
+        for i in range(5):
+            buf.add_frame(frames(i * 3, 3))
+        
+        assert buf.get_current_duration() == pytest.approx(1.0)
+        segment = buf.stop_recording()
+        
+        np.testing.assert_array_equal(segment.data, frames(5, 10))
+    
+    def test_oversized_frame_keeps_tail(self):
+        """A single frame larger than the ring keeps its tail."""
+        buf = AudioBuffer(sample_rate=10, max_duration_seconds=1.0)
+        buf.start_recording()
+        buf.add_frame(frames(0, 25))
+        
+        np.testing.assert_array_equal(buf.stop_recording().data, frames(15, 10))
+    
+    def test_segment_not_overwritten_by_next_recording(self):
+        """A returned segment stays valid after the buffer is reused."""
+        buf = AudioBuffer(sample_rate=10, max_duration_seconds=1.0)
+        buf.start_recording()
+        buf.add_frame(frames(0, 4))
+        first = buf.stop_recording()
+        
+        buf.start_recording()
+        buf.add_frame(frames(100, 4))
+        buf.stop_recording()
+        
+        np.testing.assert_array_equal(first.data, frames(0, 4))
+    
+    def test_empty_recording(self):
+        """Stopping with no frames returns an empty segment."""
+        buf = AudioBuffer()
+        buf.start_recording()
+        
+        segment = buf.stop_recording()
+        
+        assert len(segment.data) == 0
+        assert not segment.is_valid
+    
+    def test_add_frame_requires_recording(self):
+        """Frames can't be added before start_recording()."""
+        buf = AudioBuffer()
+        
+        with pytest.raises(RuntimeError):
+            buf.add_frame(frames(0, 3))
+    
+    def test_multichannel_frame_uses_first_channel(self):
+        """2-D (frames, channels) input keeps channel 0 only."""
+        buf = AudioBuffer(sample_rate=10, max_duration_seconds=1.0)
+        buf.start_recording()
+        stereo = np.stack([frames(0, 4), frames(50, 4)], axis=1)
+        buf.add_frame(stereo)
+        stereo[:] = -1  # Source buffer reused by the driver
+        
+        np.testing.assert_array_equal(buf.stop_recording().data, frames(0, 4))
+    
+    def test_end_timestamp_from_sample_count(self):
+        """Segment end time is start plus captured sample duration."""
+        buf = AudioBuffer(sample_rate=10, max_duration_seconds=1.0)
+        buf.start_recording()
+        for i in range(5):
+            buf.add_frame(frames(i * 3, 3))
+        
+        segment = buf.stop_recording()
+        
+        elapsed = (segment.timestamp_end - segment.timestamp_start).total_seconds()
+        assert elapsed == pytest.approx(1.5)
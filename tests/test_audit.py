@@ -54,6 +54,37 @@ class TestAuditEntryCreation:
         assert data["actor"] == "executor"
 
 
+class TestAuditEntryFromRow:
+    """Tests for row deserialization."""
+    
+    def test_members_resolved_and_unknown_rejected(self, tmp_path):
+        """Stored values map to enum members; unknown values still raise ValueError."""
+        audit_log = AuditLog(db_path=str(tmp_path / "test_rows.db"), key=b"test-key")
+        audit_log.log(EventType.GRANT_CREATED, Actor.AUTHORITY, "grant", "turn-1")
+        
+        entry = audit_log.get_entries()[0]
+        assert entry.event_type is EventType.GRANT_CREATED
+        assert entry.actor is Actor.AUTHORITY
+        
+        audit_log._conn.execute("UPDATE audit_log SET actor = 'intruder'")
+        with pytest.raises(ValueError):
+            audit_log.get_entries()
+    
+    def test_string_values_coerced_to_members(self):
+        """Entries built from plain strings hold enum members."""
+        entry = AuditEntry(event_type="TOOL_EXECUTE", actor="executor")
+        assert entry.event_type is EventType.TOOL_EXECUTE
+        assert entry.actor is Actor.EXECUTOR
+        assert entry.to_dict()["actor"] == "executor"
+    
+    def test_entry_is_slotted(self):
+        """Entries carry no per-instance __dict__."""
+        entry = AuditEntry(turn_id="t1")
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unexpected = 1
+
+
 class TestAuditLogAppend:
     """Tests for audit log append operations."""
     
@@ -124,6 +155,43 @@ class TestChainIntegrity:
         assert len(entries) == 1
         assert entries[0].prev_hash == AuditLog.GENESIS_HASH
     
+    def test_hash_is_hmac_sha256_of_canonical_payload(self, audit_log):
+        """entry_hash stays the standard HMAC-SHA256, so existing chains verify."""
+        import hashlib
+        import hmac
+        
+        audit_log.log(EventType.TURN_START, Actor.USER, "input", "turn-1", details={"b": 1, "a": 2})
+        entry = audit_log.get_entries()[0]
+        
+        payload = audit_log._canonical_payload(entry, entry.prev_hash)
+        assert entry.entry_hash == hmac.new(b"test-key-chain", payload, hashlib.sha256).hexdigest()
+    
+    def test_canonical_payload_matches_full_encoding(self, audit_log):
+        """The templated payload is byte-identical to encoding the whole dict."""
+        import json
+        
+        for details, target in [
+            (None, None),
+            ({}, "x"),
+            ({"z": [1, 2.5, None], "a": {"n\u00e9": "caf\u00e9 \u2713"}}, "t\"q"),
+        ]:
+            entry = AuditEntry(
+                turn_id="turn-\u00fc", event_type=EventType.TOOL_EXECUTE,
+                actor=Actor.EXECUTOR, action="run", target=target, details=details,
+            )
+            expected = json.dumps({
+                "prev_hash": "abc",
+                "turn_id": entry.turn_id,
+                "timestamp": entry.timestamp.isoformat(),
+                "event_type": entry.event_type.value,
+                "actor": entry.actor.value,
+                "action": entry.action,
+                "target": entry.target,
+                "details": entry.details,
+            }, sort_keys=True, separators=(',', ':')).encode('utf-8')
+            
+            assert audit_log._canonical_payload(entry, "abc") == expected
+    
     def test_chain_links_consecutive(self, audit_log):
         """Each entry's prev_hash matches previous entry's hash."""
         for i in range(3):
@@ -161,6 +229,17 @@ class TestChainIntegrity:
         assert result.entries_checked == 5
         assert result.broken_at is None
     
+    def test_verify_scan_uses_rowid_range(self, audit_log):
+        """verify_chain's range query reads the table by rowid, with no sort step."""
+        plan = " ".join(
+            row[-1] for row in audit_log._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM audit_log WHERE id >= ? ORDER BY id", (1,)
+            )
+        )
+        
+        assert "INTEGER PRIMARY KEY" in plan
+        assert "TEMP B-TREE" not in plan
+    
     def test_verify_empty_chain(self, audit_log):
         """verify_chain handles empty log."""
         result = audit_log.verify_chain()
@@ -286,6 +365,141 @@ class TestTamperDetection:
         assert result.broken_at == 2
 
 
+class TestParallelVerify:
+    """Tests for verify_chain's worker-process path."""
+    
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "test_parallel.db")
+    
+    @pytest.fixture
+    def audit_log(self, db_path):
+        audit_log = AuditLog(db_path=db_path, key=b"test-key-parallel")
+        audit_log.log_many([
+            (EventType.TOOL_EXECUTE, Actor.EXECUTOR, f"action-{i}", f"turn-{i}", None, {"i": i})
+            for i in range(20)
+        ])
+        # Force the pool on for a small range
+        audit_log.PARALLEL_VERIFY_MIN = 1
+        audit_log.VERIFY_CHUNK = 3
+        audit_log.VERIFY_WORKERS = 2
+        yield audit_log
+        audit_log.close()
+    
+    def test_matches_serial_result(self, audit_log, db_path):
+        """Parallel verification agrees with the serial path, before and after tampering."""
+        result = audit_log.verify_chain()
+        assert result.valid, result.error
+        assert result.entries_checked == 20
+        assert audit_log._verify_pool is not None
+        
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_log SET action = 'TAMPERED' WHERE id = 14")
+        conn.commit()
+        conn.close()
+        
+        parallel = audit_log.verify_chain(from_id=5)
+        audit_log.VERIFY_WORKERS = 1
+        serial = audit_log.verify_chain(from_id=5)
+        assert parallel == serial
+        assert parallel.broken_at == 14
+        assert parallel.entries_checked == 9
+
+
+    def test_in_memory_log_uses_pool(self):
+        """The pool path also runs when reads share the writer's lock."""
+        import threading
+        
+        audit_log = AuditLog(db_path=":memory:", key=b"test-key-parallel")
+        for i in range(5):
+            audit_log.log(EventType.TURN_START, Actor.USER, f"action-{i}", f"turn-{i}")
+        audit_log.PARALLEL_VERIFY_MIN = 2
+        audit_log.VERIFY_WORKERS = 2
+        
+        results = []
+        verifier = threading.Thread(target=lambda: results.append(audit_log.verify_chain()), daemon=True)
+        verifier.start()
+        verifier.join(timeout=10)
+        assert not verifier.is_alive(), "verify_chain deadlocked"
+        
+        assert results[0].valid and results[0].entries_checked == 5
+        assert audit_log._verify_pool is not None
+        audit_log.close()
+
+
+class TestCheckpoints:
+    """Tests for Merkle checkpoints over sealed blocks."""
+    
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "test_checkpoints.db")
+    
+    @pytest.fixture
+    def audit_log(self, db_path):
+        audit_log = AuditLog(db_path=db_path, key=b"test-key-checkpoints")
+        audit_log.CHECKPOINT_BLOCK = 4
+        audit_log.log_many([
+            (EventType.TOOL_EXECUTE, Actor.EXECUTOR, f"action-{i}", f"turn-{i}")
+            for i in range(6)
+        ])
+        for i in range(6, 9):
+            audit_log.log(EventType.TOOL_EXECUTE, Actor.EXECUTOR, f"action-{i}", f"turn-{i}")
+        return audit_log
+    
+    def test_blocks_sealed_as_they_fill(self, audit_log):
+        """Each complete block gets one checkpoint; the tail is left open."""
+        rows = audit_log._conn.execute(
+            "SELECT block_id, last_entry_id FROM audit_checkpoints ORDER BY block_id"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [(1, 4), (2, 8)]
+        
+        result = audit_log.verify_checkpoints()
+        assert result.valid
+        assert result.entries_checked == 8
+    
+    def test_rehashed_entry_localized_to_block(self, audit_log, db_path):
+        """A rewritten entry_hash is reported at the start of its block."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_log SET entry_hash = ? WHERE id = 6", ("ab" * 32,))
+        conn.commit()
+        conn.close()
+        
+        result = audit_log.verify_checkpoints()
+        assert not result.valid
+        assert result.broken_at == 5
+        assert result.entries_checked == 4
+        
+        # Drilling into the block with the full check pins the entry
+        assert audit_log.verify_chain(from_id=5, to_id=8).broken_at == 6
+    
+    def test_tampered_open_block_does_not_block_appends(self, audit_log, db_path):
+        """A non-BLOB hash in the block being sealed is flagged, not fatal."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_log SET entry_hash = 'edited' WHERE id = 9")
+        conn.commit()
+        conn.close()
+        
+        for i in range(9, 13):
+            audit_log.log(EventType.TOOL_EXECUTE, Actor.EXECUTOR, f"action-{i}", f"turn-{i}")
+        
+        assert audit_log._conn.execute("SELECT COUNT(*) FROM audit_checkpoints").fetchone()[0] == 3
+        result = audit_log.verify_checkpoints()
+        assert not result.valid
+        assert result.broken_at == 9
+        assert result.entries_checked == 8
+    
+    def test_deleted_entry_detected(self, audit_log, db_path):
+        """Deleting an entry inside a sealed block fails its checkpoint."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM audit_log WHERE id = 2")
+        conn.commit()
+        conn.close()
+        
+        result = audit_log.verify_checkpoints()
+        assert not result.valid
+        assert result.broken_at == 1
+
+
 class TestTurnTrail:
     """Tests for turn trail reconstruction."""
     
@@ -342,6 +556,78 @@ class TestExport:
         assert len(bundle["entries"]) == 3
         assert bundle["final_hash"] is not None
         assert bundle["key_id"] is not None  # Key fingerprint only
+    
+    def test_streamed_export_matches_indented_dump(self, audit_log, tmp_path):
+        """The streamed bundle is formatted exactly like json.dumps(indent=2, sort_keys=True)."""
+        import json
+        
+        empty = audit_log.export_for_review()
+        assert json.dumps(json.loads(empty), indent=2, sort_keys=True) == empty
+        
+        audit_log.log(EventType.TURN_START, Actor.USER, "input", "turn-1")
+        audit_log.log(EventType.TOOL_EXECUTE, Actor.EXECUTOR, "run", "turn-1", details={"k": "v"})
+        
+        export = audit_log.export_for_review()
+        assert json.dumps(json.loads(export), indent=2, sort_keys=True) == export
+        
+        path = tmp_path / "export.json"
+        with open(path, "w") as f:
+            assert audit_log.write_export(f.write) == 2
+        assert json.loads(path.read_text())["entries"] == json.loads(export)["entries"]
+
+
+class TestHashStorage:
+    """Tests for BLOB hash storage and the TEXT-to-BLOB migration."""
+    
+    def test_hashes_stored_as_raw_digests(self, tmp_path):
+        """Hashes hit disk as 32-byte BLOBs but surface as hex."""
+        audit_log = AuditLog(db_path=str(tmp_path / "test_blob.db"), key=b"test-key")
+        entry_hash = audit_log.log(EventType.TURN_START, Actor.USER, "input", "turn-1")
+        
+        row = audit_log._conn.execute(
+            "SELECT typeof(entry_hash), length(entry_hash), prev_hash FROM audit_log"
+        ).fetchone()
+        assert (row[0], row[1]) == ("blob", 32)
+        assert row[2] == bytes(32)
+        assert len(entry_hash) == 64
+        assert audit_log.get_entries()[0].prev_hash == AuditLog.GENESIS_HASH
+    
+    def test_text_hashes_migrated(self, tmp_path):
+        """A database with hex TEXT hashes is rewritten and still verifies."""
+        source = AuditLog(db_path=str(tmp_path / "test_src.db"), key=b"test-key")
+        hashes = [
+            source.log(EventType.TURN_START, Actor.USER, f"action-{i}", f"turn-{i}", details={"i": i})
+            for i in range(3)
+        ]
+        
+        legacy_path = str(tmp_path / "test_legacy.db")
+        legacy = sqlite3.connect(legacy_path)
+        legacy.execute("""
+            CREATE TABLE audit_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                turn_id TEXT NOT NULL, timestamp TEXT NOT NULL,
+                event_type TEXT NOT NULL, actor TEXT NOT NULL, action TEXT NOT NULL,
+                target TEXT, details TEXT, prev_hash TEXT, entry_hash TEXT NOT NULL
+            )
+        """)
+        for row in source._conn.execute("SELECT * FROM audit_log ORDER BY id"):
+            legacy.execute(
+                "INSERT INTO audit_log VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                tuple(row)[:8] + (row["prev_hash"].hex(), row["entry_hash"].hex())
+            )
+        legacy.commit()
+        legacy.close()
+        
+        migrated = AuditLog(db_path=legacy_path, key=b"test-key")
+        assert migrated._conn.execute(
+            "SELECT COUNT(*) FROM audit_log WHERE typeof(entry_hash) != 'blob'"
+        ).fetchone()[0] == 0
+        assert [e.entry_hash for e in migrated.get_entries()] == hashes
+        assert migrated.verify_chain().valid
+        
+        migrated.log(EventType.TURN_END, Actor.SYSTEM, "done", "turn-3")
+        assert migrated.get_entries()[-1].id == 4
+        assert migrated.verify_chain().entries_checked == 4
 
 
 class TestKeyManagement:
@@ -373,6 +659,136 @@ class TestKeyManagement:
         
         # Should use the env key
         assert log._key == b"my-secret-key"
+    
+    def test_machine_key_derived_once(self, tmp_path, monkeypatch):
+        """The fallback key is derived once but the env key still wins."""
+        import platform
+        
+        monkeypatch.delenv("JARVIS_AUDIT_KEY", raising=False)
+        key = AuditLog(db_path=str(tmp_path / "test_a.db"))._key
+        
+        monkeypatch.setattr(platform, "node", lambda: pytest.fail("machine key re-derived"))
+        assert AuditLog(db_path=str(tmp_path / "test_b.db"))._key == key
+        
+        monkeypatch.setenv("JARVIS_AUDIT_KEY", "later-key")
+        assert AuditLog(db_path=str(tmp_path / "test_c.db"))._key == b"later-key"
+
+
+
+class TestConcurrentAccess:
+    """Tests for the WAL-mode audit database."""
+    
+    def test_wal_enabled(self, tmp_path):
+        """The audit database uses write-ahead logging."""
+        db_path = str(tmp_path / "test_wal.db")
+        AuditLog(db_path=db_path, key=b"test-key")
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+    
+    def test_concurrent_appends_keep_chain(self, tmp_path):
+        """Appends from several threads still form one valid chain."""
+        import threading
+        
+        audit_log = AuditLog(db_path=str(tmp_path / "test_threads.db"), key=b"test-key")
+        
+        def worker(n):
+            for i in range(10):
+                audit_log.log(EventType.TOOL_EXECUTE, Actor.EXECUTOR, f"tool-{i}", f"turn-{n}")
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        result = audit_log.verify_chain()
+        assert result.valid, result.error
+        assert result.entries_checked == 40
+    
+    def test_separate_connections_do_not_fork_chain(self, tmp_path):
+        """Two logs on one file serialize through BEGIN IMMEDIATE."""
+        import threading
+        
+        db_path = str(tmp_path / "test_writers.db")
+        writers = [AuditLog(db_path=db_path, key=b"test-key") for _ in range(2)]
+        
+        def worker(audit_log, n):
+            for i in range(25):
+                audit_log.log(EventType.TOOL_EXECUTE, Actor.EXECUTOR, f"tool-{i}", f"turn-{n}")
+        
+        threads = [threading.Thread(target=worker, args=(w, n)) for n, w in enumerate(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        result = writers[0].verify_chain()
+        assert result.valid, result.error
+        assert result.entries_checked == 50
+    
+    def test_log_many_chains_in_one_commit(self, tmp_path):
+        """A batch links into the existing chain exactly like single appends."""
+        audit_log = AuditLog(db_path=str(tmp_path / "test_batch.db"), key=b"test-key")
+        first = audit_log.log(EventType.TURN_START, Actor.USER, "input", "turn-1")
+        
+        hashes = audit_log.log_many([
+            (EventType.PLAN_CREATED, Actor.PLANNER, "plan", "turn-1"),
+            (EventType.TOOL_EXECUTE, Actor.EXECUTOR, "run", "turn-1", "get_time", {"ok": True}),
+            (EventType.TURN_END, Actor.SYSTEM, "done", "turn-1"),
+        ])
+        
+        trail = audit_log.get_turn_trail("turn-1")
+        assert [e.entry_hash for e in trail] == [first] + hashes
+        assert [e.prev_hash for e in trail[1:]] == [first] + hashes[:-1]
+        assert trail[2].target == "get_time" and trail[2].details == {"ok": True}
+        assert audit_log.verify_chain().valid
+        assert audit_log.log_many([]) == []
+    
+    def test_connections_reused(self, tmp_path, monkeypatch):
+        """Appends reuse the writer; reads open one read-only connection per thread."""
+        audit_log = AuditLog(db_path=str(tmp_path / "test_conn.db"), key=b"test-key")
+        
+        opened = []
+        real_connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: opened.append(a[0]) or real_connect(*a, **k))
+        
+        audit_log.log(EventType.TURN_START, Actor.USER, "input", "turn-1")
+        assert opened == []
+        
+        audit_log.get_turn_trail("turn-1")
+        assert audit_log.verify_chain().valid
+        assert audit_log.get_stats()["total_entries"] == 1
+        
+        assert len(opened) == 1 and opened[0].endswith("?mode=ro")
+        audit_log.close()
+        audit_log.close()  # Idempotent
+    
+    def test_reads_do_not_hold_write_lock(self, tmp_path):
+        """An export's write callback can append; the export keeps its snapshot."""
+        import json
+        import threading
+        
+        audit_log = AuditLog(db_path=str(tmp_path / "test_readers.db"), key=b"test-key")
+        audit_log.log(EventType.TURN_START, Actor.USER, "input", "turn-1")
+        
+        chunks = []
+        
+        def write(chunk):
+            if not chunks:
+                audit_log.log(EventType.TURN_END, Actor.SYSTEM, "done", "turn-1")
+            chunks.append(chunk)
+        
+        exporter = threading.Thread(target=audit_log.write_export, args=(write,))
+        exporter.start()
+        exporter.join(timeout=5)
+        assert not exporter.is_alive(), "export blocked the append"
+        
+        assert json.loads("".join(chunks))["entry_count"] == 1
+        assert audit_log.get_stats()["total_entries"] == 2
 
 
 if __name__ == "__main__":
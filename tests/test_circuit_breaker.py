@@ -10,6 +10,7 @@ Tests cover:
 - Thread safety
 """
 
+import logging
 import pytest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -211,6 +212,28 @@ class TestCircuitBreakerRegistry:
         
         assert "tool-a" in open_circuits
         assert "tool-b" not in open_circuits
+    
+    def test_open_set_follows_transitions(self):
+        """Open circuits are tracked through recovery, re-open and reset."""
+        registry = CircuitBreakerRegistry(
+            default_failure_threshold=1, default_recovery_timeout=0.01
+        )
+        cb = registry.get("tool-a")
+        registry.get("tool-b")
+        
+        cb.record_failure()
+        assert registry.get_open_circuits() == ["tool-a"]
+        
+        time.sleep(0.02)
+        assert registry.get_open_circuits() == []  # Timed out → HALF_OPEN
+        assert cb.state == CircuitState.HALF_OPEN
+        
+        cb.record_failure()
+        assert registry.get_open_circuits() == ["tool-a"]
+        
+        registry.reset_all()
+        assert registry.get_open_circuits() == []
+        assert registry._open == {}
 
 
 class TestCircuitBreakerThreadSafety:
@@ -235,5 +258,154 @@ class TestCircuitBreakerThreadSafety:
         assert stats["failure_count"] == 200
 
 
+
+class TestCircuitOpenError:
+    """Tests for the rejection exception."""
+    
+    def test_message_formatted_on_demand(self):
+        """str() renders the message from the stored fields."""
+        error = CircuitOpenError("weather", 12.34)
+        
+        assert error.args == ("weather", 12.34)
+        assert str(error) == "Circuit 'weather' is OPEN. Retry in 12.3s"
+    
+    def test_pickle_round_trip(self):
+        """The exception survives pickling (e.g. across processes)."""
+        import pickle
+        
+        error = pickle.loads(pickle.dumps(CircuitOpenError("weather", 1.0)))
+        
+        assert error.breaker_name == "weather"
+        assert str(error) == "Circuit 'weather' is OPEN. Retry in 1.0s"
+
+
+class TestFailureTimestamp:
+    """Tests for when the failure time is recorded."""
+    
+    def test_below_threshold_skips_clock(self):
+        """Failures that don't open the circuit leave no timestamp."""
+        cb = CircuitBreaker(name="test-tool", failure_threshold=3)
+        
+        cb.record_failure()
+        cb.record_failure()
+        assert cb._last_failure_ns is None
+        
+        cb.record_failure()  # Opens
+        assert cb._last_failure_ns is not None
+        assert cb.get_stats()["last_failure"] is not None
+    
+    def test_failure_while_open_restarts_timeout(self):
+        """A failure reported while OPEN pushes recovery back."""
+        cb = CircuitBreaker(name="test-tool", failure_threshold=1, recovery_timeout=10.0)
+        cb.record_failure()
+        opened_ns = cb._last_failure_ns
+        
+        cb.record_failure()
+        
+        assert cb._last_failure_ns >= opened_ns
+
+
+class TestCircuitBreakerLogging:
+    """Tests for shared transition logging."""
+    
+    def test_transitions_use_shared_logger(self, caplog):
+        """Transitions log to jarvis.circuit with the breaker name attached."""
+        cb = CircuitBreaker(name="flaky", failure_threshold=1)
+        
+        with caplog.at_level(logging.INFO, logger="jarvis.circuit"):
+            cb.record_failure()
+        
+        record = caplog.records[-1]
+        assert record.name == "jarvis.circuit"
+        assert record.breaker == "flaky"
+        assert record.getMessage() == "Circuit flaky: CLOSED → OPEN (failures=1)"
+    
+    def test_disabled_logger_skips_formatting(self, caplog):
+        """Nothing is logged when the level is filtered out."""
+        cb = CircuitBreaker(name="quiet", failure_threshold=1)
+        
+        with caplog.at_level(logging.ERROR, logger="jarvis.circuit"):
+            cb.record_failure()
+            cb.reset()
+        
+        assert not [r for r in caplog.records if r.name == "jarvis.circuit"]
+
+
+class _ForbiddenLock:
+    """Lock stand-in that fails the test if acquired."""
+    
+    def __enter__(self):
+        raise AssertionError("lock acquired on lock-free path")
+    
+    def __exit__(self, *exc):
+        return False
+
+
+class TestCircuitBreakerFastPath:
+    """Tests for lock-free reads and CLOSED-state success."""
+    
+    def test_closed_success_path_is_lock_free(self):
+        """Reading state and recording success in CLOSED takes no lock."""
+        cb = CircuitBreaker(name="test-tool", failure_threshold=3)
+        cb.record_failure()
+        cb._lock = _ForbiddenLock()
+        
+        assert cb.state == CircuitState.CLOSED
+        cb.record_success()
+        
+        assert cb._failure_count == 0
+    
+    def test_closed_call_is_lock_free(self):
+        """A successful call() in CLOSED takes no lock."""
+        cb = CircuitBreaker(name="test-tool", failure_threshold=3)
+        cb.record_failure()
+        cb._lock = _ForbiddenLock()
+        
+        assert cb.call(lambda x: x * 2, 21) == 42
+        assert cb._failure_count == 0
+    
+    def test_closed_call_failure_still_opens(self):
+        """Failures from the fast path still trip the breaker."""
+        cb = CircuitBreaker(name="test-tool", failure_threshold=2)
+        
+        def boom():
+            raise RuntimeError("boom")
+        
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                cb.call(boom)
+        
+        assert cb.is_open
+        with pytest.raises(CircuitOpenError):
+            cb.call(lambda: None)
+    
+    def test_registry_lookup_is_lock_free(self):
+        """Looking up an existing breaker takes no registry lock."""
+        registry = CircuitBreakerRegistry()
+        cb = registry.get("tool-a")
+        registry._lock = _ForbiddenLock()
+        
+        assert registry.get("tool-a") is cb
+        assert registry.get_open_circuits() == []
+    
+    def test_concurrent_creation_single_breaker(self):
+        """Racing creators all receive the same breaker."""
+        registry = CircuitBreakerRegistry()
+        seen = []
+        barrier = threading.Barrier(8)
+        
+        def lookup():
+            barrier.wait()
+            seen.append(registry.get("shared-tool"))
+        
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len({id(cb) for cb in seen}) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""
+Command Registry Tests
+-----------------------
+Tests for deterministic command matching.
+
+Tests cover:
+- Exact and parameterized pattern matches
+- Best-confidence selection across patterns
+- No-match handling
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from commands.registry import CommandRegistry
+
+
+@pytest.fixture
+def registry(project_root):
+    return CommandRegistry(str(project_root / "commands" / "command_map.yaml"))
+
+
+class TestCommandMatching:
+    """Tests for CommandRegistry.match."""
+    
+    def test_exact_phrase(self, registry):
+        """Placeholder-free pattern matches with full confidence."""
+        intent = registry.match("What time is it")
+        
+        assert intent.command_id == "system.time"
+        assert intent.confidence == pytest.approx(1.0)
+        assert intent.args == {}
+    
+    def test_extracts_arguments(self, registry):
+        """Placeholders become intent arguments."""
+        intent = registry.match("search for python tutorials")
+        
+        assert intent.command_id == "browser.search"
+        assert intent.args == {"query": "python tutorials"}
+    
+    def test_prefers_closer_word_count(self, registry):
+        """A later pattern with a closer word count beats an earlier one."""
+        intent = registry.match("open file notes")
+        
+        assert intent.matched_pattern == "open file {filename}"
+        assert intent.args == {"filename": "notes"}
+    
+    def test_surrounding_whitespace_ignored(self, registry):
+        """Leading/trailing whitespace does not affect matching."""
+        intent = registry.match("   open browser  ")
+        
+        assert intent.is_match
+        assert intent.original_text == "open browser"
+    
+    def test_no_match(self, registry):
+        """Unknown text yields a zero-confidence intent."""
+        intent = registry.match("this is not a command")
+        
+        assert not intent.is_match
+        assert intent.command_id == ""
+    
+    def test_empty_text(self, registry):
+        """Empty input never matches."""
+        assert not registry.match("   ").is_match
+    
+    def test_earlier_parameterized_pattern_wins_tie(self, tmp_path):
+        """An exact phrase does not override an earlier equal-length placeholder match."""
+        registry_file = tmp_path / "commands.yaml"
+        registry_file.write_text(
+            "commands:\n"
+            "  - id: app.open\n"
+            "    name: Open App\n"
+            "    patterns: ['open {app}']\n"
+            "    permission: execute\n"
+            "    description: Open an app\n"
+            "  - id: browser.open\n"
+            "    name: Open Browser\n"
+            "    patterns: ['open browser']\n"
+            "    permission: execute\n"
+            "    description: Open the browser\n"
+        )
+        registry = CommandRegistry(str(registry_file))
+        
+        intent = registry.match("open browser")
+        
+        assert intent.command_id == "app.open"
+        assert intent.args == {"app": "browser"}
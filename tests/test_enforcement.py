@@ -69,6 +69,16 @@ class TestLegacyOrchestratorsRemoved:
         
         with pytest.raises((ImportError, ModuleNotFoundError)):
             import core.orchestrator_v4
+    
+    def test_import_check_rejects_legacy_file(self, tmp_path):
+        """The import-time check fails when a legacy file is present."""
+        from core.orchestrator_unified import _enforce_no_legacy_orchestrators
+        
+        _enforce_no_legacy_orchestrators(tmp_path)
+        
+        (tmp_path / "orchestrator_v3.py").write_text("")
+        with pytest.raises(RuntimeError, match="orchestrator_v3.py"):
+            _enforce_no_legacy_orchestrators(tmp_path)
 
 
 class TestJSONPersistenceDisabled:
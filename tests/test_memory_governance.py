@@ -225,3 +225,190 @@ class TestTurnIdPropagation:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestRelevantContext:
+    """Tests for similarity-ranked conversation context."""
+    
+    def test_top_k_by_similarity_in_conversation_order(self):
+        """Older turns are picked by similarity, next to the recent exchange, oldest first."""
+        from memory.conversation import ConversationMemory
+        
+        memory = ConversationMemory(max_turns=50, max_tokens=10_000)
+        memory.add_user_turn("what is the weather in Paris")
+        for i in range(10):
+            memory.add_user_turn(f"open application number {i}")
+        memory.add_user_turn("will it rain in Paris tomorrow")
+        
+        budget = memory.total_tokens - 1  # Whole window does not fit
+        context = memory.get_relevant_context("Paris weather", max_tokens=budget, top_k=1)
+        
+        assert context.splitlines() == [
+            "User: what is the weather in Paris",
+            "User: open application number 9",
+            "User: will it rain in Paris tomorrow",
+        ]
+    
+    def test_whole_window_returned_when_it_fits(self):
+        """No retrieval when every turn fits the budget."""
+        from memory.conversation import ConversationMemory
+        
+        memory = ConversationMemory()
+        for i in range(12):
+            memory.add_user_turn(f"open app {i}")
+        
+        context = memory.get_relevant_context("app 3", max_tokens=memory.total_tokens, top_k=2)
+        assert context == memory.get_context_string()
+    
+    def test_follow_up_keeps_the_exchange_it_answers(self):
+        """A confirmation reply keeps the question and request before it."""
+        from memory.conversation import ConversationMemory
+        
+        memory = ConversationMemory(max_turns=50, max_tokens=10_000)
+        for i in range(12):
+            memory.add_user_turn(f"open app {i}")
+            memory.add_assistant_turn(f"opened app {i}")
+        memory.add_user_turn("delete my downloads folder")
+        memory.add_assistant_turn("Are you sure you want to delete it?")
+        memory.add_user_turn("yes please go ahead with the app cleanup")
+        
+        budget = memory.total_tokens // 2
+        lines = memory.get_relevant_context(
+            "yes please go ahead with the app cleanup", max_tokens=budget, top_k=4
+        ).splitlines()
+        assert lines[-3:] == [
+            "User: delete my downloads folder",
+            "Assistant: Are you sure you want to delete it?",
+            "User: yes please go ahead with the app cleanup",
+        ]
+        
+        # A query with no words scores every older turn 0: newest win the tie
+        lines = memory.get_relevant_context("?", max_tokens=budget, top_k=2).splitlines()
+        assert lines[:2] == ["User: open app 11", "Assistant: opened app 11"]
+    
+    def test_token_budget_respected(self):
+        """Turns that do not fit the budget are left out."""
+        from memory.conversation import ConversationMemory
+        
+        memory = ConversationMemory()
+        memory.add_user_turn("short")
+        memory.add_assistant_turn("x" * 400)  # ~100 tokens
+        
+        assert memory.get_relevant_context("short", max_tokens=10) == "User: short"
+        assert memory.get_relevant_context("anything", max_tokens=0) == ""
+
+
+class TestTokenBudget:
+    """Tests for token-budget eviction in conversation memory."""
+    
+    def test_encoder_load_failure_falls_back_to_estimate(self, monkeypatch):
+        """An unloadable tiktoken encoding is tried once, then estimated."""
+        import memory.conversation as conversation
+        
+        calls = []
+        
+        class OfflineTiktoken:
+            @staticmethod
+            def get_encoding(name):
+                calls.append(name)
+                raise OSError("network unreachable")
+        
+        monkeypatch.setattr(conversation, "tiktoken", OfflineTiktoken)
+        monkeypatch.setattr(conversation, "_encoder", None)
+        monkeypatch.setattr(conversation, "_encoder_loaded", False)
+        
+        memory = conversation.ConversationMemory()
+        memory.add_user_turn("x" * 40)
+        assert memory.turns[0].token_estimate == 10
+        assert conversation.count_tokens_batch(["y" * 8, ""]) == [2, 1]
+        assert calls == [conversation.TOKEN_ENCODING]
+    
+    def test_running_total_matches_turns(self):
+        """total_tokens tracks adds, evictions, pruning and clear."""
+        from memory.conversation import ConversationMemory
+        
+        memory = ConversationMemory(max_turns=100, max_tokens=60)
+        for i in range(20):
+            memory.add_user_turn(f"message number {i} " * 3)
+        
+        assert memory.total_tokens <= 60
+        assert memory.total_tokens == sum(t.token_estimate for t in memory.turns)
+        assert memory.turns[-1].content.startswith("message number 19")
+        
+        memory.prune_before(memory.turns[1].timestamp)
+        assert memory.total_tokens == sum(t.token_estimate for t in memory.turns)
+        
+        memory.clear()
+        assert memory.total_tokens == 0
+    
+    def test_turn_tokenized_once(self, monkeypatch):
+        """A turn's token count is computed on add and then reused."""
+        import memory.conversation as conversation
+        
+        calls = []
+        real = conversation.count_tokens
+        monkeypatch.setattr(conversation, "count_tokens", lambda text: calls.append(text) or real(text))
+        
+        memory = conversation.ConversationMemory(max_tokens=10_000)
+        memory.add_user_turn("hello there")
+        memory.get_relevant_context("hello", max_tokens=100)
+        memory.total_tokens
+        
+        assert calls == ["hello there"]
+    
+    def test_batch_add_matches_single_adds(self):
+        """add_tool_turns gives the same turns and counts as one-by-one adds."""
+        from memory.conversation import ConversationMemory
+        
+        single = ConversationMemory(max_tokens=10_000)
+        single.add_tool_turn("read_file", {"path": "a"}, "file contents " * 20)
+        single.add_tool_turn("get_time", {}, "10:30")
+        single.add_assistant_turn("done")
+        
+        batched = ConversationMemory(max_tokens=10_000)
+        batched.add_tool_turns(
+            [("read_file", {"path": "a"}, "file contents " * 20), ("get_time", {}, "10:30")],
+            response="done"
+        )
+        
+        assert [(t.role, t.content) for t in batched.turns] == [
+            (t.role, t.content) for t in single.turns
+        ]
+        assert [t.token_estimate for t in batched.turns] == [
+            t.token_estimate for t in single.turns
+        ]
+        assert batched.total_tokens == single.total_tokens
+
+
+class TestMemoryStats:
+    """Tests for memory statistics counters."""
+    
+    def test_preference_count_without_copy(self, tmp_path):
+        """len(PreferenceStore) tracks sets and removals."""
+        from memory.preferences import PreferenceStore
+        
+        store = PreferenceStore(str(tmp_path / "prefs.yaml"))
+        defaults = len(store)
+        
+        store.set("favourite_colour", "blue")
+        assert len(store) == defaults + 1 == len(store.list_all())
+        
+        store.remove("favourite_colour")
+        assert len(store) == defaults
+    
+    def test_orchestrator_stats_use_counters(self, tmp_path):
+        """get_memory_stats reports the store size and running token total."""
+        from core.orchestrator_unified import Phase3Orchestrator, Phase3Config
+        from memory import ConversationMemory
+        from memory.preferences import PreferenceStore
+        
+        orchestrator = Phase3Orchestrator(Phase3Config())
+        orchestrator._preferences = PreferenceStore(str(tmp_path / "prefs.yaml"))
+        orchestrator._memory = ConversationMemory()
+        orchestrator._memory.add_user_turn("hello there")
+        
+        stats = orchestrator.get_memory_stats()
+        
+        assert stats["preferences_count"] == len(orchestrator._preferences.list_all())
+        assert stats["turns"] == 1
+        assert stats["estimated_tokens"] == orchestrator._memory.total_tokens
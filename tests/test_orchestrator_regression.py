@@ -263,6 +263,711 @@ class TestStateConsistency:
         
         # State should be unchanged
         assert mock_planner._known_tools == initial_tools
+    
+    def test_lazy_transition_reason(self):
+        """Callable reasons are formatted once, only when read."""
+        import logging
+        from core.state_machine import StateMachine, State
+        
+        calls = []
+        
+        def reason():
+            calls.append(1)
+            return "Executing get_time"
+        
+        sm = StateMachine()
+        logger = logging.getLogger("jarvis.state")
+        previous = logger.level
+        try:
+            logger.setLevel(logging.WARNING)
+            sm.transition(State.PLANNING, reason)
+        finally:
+            logger.setLevel(previous)
+        
+        assert calls == []
+        record = sm.history[-1]
+        assert record.reason == "Executing get_time"
+        assert record.reason == "Executing get_time"
+        assert calls == [1]
+
+    
+    def test_transition_bits_match_table(self):
+        """can_transition agrees with VALID_TRANSITIONS for every state pair."""
+        from core.state_machine import StateMachine, State, VALID_TRANSITIONS
+        
+        for from_state in State:
+            sm = StateMachine(initial_state=from_state)
+            for to_state in State:
+                assert sm.can_transition(to_state) == (to_state in VALID_TRANSITIONS[from_state])
+    
+    def test_transition_timestamp_is_wall_clock(self):
+        """Monotonic transition stamps convert back to the current wall time."""
+        from datetime import datetime, timedelta
+        from core.state_machine import StateMachine, State
+        
+        sm = StateMachine()
+        record = sm.transition(State.PLANNING, "Matching command")
+        
+        assert isinstance(record.ts_ns, int)
+        assert abs(record.timestamp - datetime.now()) < timedelta(seconds=5)
+        assert "IDLE" in sm.get_history_summary()
+    
+    def test_history_bounded(self):
+        """History keeps only the most recent MAX_HISTORY transitions."""
+        from core.state_machine import StateMachine, State
+        
+        sm = StateMachine()
+        for i in range(StateMachine.MAX_HISTORY + 5):
+            sm.transition(State.PLANNING if i % 2 == 0 else State.IDLE, f"step {i}")
+        
+        assert len(sm.history) == StateMachine.MAX_HISTORY
+        assert [t.reason for t in sm.recent_history(2)] == [
+            f"step {StateMachine.MAX_HISTORY + 3}", f"step {StateMachine.MAX_HISTORY + 4}"
+        ]
+        assert sm.recent_history(0) == []
+    
+    def test_history_is_a_view(self):
+        """history reads the live deque: indexing and slicing, no copy, no mutation."""
+        from core.state_machine import StateMachine, State
+        
+        sm = StateMachine()
+        history = sm.history
+        for i in range(6):
+            sm.transition(State.PLANNING if i % 2 == 0 else State.IDLE, f"step {i}")
+        
+        assert len(history) == 6
+        assert [t.reason for t in history[-2:]] == ["step 4", "step 5"]
+        assert [t.reason for t in history[1:5:2]] == ["step 1", "step 3"]
+        assert [t.reason for t in history[::-3]] == ["step 5", "step 2"]
+        assert history[0].reason == "step 0"
+        assert list(reversed(history))[0] is history[-1]
+        assert not hasattr(history, "append")
+    
+    def test_recover_records_both_transitions(self):
+        """recover() goes straight to IDLE but keeps ERROR in the history."""
+        from core.state_machine import StateMachine, State
+        
+        sm = StateMachine()
+        sm.transition(State.PLANNING, "Matching command")
+        seen = []
+        sm.add_listener(lambda t: seen.append((t.to_state, sm.state)))
+        
+        sm.recover("Execution error: boom")
+        
+        assert sm.state is State.IDLE
+        assert [(t.from_state, t.to_state) for t in sm.history[-2:]] == [
+            (State.PLANNING, State.ERROR), (State.ERROR, State.IDLE)
+        ]
+        assert sm.history[-2].reason == "Execution error: boom"
+        assert seen == [(State.ERROR, State.IDLE), (State.IDLE, State.IDLE)]
+    
+    def test_reset_records_both_hops(self):
+        """reset() from a busy state records X → ERROR → IDLE like recover()."""
+        from core.state_machine import StateMachine, State
+        
+        sm = StateMachine()
+        sm.transition(State.PLANNING, "Matching command")
+        seen = []
+        sm.add_listener(seen.append)
+        
+        sm.reset("User cancelled")
+        
+        assert sm.state is State.IDLE
+        assert [(t.from_state, t.to_state, t.reason) for t in seen] == [
+            (State.PLANNING, State.ERROR, "Reset initiated: User cancelled"),
+            (State.ERROR, State.IDLE, "User cancelled"),
+        ]
+        
+        sm.reset()
+        assert len(seen) == 2  # Already idle: nothing recorded
+    
+    def test_listeners_isolated_and_removable(self):
+        """A failing listener does not block others; removed listeners stop firing."""
+        from core.state_machine import StateMachine, State
+        
+        sm = StateMachine()
+        seen = []
+        
+        def failing(transition):
+            raise ValueError("listener bug")
+        
+        def record(transition):
+            seen.append(transition.to_state)
+        
+        sm.add_listener(failing)
+        sm.add_listener(record)
+        sm.transition(State.PLANNING, "Matching command")
+        
+        sm.remove_listener(record)
+        sm.remove_listener(record)  # Unknown listeners are ignored
+        sm.transition(State.EXECUTING, "Permission granted")
+        
+        assert seen == [State.PLANNING]
+    
+    def test_execution_error_becomes_failed_result(self):
+        """An executor exception is reported as a failed result and the machine idles."""
+        from core.orchestrator import Orchestrator
+        from core.state_machine import State
+        
+        orchestrator = Orchestrator()
+        orchestrator._executor = Mock()
+        orchestrator._executor.execute.side_effect = RuntimeError("boom")
+        seen = []
+        orchestrator.on_result(seen.append)
+        
+        output = orchestrator.process_text_directly("what time is it")
+        
+        assert output == "Error: boom"
+        assert orchestrator.state is State.IDLE
+        assert not seen[-1].success and seen[-1].error == "boom"
+    
+    def test_llm_error_routed_through_handler(self):
+        """A planner exception goes through _handle_error and the machine idles."""
+        from core.orchestrator_unified import Phase2Orchestrator, Phase2Config
+        from core.state_machine import State
+        
+        orchestrator = Phase2Orchestrator(Phase2Config(mode="llm"))
+        orchestrator._llm_planner = Mock()
+        orchestrator._llm_planner.plan.side_effect = RuntimeError("planner down")
+        seen = []
+        orchestrator.on_result(seen.append)
+        
+        output = orchestrator.process_text_directly("do things")
+        
+        assert output == seen[-1].error
+        assert seen[-1].command_id == "error"
+        assert orchestrator.state is State.IDLE
+
+
+class TestToolPlanExecution:
+    """Test multi-tool plan execution in the Phase 2 orchestrator."""
+    
+    @staticmethod
+    def run_plan(tool_results):
+        from core.orchestrator_unified import Phase2Orchestrator, Phase2Config
+        
+        orchestrator = Phase2Orchestrator(Phase2Config(mode="llm"))
+        calls = [Mock(tool_name=name, arguments={}) for name, _ in tool_results]
+        orchestrator._llm_planner = Mock()
+        orchestrator._llm_planner.plan.return_value = Mock(
+            is_valid=True, requires_tools=True, tool_calls=calls
+        )
+        outcomes = iter(
+            Mock(success=ok, output=f"{name} done", error=f"{name} broke", tool_name=name)
+            for name, ok in tool_results
+        )
+        executed = []
+        
+        def execute(tool_call):
+            executed.append(tool_call.tool_name)
+            return next(outcomes)
+        
+        orchestrator._execute_tool_call = execute
+        seen = []
+        orchestrator.on_result(seen.append)
+        return orchestrator.process_text_directly("do things"), executed, seen[-1]
+    
+    def test_all_succeed(self):
+        """Outputs are joined and every tool is named in the result."""
+        output, executed, result = self.run_plan([("a", True), ("b", True)])
+        
+        assert output == "a done\nb done"
+        assert executed == ["a", "b"]
+        assert result.command_id == "a,b"
+    
+    def test_stops_at_first_failure(self):
+        """Execution stops at the first failing tool, which is reported."""
+        output, executed, result = self.run_plan([("a", True), ("b", False), ("c", True)])
+        
+        assert output == "Error: b broke"
+        assert executed == ["a", "b"]
+        assert result.command_id == "b" and not result.success
+    
+    def test_memory_shares_joined_output(self):
+        """Phase 3 records the joined output itself as the assistant turn."""
+        from core.orchestrator_unified import Phase3Orchestrator, Phase3Config
+        
+        orchestrator = Phase3Orchestrator(Phase3Config(mode="llm"))
+        orchestrator._memory = Mock()
+        orchestrator._llm_planner = Mock()
+        orchestrator._llm_planner.plan.return_value = Mock(
+            is_valid=True, requires_tools=True,
+            tool_calls=[Mock(tool_name=name, arguments={}, independent=False) for name in "ab"]
+        )
+        orchestrator._execute_tool_call = lambda call: Mock(success=True, output=f"{call.tool_name} done")
+        
+        output = orchestrator.process_text_directly("do things")
+        
+        assert output == "a done\nb done"
+        call = orchestrator._memory.add_tool_turns.call_args
+        assert call.kwargs["response"] is output
+        assert [name for name, _, _ in call.args[0]] == ["a", "b"]
+    
+    def test_independent_read_tools_overlap(self):
+        """Consecutive independent READ tools run concurrently, results in plan order."""
+        import threading
+        from core.orchestrator_unified import Phase2Orchestrator, Phase2Config
+        
+        orchestrator = Phase2Orchestrator(Phase2Config(mode="llm"))
+        names = ["get_current_time", "get_current_date"]
+        orchestrator._llm_planner = Mock()
+        orchestrator._llm_planner.plan.return_value = Mock(
+            is_valid=True, requires_tools=True,
+            tool_calls=[Mock(tool_name=name, arguments={}, independent=True) for name in names]
+        )
+        both_running = threading.Barrier(2, timeout=5)
+        
+        def execute(tool_call):
+            both_running.wait()  # Deadlocks (and times out) if run one at a time
+            return Mock(success=True, output=tool_call.tool_name)
+        
+        orchestrator._execute_tool_call = execute
+        
+        assert orchestrator.process_text_directly("time and date") == "get_current_time\nget_current_date"
+    
+    def test_side_effecting_tools_run_alone(self):
+        """Dependent calls and non-READ tools never join a parallel run."""
+        from core.orchestrator_unified import Phase2Orchestrator
+        
+        orchestrator = Phase2Orchestrator()
+        
+        assert orchestrator._is_parallel_safe(Mock(tool_name="read_file", independent=True))
+        assert not orchestrator._is_parallel_safe(Mock(tool_name="read_file", independent=False))
+        assert not orchestrator._is_parallel_safe(Mock(tool_name="open_application", independent=True))
+        assert not orchestrator._is_parallel_safe(Mock(tool_name="no_such_tool", independent=True))
+    
+    def test_multimodal_schemas_shared_executors_bound(self):
+        """Multimodal tool schemas are built once; each orchestrator binds its own executors."""
+        from core.orchestrator_unified import Phase4Orchestrator
+        
+        first, second = Phase4Orchestrator(), Phase4Orchestrator()
+        for orchestrator in (first, second):
+            orchestrator._screen_capture = Mock()
+            orchestrator._event_manager = Mock()
+            orchestrator._register_multimodal_tools()
+        
+        a = first.tool_registry.get("take_screenshot")
+        b = second.tool_registry.get("take_screenshot")
+        
+        assert a.schema is b.schema
+        assert a.executor == first._execute_screenshot
+        assert b.executor == second._execute_screenshot
+        assert first.tool_registry.get("list_scheduled_tasks") is not None
+        assert first.tool_registry.get("capture_camera") is None
+    
+    def test_list_tasks_output(self):
+        """Scheduled tasks are listed one per line, with N/A for no next run."""
+        from datetime import datetime
+        from core.orchestrator_unified import Phase4Orchestrator
+        
+        at = datetime(2026, 1, 1, 9, 30)
+        tasks = [Mock(id=str(i), next_run=run) for i, run in enumerate([at, None, at])]
+        for i, t in enumerate(tasks):
+            t.name = f"task{i}"
+            t.state.name = "PENDING"
+        orchestrator = Phase4Orchestrator()
+        orchestrator._event_manager = Mock(list_tasks=Mock(return_value=tasks))
+        
+        assert orchestrator._execute_list_tasks({}).splitlines() == [
+            "Scheduled tasks:",
+            "  - task0 (0): PENDING, next: 09:30:00",
+            "  - task1 (1): PENDING, next: N/A",
+            "  - task2 (2): PENDING, next: 09:30:00",
+        ]
+
+
+class TestLazySubsystems:
+    """Test on-demand construction of orchestrator subsystems."""
+    
+    def test_text_path_skips_audio_and_stt(self):
+        """Text processing only builds the command and permission layers."""
+        from core.orchestrator import Orchestrator, OrchestratorConfig
+        
+        orchestrator = Orchestrator(OrchestratorConfig(preload_stt=False))
+        orchestrator.initialize()
+        assert orchestrator._command_registry is not None  # Loaded for get_status()
+        assert orchestrator._permission_checker is None
+        
+        output = orchestrator.process_text_directly("what time is it")
+        
+        assert "time" in output.lower()
+        assert orchestrator._permission_checker is not None
+        assert orchestrator._mic_capture is None
+        assert orchestrator._stt_engine is None
+    
+    def test_infra_submodules_imported_on_access(self):
+        """Importing infra loads no submodule until one of its names is used."""
+        import subprocess
+        import sys
+        from pathlib import Path
+        
+        code = (
+            "import sys, infra\n"
+            "assert 'infra.service_bus' not in sys.modules\n"
+            "assert 'infra.database' not in sys.modules\n"
+            "infra.get_logger\n"
+            "assert 'infra.service_bus' not in sys.modules\n"
+            "assert set(infra.__all__) <= set(dir(infra))\n"
+            "from infra import DatabaseManager, SCHEMA_VERSION\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(Path(__file__).parent.parent), capture_output=True, text=True
+        )
+        
+        assert result.returncode == 0, result.stderr
+        
+        import infra
+        with pytest.raises(AttributeError):
+            infra.NoSuchThing
+    
+    def test_stt_preloaded_on_initialize(self):
+        """initialize() loads the STT model in the background; stop_listening waits for it."""
+        from core.orchestrator import Orchestrator
+        
+        engine = Mock(is_loaded=False)
+        orchestrator = Orchestrator()
+        orchestrator._stt_engine = engine
+        orchestrator.initialize()
+        orchestrator._stt_load_future.result(timeout=5)
+        
+        engine.load.assert_called_once()
+        
+        orchestrator._wait_for_stt_preload()
+        assert orchestrator._stt_load_future is None
+    
+    def test_failed_preload_surfaces_on_wait(self):
+        """A preload error is raised where the model is first needed."""
+        from core.orchestrator import Orchestrator
+        
+        engine = Mock(is_loaded=False)
+        engine.load.side_effect = RuntimeError("no model")
+        orchestrator = Orchestrator()
+        orchestrator._stt_engine = engine
+        orchestrator.initialize()
+        
+        with pytest.raises(RuntimeError, match="no model"):
+            orchestrator._wait_for_stt_preload()
+        orchestrator._wait_for_stt_preload()  # Later calls fall through to a foreground load
+    
+    def test_command_summarised_in_one_record(self, caplog):
+        """A command logs one INFO summary; the intermediate steps are DEBUG."""
+        import logging
+        from core.orchestrator import Orchestrator
+        
+        orchestrator = Orchestrator()
+        orchestrator.command_registry, orchestrator.permission_checker  # Load up front
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="jarvis.orchestrator"):
+            orchestrator.process_text_directly("what time is it")
+        
+        records = [r for r in caplog.records if r.name == "jarvis.orchestrator"]
+        summaries = [r for r in records if r.levelno >= logging.INFO]
+        debug_messages = [r.getMessage() for r in records if r.levelno == logging.DEBUG]
+        
+        assert "Processing text: 'what time is it'" in debug_messages
+        assert any(m.startswith("Command matched: ") for m in debug_messages)
+        assert len(summaries) == 1
+        trace = summaries[0].command_trace
+        assert trace["text"] == "what time is it"
+        assert trace["matched"] and trace["permission_ok"] and trace["success"]
+    
+    def test_unmatched_command_summary(self, caplog):
+        """An unmatched command is reported once, with its input."""
+        import logging
+        from core.orchestrator import Orchestrator
+        
+        orchestrator = Orchestrator()
+        orchestrator.command_registry  # Load up front
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="jarvis.orchestrator"):
+            orchestrator.process_text_directly("flibber the jabberwock")
+        
+        records = [r for r in caplog.records if r.name == "jarvis.orchestrator"]
+        assert len(records) == 1
+        assert records[0].levelno == logging.ERROR
+        assert records[0].command_trace["matched"] is False
+    
+    def test_status_reports_cached_command_count(self):
+        """get_status() reports the count taken when the registry loaded."""
+        from core.orchestrator import Orchestrator, OrchestratorConfig
+        
+        orchestrator = Orchestrator(OrchestratorConfig(preload_stt=False))
+        assert orchestrator.get_status().commands_loaded == 0
+        
+        orchestrator.initialize()
+        registry = orchestrator._command_registry
+        assert len(registry) > 0
+        assert orchestrator.get_status().commands_loaded == len(registry)
+        
+        registry._commands.popitem()
+        orchestrator.refresh_command_count()
+        assert orchestrator.get_status().commands_loaded == len(registry)
+    
+    def test_status_snapshot_layers_phase_fields(self):
+        """Each phase fills its own status fields on one frozen snapshot."""
+        import dataclasses
+        from core.orchestrator import OrchestratorStatus
+        from core.orchestrator_unified import Phase3Orchestrator, Phase3Config
+        
+        status = Phase3Orchestrator(Phase3Config(mode="llm")).get_status()
+        
+        assert isinstance(status, OrchestratorStatus)
+        assert status.mode == "llm" and status.state == "IDLE"
+        assert status.scheduled_tasks == 0  # Phase 4 field left at its default
+        assert dataclasses.asdict(status)["memory_turns"] == status.memory_turns
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            status.mode = "deterministic"
+    
+    def test_multiple_result_callbacks(self):
+        """Every registered callback receives events, in registration order."""
+        from core.orchestrator import Orchestrator
+        
+        orchestrator = Orchestrator()
+        seen = []
+        orchestrator.on_command(lambda command_id, args: seen.append(("command", command_id)))
+        orchestrator.on_result(lambda result: seen.append(("first", result.success)))
+        orchestrator.on_result(lambda result: seen.append(("second", result.success)))
+        
+        orchestrator.process_text_directly("what time is it")
+        
+        assert [kind for kind, _ in seen] == ["command", "first", "second"]
+    
+    def test_tool_registry_built_once_on_demand(self):
+        """Phase 2 tools load on first access and are then reused."""
+        from core.orchestrator_unified import Phase2Orchestrator, Phase2Config
+        
+        orchestrator = Phase2Orchestrator(Phase2Config(mode="deterministic"))
+        orchestrator.initialize()
+        assert orchestrator._tool_registry is None
+        
+        registry = orchestrator.tool_registry
+        
+        assert orchestrator.tool_registry is registry
+        assert "get_current_time" in orchestrator.get_available_tools()
+
+
+class TestOrchestratorDataclasses:
+    """Test slotted orchestrator value types."""
+    
+    def test_command_result_is_immutable(self):
+        """CommandResult instances cannot be modified after creation."""
+        from dataclasses import FrozenInstanceError
+        from core.orchestrator import CommandResult
+        
+        result = CommandResult(success=True, command_id="time", output="12:00")
+        
+        with pytest.raises(FrozenInstanceError):
+            result.output = "13:00"
+        assert not hasattr(result, "__dict__")
+    
+    def test_phase_configs_are_slotted(self):
+        """Phase configs keep their fields mutable but reject unknown ones."""
+        from core.orchestrator_unified import Phase4Config
+        
+        config = Phase4Config(mode="llm")
+        config.mode = "deterministic"
+        
+        assert config.mode == "deterministic"
+        with pytest.raises(AttributeError):
+            config.made_up_option = True
+    
+    def test_state_transition_is_slotted(self):
+        """Transitions carry no instance dict; the lazy reason still resolves once."""
+        from core.state_machine import StateTransition, State
+        
+        calls = []
+        transition = StateTransition(
+            State.IDLE, State.PLANNING, reason=lambda: calls.append(1) or "late", ts_ns=0
+        )
+        
+        assert not hasattr(transition, "__dict__")
+        assert transition.reason == transition.reason == "late"
+        assert calls == [1]
+        assert transition.metadata == {}
+    
+    def test_lazy_reason_not_built_at_info(self, caplog):
+        """Transitions log at DEBUG only, so INFO leaves a lazy reason unbuilt."""
+        import logging
+        from core.state_machine import StateMachine, State
+        
+        machine = StateMachine()
+        calls = []
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="jarvis.state"):
+            transition = machine.transition(State.PLANNING, lambda: calls.append(1) or "late")
+        
+        assert calls == []
+        assert not [r for r in caplog.records if "State transition" in r.getMessage()]
+        
+        with caplog.at_level(logging.DEBUG, logger="jarvis.state"):
+            machine.recover("boom")
+        assert any("ERROR → IDLE" in r.getMessage() for r in caplog.records)
+        assert transition.reason == "late"
+    
+    def test_state_transition_keeps_public_constructor(self):
+        """The documented (from, to, timestamp, reason, metadata) signature still works."""
+        from datetime import datetime
+        from core.state_machine import StateTransition, State
+        
+        when = datetime(2026, 1, 2, 3, 4, 5)
+        transition = StateTransition(
+            from_state=State.IDLE, to_state=State.LISTENING,
+            timestamp=when, reason="push-to-talk", metadata={"k": 1}
+        )
+        
+        assert transition.timestamp == when
+        assert transition.reason == "push-to-talk"
+        assert abs(transition.wall_seconds - when.timestamp()) < 1e-3
+        assert transition.metadata == {"k": 1}
+
+
+class TestToolSchemaCache:
+    """Test cached tool schemas and names."""
+    
+    def test_schemas_rebuilt_only_after_change(self):
+        """Schemas are reused until a tool is registered or removed."""
+        from tools.registry import create_default_tools
+        
+        registry = create_default_tools()
+        first = registry.get_schemas_for_llm()
+        second = registry.get_schemas_for_llm()
+        
+        assert first == second and first is not second
+        assert first[0] is second[0]
+        
+        registry.unregister(first[0]["function"]["name"])
+        
+        assert len(registry.get_schemas_for_llm()) == len(first) - 1
+    
+    def test_available_tools_track_registry(self):
+        """get_available_tools reflects registrations made after caching."""
+        from core.orchestrator_unified import Phase2Orchestrator
+        
+        orchestrator = Phase2Orchestrator()
+        names = orchestrator.get_available_tools()
+        
+        orchestrator.tool_registry.unregister(names[0])
+        
+        assert orchestrator.get_available_tools() == names[1:]
+    
+    def test_planner_schemas_pushed_only_when_tool_set_changes(self):
+        """Re-registering the same tools does not re-push planner schemas."""
+        from core.orchestrator_unified import Phase2Orchestrator
+        
+        orchestrator = Phase2Orchestrator()
+        orchestrator._llm_planner = Mock()
+        registry = orchestrator.tool_registry
+        
+        assert orchestrator._push_tool_schemas()
+        
+        registry.register(registry.get("get_current_time"))
+        assert not orchestrator._push_tool_schemas()
+        
+        registry.unregister("get_current_time")
+        assert orchestrator._push_tool_schemas()
+        assert orchestrator._llm_planner.set_tool_schemas.call_count == 2
+
+
+class TestConfigLoading:
+    """Test cached config.yaml loading."""
+    
+    def test_cached_config_is_isolated(self, tmp_path):
+        """Orchestrators parse once but never share a mutable config dict."""
+        from core.orchestrator import Orchestrator, OrchestratorConfig, _YAML_CACHE
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("stt:\n  confidence_threshold: 0.6\n")
+        config = OrchestratorConfig(config_path=str(config_file))
+        
+        first = Orchestrator(config)
+        first._yaml_config["stt"]["confidence_threshold"] = 0.1
+        second = Orchestrator(config)
+        
+        assert str(config_file.resolve()) in _YAML_CACHE
+        assert second._yaml_config["stt"]["confidence_threshold"] == 0.6
+    
+    def test_edited_config_is_reparsed(self, tmp_path):
+        """A change in file size or mtime invalidates the cached parse."""
+        from core.orchestrator import Orchestrator, OrchestratorConfig
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("orchestrator:\n  max_retries: 2\n")
+        config = OrchestratorConfig(config_path=str(config_file))
+        Orchestrator(config)
+        
+        config_file.write_text("orchestrator:\n  max_retries: 10\n")
+        
+        assert Orchestrator(config)._yaml_config["orchestrator"]["max_retries"] == 10
+
+
+    def test_utterance_settings_resolved_once(self, tmp_path):
+        """STT threshold and minimum audio length are read at load time."""
+        from core.orchestrator import Orchestrator, OrchestratorConfig
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("stt:\n  confidence_threshold: 0.8\naudio:\n  min_seconds: 0.2\n")
+        configured = Orchestrator(OrchestratorConfig(config_path=str(config_file)))
+        fallback = Orchestrator(OrchestratorConfig(
+            config_path=str(tmp_path / "missing.yaml"), confidence_threshold=0.4
+        ))
+        
+        assert configured._confidence_threshold == 0.8
+        assert configured._min_audio_seconds == 0.2
+        assert fallback._confidence_threshold == 0.4
+        assert fallback._min_audio_seconds == 0.5
+    
+    def test_empty_sections_resolve_to_dicts(self, tmp_path):
+        """Sections left empty in YAML (null) are treated as {}."""
+        from core.orchestrator import Orchestrator, OrchestratorConfig
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("audio:\nstt:\n  model: tiny\n")
+        orchestrator = Orchestrator(OrchestratorConfig(config_path=str(config_file)))
+        
+        assert orchestrator._cfg.audio == {}
+        assert orchestrator._cfg.stt == {"model": "tiny"}
+        assert orchestrator._cfg.security == {}
+    
+    def test_json_sidecar_used_by_fresh_process(self, tmp_path):
+        """A matching JSON sidecar is loaded instead of parsing the YAML."""
+        from core.orchestrator import _YAML_CACHE, _json_cache_path, _load_yaml_cached
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("audio:\n  sample_rate: 16000\n")
+        _load_yaml_cached(config_file, json_cache=True)
+        sidecar = _json_cache_path(config_file)
+        assert sidecar.name == "config.yaml.cache.json"
+        
+        # Simulate a new process: empty in-memory cache, YAML parser unusable
+        _YAML_CACHE.clear()
+        with patch("core.orchestrator.load_yaml", side_effect=AssertionError("parsed")):
+            data = _load_yaml_cached(config_file, json_cache=True)
+        
+        assert data == {"audio": {"sample_rate": 16000}}
+    
+    def test_json_sidecar_ignored_after_edit(self, tmp_path):
+        """A sidecar written for an older version of the file is not used."""
+        from core.orchestrator import _YAML_CACHE, _load_yaml_cached
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("a: 1\n")
+        _load_yaml_cached(config_file, json_cache=True)
+        
+        config_file.write_text("a: 22\n")
+        _YAML_CACHE.clear()
+        
+        assert _load_yaml_cached(config_file, json_cache=True) == {"a": 22}
+    
+    def test_json_sidecar_skipped_for_non_json_data(self, tmp_path):
+        """YAML that JSON can't represent faithfully is never cached as JSON."""
+        from core.orchestrator import _json_cache_path, _load_yaml_cached
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("1: one\nwhen: 2024-01-01\n")
+        _load_yaml_cached(config_file, json_cache=True)
+        
+        assert not _json_cache_path(config_file).exists()
 
 
 # Marker for future integration tests
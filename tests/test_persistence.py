@@ -213,6 +213,46 @@ class TestTurnOperations:
         
         retrieved = temp_db.get_turns(conv.id)[0]
         assert retrieved.turn_id == "turn_unique123"
+    
+    def test_save_turns_batch(self, temp_db):
+        """save_turns writes a batch in one call, in order."""
+        conv = temp_db.get_or_create_conversation()
+        base = datetime.now(timezone.utc)
+        
+        with temp_db.transaction():
+            temp_db.save_turns(
+                Turn(conversation_id=conv.id, role="user", content=f"m{i}",
+                     timestamp=base + timedelta(seconds=i))
+                for i in range(3)
+            )
+        
+        assert [t.content for t in temp_db.get_turns(conv.id)] == ["m0", "m1", "m2"]
+    
+    def test_wal_journal_mode(self, temp_db):
+        """The database runs in write-ahead-log mode."""
+        mode = temp_db._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert mode == "wal"
+    
+    def test_conversation_memory_flush(self, temp_db):
+        """ConversationMemory appends its new turns to the store on flush."""
+        from memory.conversation import ConversationMemory
+        
+        memory = ConversationMemory(store=temp_db)
+        memory.add_user_turn("what time is it")
+        memory.add_tool_turn("get_current_time", {}, "12:00")
+        memory.add_system_turn("not persisted")
+        
+        assert memory.flush() == 2
+        assert memory.flush() == 0
+        
+        memory.add_assistant_turn("It is noon")
+        memory.flush()
+        
+        turns = temp_db.get_turns(memory.conversation_id)
+        assert [t.role for t in turns] == ["user", "assistant", "assistant"]
+        assert turns[1].meta == {"tool_name": "get_current_time"}
+        assert turns[2].content == "It is noon"
 
 
 class TestMemoryOperations:
@@ -13,6 +13,7 @@ Tests cover:
 
 import pytest
 from datetime import datetime, timezone
+import logging
 from pathlib import Path
 import sys
 
@@ -22,7 +23,7 @@ from core.degradation import (
     FailureBudget, DegradationPolicy, DegradationStrategy,
     DegradationManager, classify_exception
 )
-from core.errors import JARVISError, ErrorCategory
+from core.errors import JARVISError, ErrorCategory, ErrorHandler, RetryPolicy
 from tools.registry import PermissionLevel
 from infra.health import HealthMonitor, HealthStatus, ComponentHealth
 
@@ -81,6 +82,18 @@ class TestFailureBudget:
         assert budget.is_dependency_skipped(["read_config"])
         assert not budget.is_dependency_skipped(["write_file"])
     
+    def test_skipped_tools_isolated_per_budget(self):
+        """Skips in one budget do not leak into another."""
+        first = FailureBudget()
+        second = FailureBudget()
+        
+        first.record_skip("read_config")
+        second.record_skip("get_weather")
+        
+        assert first.is_dependency_skipped(["get_weather", "read_config"])
+        assert not first.is_dependency_skipped(["get_weather", "never_registered"])
+        assert second.get_stats()["skipped_tools"] == ["get_weather"]
+    
     def test_reset_clears_all(self):
         """Reset clears all failure tracking."""
         budget = FailureBudget()
@@ -149,6 +162,30 @@ class TestDegradationManager:
         assert policy.strategy == DegradationStrategy.FAIL_FAST
         assert policy.is_critical
     
+    def test_default_policy_reused(self):
+        """Default policies are built once per tool and level."""
+        manager = DegradationManager()
+        
+        first = manager.get_policy("get_time", PermissionLevel.READ)
+        second = manager.get_policy("get_time", PermissionLevel.READ)
+        
+        assert first is second
+        assert first.tool_name == "get_time"
+        assert manager.get_policy("get_time", PermissionLevel.WRITE) is not first
+    
+    def test_explicit_policy_overrides_cached_default(self):
+        """set_policy takes precedence over an already generated default."""
+        manager = DegradationManager()
+        manager.get_policy("read_config", PermissionLevel.READ)
+        
+        manager.set_policy(DegradationPolicy(
+            tool_name="read_config",
+            strategy=DegradationStrategy.SKIP,
+        ))
+        
+        policy = manager.get_policy("read_config", PermissionLevel.READ)
+        assert policy.strategy == DegradationStrategy.SKIP
+    
     def test_should_skip_respects_budget(self):
         """should_skip respects failure budget."""
         manager = DegradationManager()
@@ -232,6 +269,95 @@ class TestExceptionClassification:
         error = classify_exception(RuntimeError("something broke"), "my_tool")
         
         assert error.category == ErrorCategory.TOOL_FAILURE
+    
+    def test_subclass_uses_priority_order(self):
+        """Subclasses resolve like an isinstance chain, not by MRO order."""
+        class FlakyRead(ValueError, OSError):
+            pass
+        
+        class ReadTimedOut(TimeoutError):
+            pass
+        
+        assert classify_exception(FlakyRead()).category == ErrorCategory.NETWORK_ERROR
+        assert classify_exception(ReadTimedOut()).category == ErrorCategory.TIMEOUT_ERROR
+        assert classify_exception(KeyError("k")).category == ErrorCategory.TOOL_FAILURE
+    
+    def test_stack_trace_formatted_lazily(self):
+        """Tracebacks are only formatted when stack_trace is read."""
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as e:
+            error = classify_exception(e)
+        
+        assert error._stack_trace is None
+        assert "RuntimeError: boom" in error.stack_trace
+        assert error.stack_trace is error.stack_trace  # Formatted once
+    
+    def test_handler_skips_trace_without_debug(self):
+        """ErrorHandler does not format tracebacks unless DEBUG is enabled."""
+        logger = logging.getLogger("jarvis.errors")
+        previous = logger.level
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as e:
+            error = classify_exception(e)
+        
+        try:
+            logger.setLevel(logging.INFO)
+            ErrorHandler().handle(error)
+        finally:
+            logger.setLevel(previous)
+        
+        assert error._stack_trace is None
+
+
+class TestRetryPolicy:
+    """Tests for per-category retry tables."""
+    
+    def test_tables_match_category_maps(self):
+        """Indexed lookups agree with MAX_RETRIES / RETRY_DELAYS for every category."""
+        for category in ErrorCategory:
+            error = JARVISError(category=category, message="x")
+            max_retries = RetryPolicy.MAX_RETRIES.get(category, 0)
+            
+            if max_retries:
+                assert RetryPolicy.should_retry(error, max_retries - 1)
+            assert not RetryPolicy.should_retry(error, max_retries)
+            assert RetryPolicy.get_delay(error) == RetryPolicy.RETRY_DELAYS.get(category, 1.0)
+    
+    def test_categories_are_dense_indexes(self):
+        """ErrorCategory values count from 0 so they can index the tables."""
+        assert [int(c) for c in ErrorCategory] == list(range(len(ErrorCategory)))
+    
+    def test_unrecoverable_never_retried(self):
+        """Unrecoverable errors are not retried even with budget left."""
+        error = JARVISError(
+            category=ErrorCategory.NETWORK_ERROR, message="x", recoverable=False
+        )
+        
+        assert not RetryPolicy.should_retry(error, 0)
+
+
+class TestErrorHandler:
+    """Tests for ErrorHandler messages and logging."""
+    
+    def test_user_messages(self):
+        """Known categories map to canned text; USER_ERROR echoes the message."""
+        handler = ErrorHandler()
+        
+        timeout = handler.handle(JARVISError(ErrorCategory.TIMEOUT_ERROR, "slow"))
+        user = handler.handle(JARVISError(ErrorCategory.USER_ERROR, "Say a city name."))
+        
+        assert timeout == "That took too long. Please try again."
+        assert user == "Say a city name."
+    
+    def test_log_level_by_category(self, caplog):
+        """Errors are logged at the level mapped for their category."""
+        with caplog.at_level(logging.DEBUG, logger="jarvis.errors"):
+            ErrorHandler().handle(JARVISError(ErrorCategory.SYSTEM_ERROR, "disk"))
+        
+        assert caplog.records[0].levelno == logging.CRITICAL
+        assert caplog.records[0].getMessage() == "SYSTEM_ERROR: disk"
 
 
 class TestHealthMonitor:
@@ -19,7 +19,8 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 import logging
-import yaml
+
+from infra.yaml_loader import load_yaml
 
 from .registry import PermissionLevel
 
@@ -166,7 +167,7 @@ class ToolAuthority:
         
         try:
             with open(path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = load_yaml(f)
             
             # Load default grants
             for grant_def in config.get("default_grants", []):
@@ -186,6 +186,7 @@ class ToolExecutor:
         - All decisions logged with turn_id
         """
         start_time = datetime.now(timezone.utc)
+        self._logger.debug("Executing tool: %s", tool_name)
         
         # Get tool
         tool = self.registry.get(tool_name)
@@ -13,10 +13,11 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 import json
 import logging
-import yaml
 
 from pydantic import BaseModel, Field, ValidationError
 
+from infra.yaml_loader import load_yaml
+
 
 class PermissionLevel(str, Enum):
     """Permission levels for tools."""
@@ -196,6 +197,16 @@ class ToolRegistry:
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
         self._logger = logging.getLogger("jarvis.tools.registry")
+        
+        # Bumped on every register/unregister; derived views are cached per version
+        self._version = 0
+        self._schemas_cache: Optional[List[Dict]] = None
+        self._schemas_version = -1
+    
+    @property
+    def version(self) -> int:
+        """Revision counter, incremented whenever the set of tools changes."""
+        return self._version
     
     def register(self, tool: Tool) -> None:
         """Register a tool."""
@@ -203,12 +214,14 @@ class ToolRegistry:
             self._logger.warning(f"Overwriting existing tool: {tool.name}")
         
         self._tools[tool.name] = tool
+        self._version += 1
         self._logger.info(f"Registered tool: {tool.name} ({tool.permission.value})")
     
     def unregister(self, name: str) -> bool:
         """Unregister a tool."""
         if name in self._tools:
             del self._tools[name]
+            self._version += 1
             return True
         return False
     
@@ -229,11 +242,19 @@ class ToolRegistry:
         return [t for t in self._tools.values() if t.permission == permission]
     
     def get_schemas_for_llm(self) -> List[Dict]:
-        """Get all tool schemas in OpenAI function format."""
-        return [
-            tool.schema.to_openai_function(tool.name, tool.description)
-            for tool in self._tools.values()
-        ]
+        """
+        Get all tool schemas in OpenAI function format.
+        
+        Schemas are rebuilt only after the registry changes; the returned
+        list is a fresh copy, but the schema dicts are shared.
+        """
+        if self._schemas_version != self._version:
+            self._schemas_cache = [
+                tool.schema.to_openai_function(tool.name, tool.description)
+                for tool in self._tools.values()
+            ]
+            self._schemas_version = self._version
+        return list(self._schemas_cache)
     
     def validate_tool_call(
         self,
@@ -257,7 +278,7 @@ class ToolRegistry:
         Returns number of tools loaded.
         """
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         
         count = 0
         for tool_data in data.get('tools', []):